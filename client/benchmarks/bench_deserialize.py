@@ -0,0 +1,69 @@
+"""Seconds to deserialize the JSON of item lists and changes.
+
+The type-string dispatch of `ApiClient.__deserialize`, which loads the
+decoded JSON then builds the models value by value with `from_dict`, is
+compared with the validators compiled once per response type by
+`ApiClient.type_adapter`, which `ApiClient.deserialize` uses, given the
+decoded text and, as `ApiClient.response_deserialize` does for UTF-8
+responses, the bytes of the response. No server is needed:
+
+    poetry run python -m benchmarks.bench_deserialize --items 100000
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from ds_catalog import ApiClient
+
+
+def payloads(count: int) -> dict[str, bytes]:
+    """Return the JSON of responses of `count` items by response type"""
+    items = [{"id": id, "name": f"item{id}"} for id in range(count)]
+    changes = [
+        {"version": id + 1, "op": "set", "id": id, "item": item}
+        for id, item in enumerate(items)
+    ]
+    return {
+        "List[Item]": json.dumps(items).encode(),
+        "ItemChanges": json.dumps({"changes": changes, "version": count}).encode(),
+    }
+
+
+def measure(deserialize: Callable[[], Any], rounds: int) -> float:
+    """Return the best seconds of `rounds` calls of `deserialize`"""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        deserialize()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="bench_deserialize.py")
+    parser.add_argument("--items", help="Items per response", type=int, default=100000)
+    parser.add_argument("--rounds", help="Calls measured", type=int, default=5)
+    args = parser.parse_args()
+
+    client = ApiClient()
+    for response_type, content in payloads(args.items).items():
+        before = measure(
+            lambda: client._ApiClient__deserialize(  # type: ignore[attr-defined]
+                json.loads(content.decode()), response_type
+            ),
+            args.rounds,
+        )
+        text = measure(
+            lambda: client.deserialize(content.decode(), response_type), args.rounds
+        )
+        after = measure(lambda: client.deserialize(content, response_type), args.rounds)
+        print(
+            f"{response_type:<12} dispatch: {before:7.3f} s, "
+            f"compiled from text: {text:7.3f} s, "
+            f"from bytes: {after:7.3f} s, {before / after:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
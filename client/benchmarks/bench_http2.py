@@ -0,0 +1,96 @@
+"""Requests per second of concurrent item reads over HTTP/1.1 and HTTP/2.
+
+`items_read_item` is called concurrently by tasks sharing an
+`aio.ApiClient`, with `Configuration.http2` off and on, and by threads
+sharing a synchronous `ApiClient` over HTTP/1.1. Over HTTP/1.1 every call
+in flight takes a connection of the pool, of `--concurrency` connections;
+over HTTP/2 the calls of the tasks are multiplexed on one connection.
+The server has to accept HTTP/2, as Hypercorn does over
+cleartext; it ends a connection after 1000 requests by default, which
+fails the calls in flight on it. Run it from the server directory:
+
+    pip install hypercorn
+    echo "keep_alive_max_requests = 1000000" > hypercorn.toml
+    poetry run hypercorn app.main:app --bind 127.0.0.1:8000 --config hypercorn.toml
+
+then the benchmark from the client directory, with `httpx[http2]`:
+
+    poetry run python -m benchmarks.bench_http2 --host http://127.0.0.1:8000
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ds_catalog import ApiClient, Configuration, Item, ItemsApi, aio
+
+
+def configure(host: str, http2: bool, concurrency: int) -> Configuration:
+    configuration = Configuration(host=host)
+    configuration.http2 = http2
+    configuration.connection_pool_maxsize = concurrency
+    # Every call reads the item instead of revalidating a kept response
+    configuration.etag_cache_size = 0
+    return configuration
+
+
+def measure_threads(
+    configuration: Configuration, ids: list[int], concurrency: int
+) -> float:
+    """Return the requests per second of `concurrency` threads reading the
+    items `ids`
+    """
+    api = ItemsApi(ApiClient(configuration))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        for _ in executor.map(api.items_read_item, ids):
+            pass
+    return len(ids) / (time.perf_counter() - start)
+
+
+async def measure_tasks(
+    configuration: Configuration, ids: list[int], concurrency: int
+) -> float:
+    """Return the requests per second of `concurrency` tasks reading the
+    items `ids`
+    """
+    async with aio.ApiClient(configuration) as client:
+        api = aio.ItemsApi(client)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def read(id: int) -> None:
+            async with semaphore:
+                await api.items_read_item(id)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(read(id) for id in ids))
+        return len(ids) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="bench_http2.py")
+    parser.add_argument("--host", help="URL of the server", required=True)
+    parser.add_argument("--items", help="Items read", type=int, default=1000)
+    parser.add_argument("--requests", help="Requests per run", type=int, default=20000)
+    parser.add_argument(
+        "--concurrency", help="Calls in flight", type=int, nargs="+", default=[100]
+    )
+    args = parser.parse_args()
+
+    api = ItemsApi(ApiClient(Configuration(host=args.host)))
+    api.items_bulk_upsert([Item(id=id, name=f"item{id}") for id in range(args.items)])
+    ids = [id % args.items for id in range(args.requests)]
+
+    for concurrency in args.concurrency:
+        configuration = configure(args.host, False, concurrency)
+        rate = measure_threads(configuration, ids, concurrency)
+        print(f"{concurrency:>5} threads, HTTP/1.1: {rate:9,.1f} requests/s")
+        for http2 in (False, True):
+            configuration = configure(args.host, http2, concurrency)
+            protocol = "HTTP/2" if http2 else "HTTP/1.1"
+            rate = asyncio.run(measure_tasks(configuration, ids, concurrency))
+            print(f"{concurrency:>5} tasks,   {protocol:<8}: {rate:9,.1f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
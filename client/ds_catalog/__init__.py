@@ -33,8 +33,11 @@ from ds_catalog.exceptions import ApiAttributeError
 from ds_catalog.exceptions import ApiException
 
 # import models into sdk package
+from ds_catalog.models.bulk_item_result import BulkItemResult
 from ds_catalog.models.example_response import ExampleResponse
 from ds_catalog.models.http_validation_error import HTTPValidationError
 from ds_catalog.models.item import Item
+from ds_catalog.models.item_change import ItemChange
+from ds_catalog.models.item_changes import ItemChanges
 from ds_catalog.models.validation_error import ValidationError
 from ds_catalog.models.validation_error_loc_inner import ValidationErrorLocInner
@@ -0,0 +1,24 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+    Data Space Catalog
+
+    The service provides a REST API for managing and sharing catalog data. Interacts with connector services to obtain information about data products.
+
+    The version of the OpenAPI document: 0.1.1
+    Contact: all-hiro@hiro-microdatacenters.nl
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+
+# import apis into aio package
+from ds_catalog.aio.api import DefaultApi
+from ds_catalog.aio.api import ItemsApi
+
+# import ApiClient
+from ds_catalog.aio.api_client import ApiClient
@@ -0,0 +1,176 @@
+# coding: utf-8
+
+"""
+    Data Space Catalog
+
+    The service provides a REST API for managing and sharing catalog data. Interacts with connector services to obtain information about data products.
+
+    The version of the OpenAPI document: 0.1.1
+    Contact: all-hiro@hiro-microdatacenters.nl
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+
+from typing import Any, AsyncIterator, Dict, Optional, cast
+
+from ds_catalog import api_client
+from ds_catalog.aio import rest
+from ds_catalog.api_response import T as ApiResponseT
+from ds_catalog.exceptions import ApiException
+
+
+class ApiClient(api_client.ApiClient):
+    """Asynchronous API client for OpenAPI client library builds.
+
+    Requests are serialized and responses deserialized as by the
+    synchronous `ApiClient`, the calls are sent through one
+    `httpx.AsyncClient` whose keep-alive connections are shared by all the
+    calls made concurrently from an event loop. Close the client with
+    `await client.close()` or use it in an `async with` block.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    :param transport: transport sending the requests, a `RESTClientObject` of the
+        configuration by default. `ds_catalog.aio.asgi.ASGITransport` calls an ASGI
+        application in the process.
+    """
+
+    _default = None
+
+    def __init__(
+        self,
+        configuration=None,
+        header_name=None,
+        header_value=None,
+        cookie=None,
+        transport=None
+    ) -> None:
+        super().__init__(configuration, header_name, header_value, cookie)
+        # The synchronous `rest_client` is not used, it opens no connection
+        self.async_rest_client: rest.Transport
+        if transport is None:
+            self.async_rest_client = rest.RESTClientObject(self.configuration)
+        else:
+            self.async_rest_client = transport
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        await self.async_rest_client.close()
+
+    @classmethod
+    def get_default(cls):
+        """Return new instance of ApiClient.
+
+        This method returns newly created, based on default constructor,
+        object of ApiClient class or returns a copy of default
+        ApiClient.
+
+        :return: The ApiClient object.
+        """
+        if cls._default is None:
+            cls._default = ApiClient()
+        return cls._default
+
+    async def call_api(  # type: ignore[override]
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> rest.RESTResponse:
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :return: RESTResponse
+
+        GET responses with an ETag are cached by URL and request headers,
+        see `Configuration.etag_cache_size`. A cached response is revalidated
+        with If-None-Match and returned again if the server answers 304.
+        """
+
+        cacheable = (
+            method == 'GET'
+            and self.configuration.etag_cache_size > 0
+            and not any(
+                name.lower() == 'if-none-match' for name in (header_params or {})
+            )
+        )
+        # The cache of this client only holds asynchronous responses
+        cached: Optional[rest.RESTResponse] = None
+        if cacheable:
+            key = self.etag_cache_key(url, header_params)
+            cached = self.cached_response(key)
+            if cached is not None:
+                header_params = {
+                    **(header_params or {}),
+                    'If-None-Match': cached.getheader('ETag'),
+                }
+
+        try:
+            # perform request and return response
+            response_data = await self.async_rest_client.request(
+                method, url,
+                headers=header_params,
+                body=body, post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+
+        except ApiException as e:
+            raise e
+
+        if cached is not None and response_data.status == 304:
+            await response_data.read()
+            return cached
+        if cacheable:
+            if response_data.status == 200 and response_data.getheader('ETag'):
+                await response_data.read()
+                self.cache_response(key, response_data)
+            elif cached is not None:
+                self.cache_response(key, None)
+
+        return response_data
+
+    async def response_deserialize_stream(  # type: ignore[override]
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: Dict[str, ApiResponseT]
+    ) -> AsyncIterator[ApiResponseT]:
+        """Deserializes a newline-delimited JSON response line by line.
+        :param response_data: RESTResponse object which content is not
+            preloaded.
+        :param response_types_map: dict of response types.
+        :return: asynchronous iterator over deserialized objects
+        """
+
+        if not 200 <= response_data.status <= 299:
+            await response_data.read()
+            # raises an ApiException describing the error response
+            self.response_deserialize(cast(Any, response_data), response_types_map)
+
+        response_type = response_types_map.get(str(response_data.status), None)
+        if not response_type:
+            response_type = response_types_map.get(str(response_data.status)[0] + "XX", None)
+
+        async for line in response_data.iter_lines():
+            if line.strip():
+                yield self.deserialize(line, response_type)
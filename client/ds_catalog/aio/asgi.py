@@ -0,0 +1,75 @@
+# coding: utf-8
+
+"""
+    Data Space Catalog
+
+    The service provides a REST API for managing and sharing catalog data. Interacts with connector services to obtain information about data products.
+
+    The version of the OpenAPI document: 0.1.1
+    Contact: all-hiro@hiro-microdatacenters.nl
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+
+from ds_catalog.aio import rest
+from ds_catalog.asgi import ASGIApplication, encode_body
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError("ds_catalog.aio requires the httpx package") from e
+
+
+class ASGITransport:
+    """Sends the requests of an asyncio `ApiClient` to an ASGI application
+    in the process, without networking.
+
+    The application runs on the event loop of its callers. It is started
+    with its lifespan events by the first request and shut down by
+    `close()`, which the client calls when it is closed:
+
+        async with ApiClient(configuration, transport=ASGITransport(app)):
+            ...
+
+    :param app: ASGI application, such as the FastAPI `app.main:app`
+    :param lifespan: whether the application handles lifespan events
+    """
+
+    def __init__(self, app, lifespan: bool = True) -> None:
+        self.application = ASGIApplication(app, lifespan)
+
+    async def close(self) -> None:
+        await self.application.shutdown()
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> rest.RESTResponse:
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: not applied, the application is called
+                                 in the process
+        """
+        headers = dict(headers or {})
+        content = encode_body(headers, body, post_params)
+        status, response_headers, data = await self.application.request(
+            method, url, headers, content
+        )
+        return rest.RESTResponse(
+            httpx.Response(status, headers=response_headers, content=data)
+        )
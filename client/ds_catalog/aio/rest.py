@@ -0,0 +1,262 @@
+# coding: utf-8
+
+"""
+    Data Space Catalog
+
+    The service provides a REST API for managing and sharing catalog data. Interacts with connector services to obtain information about data products.
+
+    The version of the OpenAPI document: 0.1.1
+    Contact: all-hiro@hiro-microdatacenters.nl
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+
+import json
+import re
+from typing import Any, Dict, Optional, Protocol
+from urllib.parse import urlencode
+
+from ds_catalog.exceptions import ApiException, ApiValueError
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError("ds_catalog.aio requires the httpx package") from e
+
+RESTResponseType = httpx.Response
+
+
+class RESTResponse:
+
+    def __init__(self, resp: httpx.Response) -> None:
+        self.response = resp
+        self.status = resp.status_code
+        self.reason = resp.reason_phrase
+        self.data: Optional[bytes] = None
+
+    async def read(self):
+        if self.data is None:
+            self.data = await self.response.aread()
+        return self.data
+
+    async def iter_lines(self, chunk_size=65536):
+        """Yields the lines of the response body as they are received.
+
+        The body is not buffered in full, so the response must be requested
+        with `preload_content=False` and is released once exhausted.
+        """
+        pending = b""
+        try:
+            async for chunk in self.response.aiter_bytes(chunk_size):
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    yield line
+            if pending:
+                yield pending
+        finally:
+            await self.response.aclose()
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.response.headers.get(name, default)
+
+
+class Transport(Protocol):
+    """Sends the requests of an asyncio `ApiClient`, `RESTClientObject` by
+    default
+    """
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> RESTResponse:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class RESTClientObject:
+    """Sends the requests of all the calls through one `httpx.AsyncClient`.
+
+    Its keep-alive connections are shared by the concurrent calls, at most
+    `connection_pool_maxsize` of them are opened and the calls over the
+    limit wait for a free connection, so any number of calls can be in
+    flight at once. Over HTTP/2 the calls are multiplexed on one
+    connection per host.
+    """
+
+    def __init__(self, configuration) -> None:
+        verify = configuration.verify_ssl
+        if verify and configuration.ssl_ca_cert:
+            verify = configuration.ssl_ca_cert
+
+        cert = None
+        if configuration.cert_file:
+            cert = (configuration.cert_file, configuration.key_file)
+
+        limits = httpx.Limits(
+            max_connections=configuration.connection_pool_maxsize,
+            max_keepalive_connections=configuration.connection_pool_maxsize,
+        )
+
+        proxy = None
+        if configuration.proxy:
+            proxy = httpx.Proxy(
+                configuration.proxy, headers=configuration.proxy_headers
+            )
+
+        transport_args: Dict[str, Any] = {}
+        # urllib3 `Retry` objects have no equivalent, only connection
+        # attempts are retried
+        if isinstance(configuration.retries, int):
+            transport_args["retries"] = configuration.retries
+        if configuration.socket_options is not None:
+            transport_args["socket_options"] = configuration.socket_options
+
+        if configuration.http2:
+            transport_args["http2"] = True
+            # A cleartext server is sent HTTP/2 with prior knowledge, there
+            # is no TLS negotiation to select it
+            if configuration.host.startswith("http://"):
+                transport_args["http1"] = False
+
+        transport = httpx.AsyncHTTPTransport(
+            verify=verify,
+            cert=cert,
+            limits=limits,
+            proxy=proxy,
+            **transport_args,
+        )
+        # Waiting for a pooled connection is not limited
+        self.client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(None),
+        )
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in [
+            'GET',
+            'HEAD',
+            'DELETE',
+            'POST',
+            'PUT',
+            'PATCH',
+            'OPTIONS'
+        ]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or []
+        headers = headers or {}
+
+        timeout = httpx.Timeout(None)
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = httpx.Timeout(_request_timeout, pool=None)
+            elif (
+                    isinstance(_request_timeout, tuple)
+                    and len(_request_timeout) == 2
+                ):
+                timeout = httpx.Timeout(
+                    None,
+                    connect=_request_timeout[0],
+                    read=_request_timeout[1]
+                )
+
+        args: Dict[str, Any] = {}
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+
+            # no content type provided or payload is json
+            content_type = headers.get('Content-Type')
+            if (
+                not content_type
+                or re.search('json', content_type, re.IGNORECASE)
+            ):
+                if body is not None:
+                    args["content"] = json.dumps(body)
+            elif content_type == 'application/x-www-form-urlencoded':
+                args["content"] = urlencode(post_params)
+            elif content_type == 'multipart/form-data':
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by httpx will be
+                # overwritten.
+                del headers['Content-Type']
+                args["data"] = {
+                    k: v for k, v in post_params if not isinstance(v, tuple)
+                }
+                args["files"] = [
+                    (k, v) for k, v in post_params if isinstance(v, tuple)
+                ]
+            # Pass a `string` parameter directly in the body to support
+            # other content types than JSON when `body` argument is
+            # provided in serialized form.
+            elif isinstance(body, str) or isinstance(body, bytes):
+                args["content"] = body
+            elif headers['Content-Type'] == 'text/plain' and isinstance(body, bool):
+                args["content"] = "true" if body else "false"
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        request = self.client.build_request(
+            method,
+            url,
+            headers=headers,
+            timeout=timeout,
+            **args
+        )
+        try:
+            # The body is read by `RESTResponse.read` or streamed
+            r = await self.client.send(request, stream=True)
+        except httpx.TransportError as e:
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+
+        return RESTResponse(r)
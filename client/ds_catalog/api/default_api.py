@@ -14,7 +14,7 @@
 
 import warnings
 from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
 from ds_catalog.models.example_response import ExampleResponse
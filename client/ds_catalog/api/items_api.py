@@ -14,11 +14,16 @@
 
 import warnings
 from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
-from pydantic import StrictInt
+from pydantic import Field, StrictInt, StrictStr
+from typing import List, Optional, Union
+from typing_extensions import Annotated
+from ds_catalog.models.bulk_item_result import BulkItemResult
 from ds_catalog.models.item import Item
+from ds_catalog.models.item_changes import ItemChanges
+from ds_catalog.models.item_change import ItemChange
 
 from ds_catalog.api_client import ApiClient, RequestSerialized
 from ds_catalog.api_response import ApiResponse
@@ -39,9 +44,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_create(
+    def items_bulk_create(
         self,
-        item: Item,
+        items: List[Item],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -54,13 +59,13 @@ class ItemsApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> Item:
-        """Create an item
+    ) -> List[BulkItemResult]:
+        """Create items
 
-        Create a new item in the storage
+        Create new items in the storage, existing items are left untouched
 
-        :param item: (required)
-        :type item: Item
+        :param items: (required)
+        :type items: List[Item]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -83,8 +88,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_create_serialize(
-            item=item,
+        _param = self._items_bulk_create_serialize(
+            items=items,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -92,8 +97,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '201': "Item",
-            '422': "HTTPValidationError",
+            '200': "List[BulkItemResult]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -107,9 +111,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_create_with_http_info(
+    def items_bulk_create_with_http_info(
         self,
-        item: Item,
+        items: List[Item],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -122,13 +126,13 @@ class ItemsApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Item]:
-        """Create an item
+    ) -> ApiResponse[List[BulkItemResult]]:
+        """Create items
 
-        Create a new item in the storage
+        Create new items in the storage, existing items are left untouched
 
-        :param item: (required)
-        :type item: Item
+        :param items: (required)
+        :type items: List[Item]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -151,8 +155,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_create_serialize(
-            item=item,
+        _param = self._items_bulk_create_serialize(
+            items=items,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -160,8 +164,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '201': "Item",
-            '422': "HTTPValidationError",
+            '200': "List[BulkItemResult]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -175,9 +178,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_create_without_preload_content(
+    def items_bulk_create_without_preload_content(
         self,
-        item: Item,
+        items: List[Item],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -191,12 +194,12 @@ class ItemsApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Create an item
+        """Create items
 
-        Create a new item in the storage
+        Create new items in the storage, existing items are left untouched
 
-        :param item: (required)
-        :type item: Item
+        :param items: (required)
+        :type items: List[Item]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -219,8 +222,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_create_serialize(
-            item=item,
+        _param = self._items_bulk_create_serialize(
+            items=items,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -228,8 +231,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '201': "Item",
-            '422': "HTTPValidationError",
+            '200': "List[BulkItemResult]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -238,9 +240,9 @@ class ItemsApi:
         return response_data.response
 
 
-    def _items_create_serialize(
+    def _items_bulk_create_serialize(
         self,
-        item,
+        items,
         _request_auth,
         _content_type,
         _headers,
@@ -250,6 +252,7 @@ class ItemsApi:
         _host = None
 
         _collection_formats: Dict[str, str] = {
+            'items': '',
         }
 
         _path_params: Dict[str, str] = {}
@@ -264,8 +267,8 @@ class ItemsApi:
         # process the header parameters
         # process the form parameters
         # process the body parameter
-        if item is not None:
-            _body_params = item
+        if items is not None:
+            _body_params = items
 
 
         # set the HTTP header `Accept`
@@ -282,7 +285,8 @@ class ItemsApi:
             _default_content_type = (
                 self.api_client.select_header_content_type(
                     [
-                        'application/json'
+                        'application/json', 
+                        'application/x-ndjson'
                     ]
                 )
             )
@@ -295,7 +299,7 @@ class ItemsApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/item/',
+            resource_path='/item/bulk',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -312,9 +316,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_delete_item(
+    def items_bulk_delete(
         self,
-        id: StrictInt,
+        ids: List[StrictInt],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -327,13 +331,13 @@ class ItemsApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> None:
-        """Delete an item
+    ) -> List[BulkItemResult]:
+        """Delete items
 
-        Delete an item from the storage
+        Delete items with the given ids from the storage, whatever their versions. Bulk writes do not take If-Match, the last write wins.
 
-        :param id: (required)
-        :type id: int
+        :param ids: (required)
+        :type ids: List[int]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -356,8 +360,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_delete_item_serialize(
-            id=id,
+        _param = self._items_bulk_delete_serialize(
+            ids=ids,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -365,8 +369,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '204': None,
-            '422': "HTTPValidationError",
+            '200': "List[BulkItemResult]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -380,9 +383,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_delete_item_with_http_info(
+    def items_bulk_delete_with_http_info(
         self,
-        id: StrictInt,
+        ids: List[StrictInt],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -395,13 +398,13 @@ class ItemsApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[None]:
-        """Delete an item
+    ) -> ApiResponse[List[BulkItemResult]]:
+        """Delete items
 
-        Delete an item from the storage
+        Delete items with the given ids from the storage, whatever their versions. Bulk writes do not take If-Match, the last write wins.
 
-        :param id: (required)
-        :type id: int
+        :param ids: (required)
+        :type ids: List[int]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -424,8 +427,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_delete_item_serialize(
-            id=id,
+        _param = self._items_bulk_delete_serialize(
+            ids=ids,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -433,8 +436,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '204': None,
-            '422': "HTTPValidationError",
+            '200': "List[BulkItemResult]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -448,9 +450,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_delete_item_without_preload_content(
+    def items_bulk_delete_without_preload_content(
         self,
-        id: StrictInt,
+        ids: List[StrictInt],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -464,12 +466,12 @@ class ItemsApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Delete an item
+        """Delete items
 
-        Delete an item from the storage
+        Delete items with the given ids from the storage, whatever their versions. Bulk writes do not take If-Match, the last write wins.
 
-        :param id: (required)
-        :type id: int
+        :param ids: (required)
+        :type ids: List[int]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -492,8 +494,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_delete_item_serialize(
-            id=id,
+        _param = self._items_bulk_delete_serialize(
+            ids=ids,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -501,8 +503,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '204': None,
-            '422': "HTTPValidationError",
+            '200': "List[BulkItemResult]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -511,9 +512,9 @@ class ItemsApi:
         return response_data.response
 
 
-    def _items_delete_item_serialize(
+    def _items_bulk_delete_serialize(
         self,
-        id,
+        ids,
         _request_auth,
         _content_type,
         _headers,
@@ -523,6 +524,7 @@ class ItemsApi:
         _host = None
 
         _collection_formats: Dict[str, str] = {
+            'ids': '',
         }
 
         _path_params: Dict[str, str] = {}
@@ -533,12 +535,12 @@ class ItemsApi:
         _body_params: Optional[bytes] = None
 
         # process the path parameters
-        if id is not None:
-            _path_params['id'] = id
         # process the query parameters
         # process the header parameters
         # process the form parameters
         # process the body parameter
+        if ids is not None:
+            _body_params = ids
 
 
         # set the HTTP header `Accept`
@@ -548,6 +550,20 @@ class ItemsApi:
             ]
         )
 
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json', 
+                        'application/x-ndjson'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
 
         # authentication setting
         _auth_settings: List[str] = [
@@ -555,7 +571,7 @@ class ItemsApi:
 
         return self.api_client.param_serialize(
             method='DELETE',
-            resource_path='/item/{id}/',
+            resource_path='/item/bulk',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -572,8 +588,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_read_all(
+    def items_bulk_upsert(
         self,
+        items: List[Item],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -586,11 +603,13 @@ class ItemsApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> List[Item]:
-        """Read all items
+    ) -> List[BulkItemResult]:
+        """Create or update items
 
-        Read all items from the storage
+        Create new items and update existing items in the storage, whatever their versions. Bulk writes do not take If-Match, the last write wins.
 
+        :param items: (required)
+        :type items: List[Item]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -613,7 +632,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_read_all_serialize(
+        _param = self._items_bulk_upsert_serialize(
+            items=items,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -621,7 +641,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[Item]",
+            '200': "List[BulkItemResult]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -635,8 +655,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_read_all_with_http_info(
+    def items_bulk_upsert_with_http_info(
         self,
+        items: List[Item],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -649,11 +670,13 @@ class ItemsApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[List[Item]]:
-        """Read all items
+    ) -> ApiResponse[List[BulkItemResult]]:
+        """Create or update items
 
-        Read all items from the storage
+        Create new items and update existing items in the storage, whatever their versions. Bulk writes do not take If-Match, the last write wins.
 
+        :param items: (required)
+        :type items: List[Item]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -676,7 +699,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_read_all_serialize(
+        _param = self._items_bulk_upsert_serialize(
+            items=items,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -684,7 +708,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[Item]",
+            '200': "List[BulkItemResult]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -698,8 +722,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_read_all_without_preload_content(
+    def items_bulk_upsert_without_preload_content(
         self,
+        items: List[Item],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -713,10 +738,12 @@ class ItemsApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Read all items
+        """Create or update items
 
-        Read all items from the storage
+        Create new items and update existing items in the storage, whatever their versions. Bulk writes do not take If-Match, the last write wins.
 
+        :param items: (required)
+        :type items: List[Item]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -739,7 +766,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_read_all_serialize(
+        _param = self._items_bulk_upsert_serialize(
+            items=items,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -747,7 +775,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[Item]",
+            '200': "List[BulkItemResult]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -756,8 +784,9 @@ class ItemsApi:
         return response_data.response
 
 
-    def _items_read_all_serialize(
+    def _items_bulk_upsert_serialize(
         self,
+        items,
         _request_auth,
         _content_type,
         _headers,
@@ -767,6 +796,7 @@ class ItemsApi:
         _host = None
 
         _collection_formats: Dict[str, str] = {
+            'items': '',
         }
 
         _path_params: Dict[str, str] = {}
@@ -781,6 +811,8 @@ class ItemsApi:
         # process the header parameters
         # process the form parameters
         # process the body parameter
+        if items is not None:
+            _body_params = items
 
 
         # set the HTTP header `Accept`
@@ -790,14 +822,28 @@ class ItemsApi:
             ]
         )
 
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json', 
+                        'application/x-ndjson'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
 
         # authentication setting
         _auth_settings: List[str] = [
         ]
 
         return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/item/',
+            method='PUT',
+            resource_path='/item/bulk',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -814,9 +860,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_read_item(
+    def items_create(
         self,
-        id: StrictInt,
+        item: Item,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -830,12 +876,12 @@ class ItemsApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> Item:
-        """Read an item
+        """Create an item
 
-        Read item from the storage
+        Create a new item in the storage
 
-        :param id: (required)
-        :type id: int
+        :param item: (required)
+        :type item: Item
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -858,8 +904,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_read_item_serialize(
-            id=id,
+        _param = self._items_create_serialize(
+            item=item,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -867,7 +913,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Item",
+            '201': "Item",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -882,9 +928,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_read_item_with_http_info(
+    def items_create_with_http_info(
         self,
-        id: StrictInt,
+        item: Item,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -898,12 +944,12 @@ class ItemsApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> ApiResponse[Item]:
-        """Read an item
+        """Create an item
 
-        Read item from the storage
+        Create a new item in the storage
 
-        :param id: (required)
-        :type id: int
+        :param item: (required)
+        :type item: Item
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -926,8 +972,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_read_item_serialize(
-            id=id,
+        _param = self._items_create_serialize(
+            item=item,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -935,7 +981,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Item",
+            '201': "Item",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -950,9 +996,9 @@ class ItemsApi:
 
 
     @validate_call
-    def items_read_item_without_preload_content(
+    def items_create_without_preload_content(
         self,
-        id: StrictInt,
+        item: Item,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -966,12 +1012,12 @@ class ItemsApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Read an item
+        """Create an item
 
-        Read item from the storage
+        Create a new item in the storage
 
-        :param id: (required)
-        :type id: int
+        :param item: (required)
+        :type item: Item
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -994,8 +1040,8 @@ class ItemsApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._items_read_item_serialize(
-            id=id,
+        _param = self._items_create_serialize(
+            item=item,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1003,7 +1049,7 @@ class ItemsApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Item",
+            '201': "Item",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -1013,9 +1059,9 @@ class ItemsApi:
         return response_data.response
 
 
-    def _items_read_item_serialize(
+    def _items_create_serialize(
         self,
-        id,
+        item,
         _request_auth,
         _content_type,
         _headers,
@@ -1035,12 +1081,12 @@ class ItemsApi:
         _body_params: Optional[bytes] = None
 
         # process the path parameters
-        if id is not None:
-            _path_params['id'] = id
         # process the query parameters
         # process the header parameters
         # process the form parameters
         # process the body parameter
+        if item is not None:
+            _body_params = item
 
 
         # set the HTTP header `Accept`
@@ -1050,14 +1096,1874 @@ class ItemsApi:
             ]
         )
 
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
 
         # authentication setting
         _auth_settings: List[str] = [
         ]
 
         return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/item/{id}/',
+            method='POST',
+            resource_path='/item/',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def items_delete_item(
+        self,
+        id: StrictInt,
+        if_match: Annotated[Optional[StrictStr], Field(description="ETag of the item read before the change, the item is only changed if it still has this version")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> None:
+        """Delete an item
+
+        Delete an item from the storage
+
+        :param id: (required)
+        :type id: int
+        :param if_match: ETag of the item read before the change, the item is only changed if it still has this version
+        :type if_match: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_delete_item_serialize(
+            id=id,
+            if_match=if_match,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '204': None,
+            '412': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def items_delete_item_with_http_info(
+        self,
+        id: StrictInt,
+        if_match: Annotated[Optional[StrictStr], Field(description="ETag of the item read before the change, the item is only changed if it still has this version")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[None]:
+        """Delete an item
+
+        Delete an item from the storage
+
+        :param id: (required)
+        :type id: int
+        :param if_match: ETag of the item read before the change, the item is only changed if it still has this version
+        :type if_match: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_delete_item_serialize(
+            id=id,
+            if_match=if_match,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '204': None,
+            '412': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def items_delete_item_without_preload_content(
+        self,
+        id: StrictInt,
+        if_match: Annotated[Optional[StrictStr], Field(description="ETag of the item read before the change, the item is only changed if it still has this version")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Delete an item
+
+        Delete an item from the storage
+
+        :param id: (required)
+        :type id: int
+        :param if_match: ETag of the item read before the change, the item is only changed if it still has this version
+        :type if_match: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_delete_item_serialize(
+            id=id,
+            if_match=if_match,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '204': None,
+            '412': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _items_delete_item_serialize(
+        self,
+        id,
+        if_match,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[str, str] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        if id is not None:
+            _path_params['id'] = id
+        # process the query parameters
+        # process the header parameters
+        if if_match is not None:
+            _header_params['If-Match'] = if_match
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            [
+                'application/json'
+            ]
+        )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='DELETE',
+            resource_path='/item/{id}/',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def items_read_all(
+        self,
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        cursor: Optional[StrictStr] = None,
+        name: Annotated[Optional[StrictStr], Field(description="Exact name of the items")] = None,
+        name_prefix: Annotated[Optional[StrictStr], Field(description="Prefix of the item names, items are sorted by name")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[Item]:
+        """Read all items
+
+        Read all items or a page of items from the storage
+
+        :param limit:
+        :type limit: int
+        :param cursor:
+        :type cursor: str
+        :param name: Exact name of the items
+        :type name: str
+        :param name_prefix: Prefix of the item names, items are sorted by name
+        :type name_prefix: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_read_all_serialize(
+            limit=limit,
+            cursor=cursor,
+            name=name,
+            name_prefix=name_prefix,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[Item]",
+            '304': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def items_read_all_with_http_info(
+        self,
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        cursor: Optional[StrictStr] = None,
+        name: Annotated[Optional[StrictStr], Field(description="Exact name of the items")] = None,
+        name_prefix: Annotated[Optional[StrictStr], Field(description="Prefix of the item names, items are sorted by name")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[Item]]:
+        """Read all items
+
+        Read all items or a page of items from the storage
+
+        :param limit:
+        :type limit: int
+        :param cursor:
+        :type cursor: str
+        :param name: Exact name of the items
+        :type name: str
+        :param name_prefix: Prefix of the item names, items are sorted by name
+        :type name_prefix: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_read_all_serialize(
+            limit=limit,
+            cursor=cursor,
+            name=name,
+            name_prefix=name_prefix,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[Item]",
+            '304': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def items_read_all_without_preload_content(
+        self,
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        cursor: Optional[StrictStr] = None,
+        name: Annotated[Optional[StrictStr], Field(description="Exact name of the items")] = None,
+        name_prefix: Annotated[Optional[StrictStr], Field(description="Prefix of the item names, items are sorted by name")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Read all items
+
+        Read all items or a page of items from the storage
+
+        :param limit:
+        :type limit: int
+        :param cursor:
+        :type cursor: str
+        :param name: Exact name of the items
+        :type name: str
+        :param name_prefix: Prefix of the item names, items are sorted by name
+        :type name_prefix: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_read_all_serialize(
+            limit=limit,
+            cursor=cursor,
+            name=name,
+            name_prefix=name_prefix,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[Item]",
+            '304': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def items_read_all_pages(
+        self,
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        cursor: Optional[StrictStr] = None,
+        name: Annotated[Optional[StrictStr], Field(description="Exact name of the items")] = None,
+        name_prefix: Annotated[Optional[StrictStr], Field(description="Prefix of the item names, items are sorted by name")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> Iterator[List[Item]]:
+        """Read all items page by page
+
+        Follows the continuation token sent in the `X-Next-Cursor`
+        response header until the last page is reached. Accepts the same
+        parameters as `items_read_all`, `cursor` is the token of
+        the first page to read.
+        """ # noqa: E501
+        while True:
+            response = self.items_read_all_with_http_info(
+                limit=limit,
+                cursor=cursor,
+                name=name,
+                name_prefix=name_prefix,
+                _request_timeout=_request_timeout,
+                _request_auth=_request_auth,
+                _content_type=_content_type,
+                _headers=_headers,
+                _host_index=_host_index
+            )
+            yield response.data
+            cursor = next(
+                (
+                    value
+                    for name, value in (response.headers or {}).items()
+                    if name.lower() == 'X-Next-Cursor'.lower()
+                ),
+                None
+            )
+            if not cursor:
+                return
+
+
+    def items_read_all_iter(
+        self,
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        cursor: Optional[StrictStr] = None,
+        name: Annotated[Optional[StrictStr], Field(description="Exact name of the items")] = None,
+        name_prefix: Annotated[Optional[StrictStr], Field(description="Prefix of the item names, items are sorted by name")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> Iterator[Item]:
+        """Read all items one by one
+
+        Lazily reads the pages returned by `items_read_all_pages`.
+        """ # noqa: E501
+        for page in self.items_read_all_pages(
+            limit=limit,
+            cursor=cursor,
+            name=name,
+            name_prefix=name_prefix,
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        ):
+            yield from page
+
+
+    def _items_read_all_serialize(
+        self,
+        limit,
+        cursor,
+        name,
+        name_prefix,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[str, str] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if limit is not None:
+            
+            _query_params.append(('limit', limit))
+            
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
+        if name is not None:
+            
+            _query_params.append(('name', name))
+            
+        if name_prefix is not None:
+            
+            _query_params.append(('name_prefix', name_prefix))
+            
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            [
+                'application/json'
+            ]
+        )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/item/',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def items_read_changes(
+        self,
+        since: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Catalog version to read the changes after, only the current version is returned if omitted")] = None,
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        wait: Annotated[Optional[Union[Annotated[float, Field(le=60.0, strict=True, ge=0.0)], Annotated[int, Field(le=60, strict=True, ge=0)]]], Field(description="Seconds to wait for a change if there is none yet")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ItemChanges:
+        """Read changes of items
+
+        Read the changes made after a catalog version, in order.  Waits up to `wait` seconds for a change if there is none, so that readers follow the catalog with one pending request. The version of the response is the `since` of the next request.
+
+        :param since: Catalog version to read the changes after, only the current version is returned if omitted
+        :type since: int
+        :param limit:
+        :type limit: int
+        :param wait: Seconds to wait for a change if there is none yet
+        :type wait: float
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_read_changes_serialize(
+            since=since,
+            limit=limit,
+            wait=wait,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ItemChanges",
+            '410': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def items_read_changes_with_http_info(
+        self,
+        since: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Catalog version to read the changes after, only the current version is returned if omitted")] = None,
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        wait: Annotated[Optional[Union[Annotated[float, Field(le=60.0, strict=True, ge=0.0)], Annotated[int, Field(le=60, strict=True, ge=0)]]], Field(description="Seconds to wait for a change if there is none yet")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[ItemChanges]:
+        """Read changes of items
+
+        Read the changes made after a catalog version, in order.  Waits up to `wait` seconds for a change if there is none, so that readers follow the catalog with one pending request. The version of the response is the `since` of the next request.
+
+        :param since: Catalog version to read the changes after, only the current version is returned if omitted
+        :type since: int
+        :param limit:
+        :type limit: int
+        :param wait: Seconds to wait for a change if there is none yet
+        :type wait: float
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_read_changes_serialize(
+            since=since,
+            limit=limit,
+            wait=wait,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ItemChanges",
+            '410': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def items_read_changes_without_preload_content(
+        self,
+        since: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Catalog version to read the changes after, only the current version is returned if omitted")] = None,
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        wait: Annotated[Optional[Union[Annotated[float, Field(le=60.0, strict=True, ge=0.0)], Annotated[int, Field(le=60, strict=True, ge=0)]]], Field(description="Seconds to wait for a change if there is none yet")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Read changes of items
+
+        Read the changes made after a catalog version, in order.  Waits up to `wait` seconds for a change if there is none, so that readers follow the catalog with one pending request. The version of the response is the `since` of the next request.
+
+        :param since: Catalog version to read the changes after, only the current version is returned if omitted
+        :type since: int
+        :param limit:
+        :type limit: int
+        :param wait: Seconds to wait for a change if there is none yet
+        :type wait: float
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_read_changes_serialize(
+            since=since,
+            limit=limit,
+            wait=wait,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ItemChanges",
+            '410': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def items_read_changes_iter(
+        self,
+        since: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Catalog version to read the changes after, only the current version is returned if omitted")] = None,
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        wait: Annotated[Optional[Union[Annotated[float, Field(le=60.0, strict=True, ge=0.0)], Annotated[int, Field(le=60, strict=True, ge=0)]]], Field(description="Seconds to wait for a change if there is none yet")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> Iterator[ItemChange]:
+        """Read changes of items as they are made
+
+        Reads the changes after `since`, or after the current
+        version if it is None, then waits for new changes without end,
+        30 seconds per request unless `wait` is set. A reader
+        resumes where it stopped by passing the version of the last change
+        it processed as `since`. An `ApiException` with status 410
+        means that the changes are no longer kept, the reader has to read
+        all items again.
+        """ # noqa: E501
+        if wait is None:
+            wait = 30
+        while True:
+            response = self.items_read_changes(
+                since=since,
+                limit=limit,
+                wait=wait,
+                _request_timeout=_request_timeout,
+                _request_auth=_request_auth,
+                _content_type=_content_type,
+                _headers=_headers,
+                _host_index=_host_index
+            )
+            yield from response.changes
+            since = response.version
+
+
+    def _items_read_changes_serialize(
+        self,
+        since,
+        limit,
+        wait,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[str, str] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if since is not None:
+            
+            _query_params.append(('since', since))
+            
+        if limit is not None:
+            
+            _query_params.append(('limit', limit))
+            
+        if wait is not None:
+            
+            _query_params.append(('wait', wait))
+            
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            [
+                'application/json'
+            ]
+        )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/item/changes',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def items_read_item(
+        self,
+        id: StrictInt,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> Item:
+        """Read an item
+
+        Read item from the storage
+
+        :param id: (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_read_item_serialize(
+            id=id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "Item",
+            '304': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def items_read_item_with_http_info(
+        self,
+        id: StrictInt,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[Item]:
+        """Read an item
+
+        Read item from the storage
+
+        :param id: (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_read_item_serialize(
+            id=id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "Item",
+            '304': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def items_read_item_without_preload_content(
+        self,
+        id: StrictInt,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Read an item
+
+        Read item from the storage
+
+        :param id: (required)
+        :type id: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_read_item_serialize(
+            id=id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "Item",
+            '304': None,
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _items_read_item_serialize(
+        self,
+        id,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[str, str] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        if id is not None:
+            _path_params['id'] = id
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            [
+                'application/json'
+            ]
+        )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/item/{id}/',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def items_search(
+        self,
+        q: Annotated[StrictStr, Field(description="Words to search for in the text fields of items")],
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        cursor: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[Item]:
+        """Search items
+
+        Search items by words, ranked by relevance
+
+        :param q: Words to search for in the text fields of items (required)
+        :type q: str
+        :param limit:
+        :type limit: int
+        :param cursor:
+        :type cursor: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_search_serialize(
+            q=q,
+            limit=limit,
+            cursor=cursor,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[Item]",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def items_search_with_http_info(
+        self,
+        q: Annotated[StrictStr, Field(description="Words to search for in the text fields of items")],
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        cursor: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[Item]]:
+        """Search items
+
+        Search items by words, ranked by relevance
+
+        :param q: Words to search for in the text fields of items (required)
+        :type q: str
+        :param limit:
+        :type limit: int
+        :param cursor:
+        :type cursor: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_search_serialize(
+            q=q,
+            limit=limit,
+            cursor=cursor,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[Item]",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def items_search_without_preload_content(
+        self,
+        q: Annotated[StrictStr, Field(description="Words to search for in the text fields of items")],
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        cursor: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Search items
+
+        Search items by words, ranked by relevance
+
+        :param q: Words to search for in the text fields of items (required)
+        :type q: str
+        :param limit:
+        :type limit: int
+        :param cursor:
+        :type cursor: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_search_serialize(
+            q=q,
+            limit=limit,
+            cursor=cursor,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[Item]",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def items_search_pages(
+        self,
+        q: Annotated[StrictStr, Field(description="Words to search for in the text fields of items")],
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        cursor: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> Iterator[List[Item]]:
+        """Search items page by page
+
+        Follows the continuation token sent in the `X-Next-Cursor`
+        response header until the last page is reached. Accepts the same
+        parameters as `items_search`, `cursor` is the token of
+        the first page to read.
+        """ # noqa: E501
+        while True:
+            response = self.items_search_with_http_info(
+                q=q,
+                limit=limit,
+                cursor=cursor,
+                _request_timeout=_request_timeout,
+                _request_auth=_request_auth,
+                _content_type=_content_type,
+                _headers=_headers,
+                _host_index=_host_index
+            )
+            yield response.data
+            cursor = next(
+                (
+                    value
+                    for name, value in (response.headers or {}).items()
+                    if name.lower() == 'X-Next-Cursor'.lower()
+                ),
+                None
+            )
+            if not cursor:
+                return
+
+
+    def items_search_iter(
+        self,
+        q: Annotated[StrictStr, Field(description="Words to search for in the text fields of items")],
+        limit: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None,
+        cursor: Optional[StrictStr] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> Iterator[Item]:
+        """Search items one by one
+
+        Lazily reads the pages returned by `items_search_pages`.
+        """ # noqa: E501
+        for page in self.items_search_pages(
+            q=q,
+            limit=limit,
+            cursor=cursor,
+            _request_timeout=_request_timeout,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        ):
+            yield from page
+
+
+    def _items_search_serialize(
+        self,
+        q,
+        limit,
+        cursor,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[str, str] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if q is not None:
+            
+            _query_params.append(('q', q))
+            
+        if limit is not None:
+            
+            _query_params.append(('limit', limit))
+            
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            [
+                'application/json'
+            ]
+        )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/item/search',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def items_stream(
+        self,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> Iterator[Item]:
+        """Stream all items
+
+        Stream all items from the storage as newline-delimited JSON
+
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_stream_serialize(
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "Item",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return self.api_client.response_deserialize_stream(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def items_stream_without_preload_content(
+        self,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Stream all items
+
+        Stream all items from the storage as newline-delimited JSON
+
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._items_stream_serialize(
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "Item",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _items_stream_serialize(
+        self,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[str, str] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        _header_params['Accept'] = self.api_client.select_header_accept(
+            [
+                'application/x-ndjson'
+            ]
+        )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/item/stream',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -1078,6 +2984,7 @@ class ItemsApi:
         self,
         id: StrictInt,
         item: Item,
+        if_match: Annotated[Optional[StrictStr], Field(description="ETag of the item read before the change, the item is only changed if it still has this version")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1099,6 +3006,8 @@ class ItemsApi:
         :type id: int
         :param item: (required)
         :type item: Item
+        :param if_match: ETag of the item read before the change, the item is only changed if it still has this version
+        :type if_match: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1124,6 +3033,7 @@ class ItemsApi:
         _param = self._items_update_item_serialize(
             id=id,
             item=item,
+            if_match=if_match,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1132,6 +3042,7 @@ class ItemsApi:
 
         _response_types_map: Dict[str, Optional[str]] = {
             '200': "Item",
+            '412': None,
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -1150,6 +3061,7 @@ class ItemsApi:
         self,
         id: StrictInt,
         item: Item,
+        if_match: Annotated[Optional[StrictStr], Field(description="ETag of the item read before the change, the item is only changed if it still has this version")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1171,6 +3083,8 @@ class ItemsApi:
         :type id: int
         :param item: (required)
         :type item: Item
+        :param if_match: ETag of the item read before the change, the item is only changed if it still has this version
+        :type if_match: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1196,6 +3110,7 @@ class ItemsApi:
         _param = self._items_update_item_serialize(
             id=id,
             item=item,
+            if_match=if_match,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1204,6 +3119,7 @@ class ItemsApi:
 
         _response_types_map: Dict[str, Optional[str]] = {
             '200': "Item",
+            '412': None,
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -1222,6 +3138,7 @@ class ItemsApi:
         self,
         id: StrictInt,
         item: Item,
+        if_match: Annotated[Optional[StrictStr], Field(description="ETag of the item read before the change, the item is only changed if it still has this version")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1243,6 +3160,8 @@ class ItemsApi:
         :type id: int
         :param item: (required)
         :type item: Item
+        :param if_match: ETag of the item read before the change, the item is only changed if it still has this version
+        :type if_match: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1268,6 +3187,7 @@ class ItemsApi:
         _param = self._items_update_item_serialize(
             id=id,
             item=item,
+            if_match=if_match,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1276,6 +3196,7 @@ class ItemsApi:
 
         _response_types_map: Dict[str, Optional[str]] = {
             '200': "Item",
+            '412': None,
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -1289,6 +3210,7 @@ class ItemsApi:
         self,
         id,
         item,
+        if_match,
         _request_auth,
         _content_type,
         _headers,
@@ -1312,6 +3234,8 @@ class ItemsApi:
             _path_params['id'] = id
         # process the query parameters
         # process the header parameters
+        if if_match is not None:
+            _header_params['If-Match'] = if_match
         # process the form parameters
         # process the body parameter
         if item is not None:
@@ -13,6 +13,7 @@
 """  # noqa: E501
 
 
+from collections import OrderedDict
 import datetime
 from dateutil.parser import parse
 from enum import Enum
@@ -21,9 +22,12 @@ import mimetypes
 import os
 import re
 import tempfile
+import threading
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict
+from typing import Any, Iterator, Tuple, Optional, List, Dict, get_args
+
+from pydantic import BaseModel, TypeAdapter
 
 from ds_catalog.configuration import Configuration
 from ds_catalog.api_response import ApiResponse, T as ApiResponseT
@@ -40,6 +44,8 @@ from ds_catalog.exceptions import (
 )
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
+# URL and request headers of a cached GET response
+EtagCacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
 
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
@@ -55,6 +61,9 @@ class ApiClient:
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
+    :param transport: transport sending the requests, a `RESTClientObject` of the
+        configuration by default. `ds_catalog.asgi.ASGITransport` calls an ASGI
+        application in the process.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
@@ -69,20 +78,27 @@ class ApiClient:
         'object': object,
     }
     _pool = None
+    # Validators compiled from the response types by `type_adapter`
+    _type_adapters: Dict[Any, Optional[TypeAdapter[Any]]] = {}
 
     def __init__(
         self,
         configuration=None,
         header_name=None,
         header_value=None,
-        cookie=None
+        cookie=None,
+        transport=None
     ) -> None:
         # use default configuration if none is provided
         if configuration is None:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client: rest.Transport
+        if transport is None:
+            self.rest_client = rest.RESTClientObject(configuration)
+        else:
+            self.rest_client = transport
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -90,6 +106,12 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        # Read GET responses with an ETag by URL and request headers, least
+        # recently used first, and the bytes of their bodies. The responses
+        # of the asynchronous client are kept too.
+        self.etag_cache: OrderedDict[EtagCacheKey, Any] = OrderedDict()
+        self.etag_cache_bytes = 0
+        self.etag_cache_lock = threading.Lock()
 
     def __enter__(self):
         return self
@@ -263,8 +285,29 @@ class ApiClient:
             for `application/x-www-form-urlencoded`, `multipart/form-data`.
         :param _request_timeout: timeout setting for this request.
         :return: RESTResponse
+
+        GET responses with an ETag are cached by URL and request headers,
+        see `Configuration.etag_cache_size`. A cached response is revalidated
+        with If-None-Match and returned again if the server answers 304.
         """
 
+        cacheable = (
+            method == 'GET'
+            and self.configuration.etag_cache_size > 0
+            and not any(
+                name.lower() == 'if-none-match' for name in (header_params or {})
+            )
+        )
+        cached = None
+        if cacheable:
+            key = self.etag_cache_key(url, header_params)
+            cached = self.cached_response(key)
+            if cached is not None:
+                header_params = {
+                    **(header_params or {}),
+                    'If-None-Match': cached.getheader('ETag'),
+                }
+
         try:
             # perform request and return response
             response_data = self.rest_client.request(
@@ -277,8 +320,58 @@ class ApiClient:
         except ApiException as e:
             raise e
 
+        if cached is not None and response_data.status == 304:
+            response_data.read()
+            return cached
+        if cacheable:
+            if response_data.status == 200 and response_data.getheader('ETag'):
+                response_data.read()
+                self.cache_response(key, response_data)
+            elif cached is not None:
+                self.cache_response(key, None)
+
         return response_data
 
+    @staticmethod
+    def etag_cache_key(
+        url: str, header_params: Optional[Dict[str, str]]
+    ) -> EtagCacheKey:
+        """Returns the key of a cached GET response: the URL and the request
+        headers, which select the representation, e.g. Accept, and the
+        caller, e.g. Authorization
+        """
+        headers = sorted(
+            (name.lower(), str(value)) for name, value in (header_params or {}).items()
+        )
+        return url, tuple(headers)
+
+    def cached_response(self, key: EtagCacheKey) -> Optional[Any]:
+        """Returns the cached response of a key, if any"""
+        with self.etag_cache_lock:
+            cached = self.etag_cache.get(key)
+            if cached is not None:
+                self.etag_cache.move_to_end(key)
+            return cached
+
+    def cache_response(self, key: EtagCacheKey, response_data: Optional[Any]) -> None:
+        """Keeps a read response to revalidate it with its ETag, or forgets
+        the response of the key if `response_data` is None. The least
+        recently used responses are forgotten when the bodies exceed
+        `Configuration.etag_cache_size` bytes.
+        """
+        limit = self.configuration.etag_cache_size
+        with self.etag_cache_lock:
+            previous = self.etag_cache.pop(key, None)
+            if previous is not None:
+                self.etag_cache_bytes -= len(previous.data)
+            if response_data is None or len(response_data.data) > limit:
+                return
+            self.etag_cache[key] = response_data
+            self.etag_cache_bytes += len(response_data.data)
+            while self.etag_cache_bytes > limit:
+                _, dropped = self.etag_cache.popitem(last=False)
+                self.etag_cache_bytes -= len(dropped.data)
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
@@ -309,11 +402,18 @@ class ApiClient:
             elif response_type is not None:
                 match = None
                 content_type = response_data.getheader('content-type')
-                if content_type is not None:
+                if content_type is not None and 'charset=' in content_type:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type)
+                content = response_data.data
+                # UTF-8 content is validated from the bytes, the text is
+                # only needed by errors
+                if (
+                    encoding.lower() not in ('utf-8', 'utf8')
+                    or not 200 <= response_data.status <= 299
+                ):
+                    response_text = content = content.decode(encoding)
+                return_data = self.deserialize(content, response_type)
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -329,6 +429,33 @@ class ApiClient:
             raw_data = response_data.data
         )
 
+    def response_deserialize_stream(
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: Dict[str, ApiResponseT]
+    ) -> Iterator[ApiResponseT]:
+        """Deserializes a newline-delimited JSON response line by line.
+        :param response_data: RESTResponse object which content is not
+            preloaded.
+        :param response_types_map: dict of response types.
+        :return: iterator over deserialized objects
+        """
+
+        if not 200 <= response_data.status <= 299:
+            response_data.read()
+            # raises an ApiException describing the error response
+            self.response_deserialize(response_data, response_types_map)
+
+        response_type = response_types_map.get(str(response_data.status), None)
+        if not response_type:
+            response_type = response_types_map.get(str(response_data.status)[0] + "XX", None)
+
+        return (
+            self.deserialize(line, response_type)
+            for line in response_data.iter_lines()
+            if line.strip()
+        )
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -376,13 +503,20 @@ class ApiClient:
     def deserialize(self, response_text, response_type):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: str, or UTF-8 bytes validated without
+            being decoded by the compiled validators.
         :param response_type: class literal for
             deserialized object, or string of class name.
 
         :return: deserialized object.
         """
 
+        adapter = self.type_adapter(response_type)
+        if adapter is not None:
+            return adapter.validate_json(response_text)
+        if isinstance(response_text, bytes):
+            response_text = response_text.decode("utf-8")
+
         # fetch data from response object
         try:
             data = json.loads(response_text)
@@ -391,6 +525,91 @@ class ApiClient:
 
         return self.__deserialize(data, response_type)
 
+    @classmethod
+    def type_adapter(cls, response_type) -> Optional[TypeAdapter[Any]]:
+        """Returns the validator of a response type, compiled once.
+
+        The JSON of a model, or of a list or dict of models, is validated
+        in one call instead of being loaded and deserialized value by
+        value by `__deserialize`, with the same result: `null` values of
+        the response and its lists and dicts are kept as None.
+
+        :param response_type: class literal, or string of class name.
+        :return: the validator, None if the type is deserialized by
+            `__deserialize`.
+        """
+        try:
+            return cls._type_adapters[response_type]
+        except KeyError:
+            pass
+        python_type = cls.__compiled_type(response_type)
+        adapter = None
+        if python_type is not None:
+            adapter = TypeAdapter(Optional[python_type])
+        cls._type_adapters[response_type] = adapter
+        return adapter
+
+    @classmethod
+    def __compiled_type(cls, klass):
+        """Returns the Python type validated for a response type, None if
+        it is not compiled.
+
+        :param klass: class literal, or string of class name.
+        """
+        if isinstance(klass, str):
+            if klass.startswith('List['):
+                m = re.match(r'List\[(.*)]', klass)
+                assert m is not None, "Malformed List type definition"
+                sub_type = cls.__compiled_type(m.group(1))
+                if sub_type is None:
+                    return None
+                return List[Optional[sub_type]]  # type: ignore[valid-type]
+
+            if klass.startswith('Dict['):
+                m = re.match(r'Dict\[([^,]*), (.*)]', klass)
+                assert m is not None, "Malformed Dict type definition"
+                sub_type = cls.__compiled_type(m.group(2))
+                if sub_type is None:
+                    return None
+                return Dict[str, Optional[sub_type]]  # type: ignore[valid-type]
+
+            klass = getattr(ds_catalog.models, klass, None)
+
+        if (
+            isinstance(klass, type)
+            and issubclass(klass, BaseModel)
+            and cls.__validated_as_dict(klass, set())
+        ):
+            return klass
+        return None
+
+    @classmethod
+    def __validated_as_dict(cls, klass, seen) -> bool:
+        """Returns whether validating a model gives what its `from_dict`
+        does. It does not for the `anyOf` and `oneOf` models, which
+        deserialize their JSON themselves, and the models with such fields.
+
+        :param klass: model class.
+        :param seen: model classes already checked.
+        """
+        if 'actual_instance' in klass.model_fields:
+            return False
+        seen.add(klass)
+        annotations = [
+            field.annotation for field in klass.model_fields.values()
+        ]
+        while annotations:
+            annotation = annotations.pop()
+            annotations.extend(get_args(annotation))
+            if (
+                isinstance(annotation, type)
+                and issubclass(annotation, BaseModel)
+                and annotation not in seen
+                and not cls.__validated_as_dict(annotation, seen)
+            ):
+                return False
+        return True
+
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
 
@@ -0,0 +1,307 @@
+# coding: utf-8
+
+"""
+    Data Space Catalog
+
+    The service provides a REST API for managing and sharing catalog data. Interacts with connector services to obtain information about data products.
+
+    The version of the OpenAPI document: 0.1.1
+    Contact: all-hiro@hiro-microdatacenters.nl
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+
+import asyncio
+import concurrent.futures
+import io
+import json
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlencode, urlsplit
+
+import urllib3
+
+from ds_catalog import rest
+from ds_catalog.exceptions import ApiException, ApiValueError
+
+ASGIResponse = Tuple[int, List[Tuple[str, str]], bytes]
+
+
+def encode_body(headers, body=None, post_params=None) -> bytes:
+    """Returns the body of a request as `RESTClientObject` sends it.
+
+    :param headers: http request headers, the `Content-Type` of a
+                    `multipart/form-data` body is replaced
+    :param body: request json body, for `application/json`
+    :param post_params: request post parameters,
+                        `application/x-www-form-urlencoded`
+                        and `multipart/form-data`
+    """
+    if post_params and body:
+        raise ApiValueError(
+            "body parameter cannot be used with post_params parameter."
+        )
+
+    content_type = headers.get('Content-Type')
+    if not content_type or re.search('json', content_type, re.IGNORECASE):
+        return b"" if body is None else json.dumps(body).encode("utf-8")
+    if content_type == 'application/x-www-form-urlencoded':
+        return urlencode(post_params or []).encode("utf-8")
+    if content_type == 'multipart/form-data':
+        data, headers['Content-Type'] = urllib3.encode_multipart_formdata(
+            post_params or []
+        )
+        return data
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, bytes):
+        return body
+    if content_type == 'text/plain' and isinstance(body, bool):
+        return b"true" if body else b"false"
+    # Cannot generate the request from given parameters
+    msg = """Cannot prepare a request message for provided
+             arguments. Please check that your arguments match
+             declared content type."""
+    raise ApiException(status=0, reason=msg)
+
+
+class ASGIApplication:
+    """ASGI application called in the process of its client.
+
+    The application is started with its lifespan events before the first
+    request and shut down by `shutdown`, as a server would. Its responses
+    are read in full before they are returned.
+
+    :param app: ASGI application, such as the FastAPI `app.main:app`
+    :param lifespan: whether the application handles lifespan events
+    """
+
+    def __init__(self, app, lifespan: bool = True) -> None:
+        self.app = app
+        self.lifespan = lifespan
+        # State shared by the lifespan and the requests of the application
+        self.state: Dict[str, Any] = {}
+        self.started = False
+        self.start_lock: Optional[asyncio.Lock] = None
+        self.lifespan_task: Optional["asyncio.Task[None]"] = None
+        self.lifespan_received: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self.lifespan_sent: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+    async def startup(self) -> None:
+        """Starts the application, once"""
+        if self.start_lock is None:
+            self.start_lock = asyncio.Lock()
+        async with self.start_lock:
+            if self.started:
+                return
+            if self.lifespan:
+                self.lifespan_task = asyncio.create_task(
+                    self.app(
+                        {
+                            "type": "lifespan",
+                            "asgi": {"version": "3.0"},
+                            "state": self.state,
+                        },
+                        self.lifespan_received.get,
+                        self.lifespan_sent.put,
+                    )
+                )
+                await self._lifespan_event("startup")
+            self.started = True
+
+    async def shutdown(self) -> None:
+        """Shuts the application down if it was started"""
+        if self.started and self.lifespan_task is not None:
+            await self._lifespan_event("shutdown")
+            await self.lifespan_task
+        self.started = False
+        self.lifespan_task = None
+
+    async def _lifespan_event(self, event: str) -> None:
+        assert self.lifespan_task is not None
+        await self.lifespan_received.put({"type": f"lifespan.{event}"})
+        message = asyncio.ensure_future(self.lifespan_sent.get())
+        await asyncio.wait(
+            [message, self.lifespan_task], return_when=asyncio.FIRST_COMPLETED
+        )
+        if not message.done():
+            message.cancel()
+            # As for a server, an application that returns or raises on the
+            # lifespan scope does not handle lifespan events
+            if event == "startup":
+                self.lifespan_task.exception()
+                self.lifespan_task = None
+                return
+            raise RuntimeError(f"ASGI application {event} failed")
+        if message.result()["type"] != f"lifespan.{event}.complete":
+            raise RuntimeError(
+                f"ASGI application {event} failed: "
+                f"{message.result().get('message', '')}"
+            )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> ASGIResponse:
+        """Returns the status, headers and body of the response of the
+        application to a request
+        """
+        await self.startup()
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        host = parts.hostname or "localhost"
+        port = parts.port or (443 if scheme == "https" else 80)
+        request_headers = [
+            (name.lower().encode("latin-1"), str(value).encode("latin-1"))
+            for name, value in headers.items()
+            if value is not None
+        ]
+        if "host" not in (name.lower() for name in headers):
+            request_headers.append((b"host", parts.netloc.encode("latin-1")))
+        if body:
+            request_headers.append((b"content-length", str(len(body)).encode()))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method.upper(),
+            "scheme": scheme,
+            "path": unquote(parts.path) or "/",
+            "raw_path": (parts.path or "/").encode("latin-1"),
+            "query_string": parts.query.encode("latin-1"),
+            "root_path": "",
+            "headers": request_headers,
+            "client": ("127.0.0.1", 0),
+            "server": (host, port),
+            "state": self.state.copy(),
+        }
+
+        request_sent = False
+        response_complete = asyncio.Event()
+        status = 500
+        response_headers: List[Tuple[str, str]] = []
+        chunks: List[bytes] = []
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # The client disconnects once it has the response
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers.extend(
+                    (name.decode("latin-1"), value.decode("latin-1"))
+                    for name, value in message.get("headers", [])
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_complete.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            response_complete.set()
+        return status, response_headers, b"".join(chunks)
+
+
+class ASGITransport:
+    """Sends the requests of an `ApiClient` to an ASGI application in the
+    process, without networking.
+
+    The application runs on an event loop of its own thread, shared by the
+    threads calling it. Close the transport to shut the application down,
+    with `close()` or in a `with` block:
+
+        with ASGITransport(app) as transport:
+            api_client = ApiClient(configuration, transport=transport)
+
+    :param app: ASGI application, such as the FastAPI `app.main:app`
+    :param lifespan: whether the application handles lifespan events
+    """
+
+    def __init__(self, app, lifespan: bool = True) -> None:
+        self.application = ASGIApplication(app, lifespan)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="asgi-transport", daemon=True
+        )
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _run(self, coroutine, timeout=None):
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            # The application stops handling a request that timed out
+            future.cancel()
+            raise
+
+    def close(self) -> None:
+        if self.loop.is_closed():
+            return
+        try:
+            self._run(self.application.shutdown())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> rest.RESTResponse:
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. A pair (tuple) of (connection,
+                                 read) timeouts is a total of their sum.
+        """
+        headers = dict(headers or {})
+        content = encode_body(headers, body, post_params)
+        if isinstance(_request_timeout, tuple):
+            _request_timeout = sum(_request_timeout)
+        status, response_headers, data = self._run(
+            self.application.request(method, url, headers, content),
+            _request_timeout or None,
+        )
+        return rest.RESTResponse(
+            urllib3.HTTPResponse(
+                body=io.BytesIO(data),
+                headers=response_headers,
+                status=status,
+                preload_content=False,
+            )
+        )
@@ -156,6 +156,15 @@ class Configuration:
            not the best value when you are making a lot of possibly parallel
            requests to the same host, which is often the case here.
            cpu_count * 5 is used as default value to increase performance.
+           The asynchronous `aio` client opens at most this number of
+           connections.
+        """
+        self.http2 = False
+        """Send the requests of the asynchronous `aio` client over HTTP/2,
+           with the calls made concurrently multiplexed on one connection
+           per host. HTTP/2 is negotiated with TLS servers, a cleartext
+           `http://` host has to accept it with prior knowledge. Requires
+           the `http2` extra of httpx.
         """
 
         self.proxy: Optional[str] = None
@@ -170,6 +179,11 @@ class Configuration:
         self.retries = None
         """Adding retries to override urllib3 default value 3
         """
+        self.etag_cache_size = 16 * 1024 * 1024
+        """Bytes of the bodies of the GET responses with an ETag kept by the
+           client, they are revalidated with If-None-Match instead of being
+           downloaded again. 0 disables the cache.
+        """
         # Enable client side validation
         self.client_side_validation = True
 
@@ -17,6 +17,7 @@ import io
 import json
 import re
 import ssl
+from typing import Protocol
 
 import urllib3
 
@@ -49,6 +50,23 @@ class RESTResponse(io.IOBase):
             self.data = self.response.data
         return self.data
 
+    def iter_lines(self, chunk_size=65536):
+        """Yields the lines of the response body as they are received.
+
+        The body is not buffered in full, so the response must be requested
+        with `preload_content=False` and is released once exhausted.
+        """
+        pending = b""
+        try:
+            for chunk in self.response.stream(chunk_size):
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                yield from lines
+            if pending:
+                yield pending
+        finally:
+            self.response.release_conn()
+
     def getheaders(self):
         """Returns a dictionary of the response headers."""
         return self.response.headers
@@ -58,6 +76,21 @@ class RESTResponse(io.IOBase):
         return self.response.headers.get(name, default)
 
 
+class Transport(Protocol):
+    """Sends the requests of an `ApiClient`, `RESTClientObject` by default"""
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ) -> RESTResponse:
+        ...
+
+
 class RESTClientObject:
 
     def __init__(self, configuration) -> None:
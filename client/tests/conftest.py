@@ -0,0 +1,147 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import json
+from urllib.parse import parse_qs
+
+import pytest
+
+from ds_catalog.configuration import Configuration
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class Catalog:
+    """ASGI application serving the items of a catalog in memory, as the
+    catalog service does, and keeping the requests it received
+    """
+
+    def __init__(self) -> None:
+        self.items: Dict[int, Dict[str, Any]] = {}
+        self.versions: Dict[int, int] = {}
+        self.changes: List[Dict[str, Any]] = []
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+        self.lifespan: List[str] = []
+
+    @property
+    def version(self) -> int:
+        return len(self.changes)
+
+    def set(self, item: Dict[str, Any]) -> None:
+        self.items[item["id"]] = item
+        self.changes.append(
+            {"version": self.version + 1, "op": "set", "id": item["id"], "item": item}
+        )
+        self.versions[item["id"]] = self.version
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] == "lifespan":
+            while (message := await receive())["type"] != "lifespan.shutdown":
+                self.lifespan.append(message["type"])
+                await send({"type": "lifespan.startup.complete"})
+            self.lifespan.append(message["type"])
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        headers = {
+            name.decode().lower(): value.decode() for name, value in scope["headers"]
+        }
+        self.requests.append((scope["method"], scope["path"], headers))
+        query = {
+            name: values[0]
+            for name, values in parse_qs(scope["query_string"].decode()).items()
+        }
+        status, response_headers, content = self.handle(
+            scope["method"], scope["path"], query, headers, body
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": response_headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> Tuple[int, Headers, bytes]:
+        if method == "POST" and path == "/item/":
+            item = json.loads(body)
+            if item["id"] in self.items:
+                return self.json(400, {"detail": "Item already exists"})
+            self.set(item)
+            return self.json(201, item)
+        if method == "GET" and path == "/item/":
+            keys = sorted(self.items)
+            if "cursor" in query:
+                keys = [key for key in keys if key > int(query["cursor"])]
+            limit = int(query.get("limit", len(keys) or 1))
+            page, more = keys[:limit], keys[limit:]
+            extra = [(b"x-next-cursor", str(page[-1]).encode())] if more else []
+            return self.tagged(
+                headers, self.version, [self.items[key] for key in page], extra
+            )
+        if method == "GET" and path == "/item/stream":
+            lines = [json.dumps(self.items[key]) + "\n" for key in sorted(self.items)]
+            return (
+                200,
+                [(b"content-type", b"application/x-ndjson")],
+                "".join(lines).encode(),
+            )
+        if method == "GET" and path == "/item/changes":
+            since = int(query.get("since", self.version))
+            limit = int(query.get("limit", 1000))
+            changes = self.changes[since : since + limit]
+            version = changes[-1]["version"] if changes else self.version
+            return self.json(200, {"changes": changes, "version": version})
+        if method == "GET" and path.startswith("/item/"):
+            key = int(path.strip("/").split("/")[1])
+            if key not in self.items:
+                return self.json(404, {"detail": "Item not found"})
+            return self.tagged(headers, self.versions[key], self.items[key])
+        return self.json(404, {"detail": "Not Found"})
+
+    def tagged(
+        self,
+        headers: Dict[str, str],
+        version: int,
+        content: Any,
+        extra: Optional[Headers] = None,
+    ) -> Tuple[int, Headers, bytes]:
+        etag = f'"{version}"'
+        tag = [(b"etag", etag.encode())]
+        if headers.get("if-none-match") == etag:
+            return 304, tag, b""
+        status, response_headers, data = self.json(200, content)
+        return status, response_headers + tag + (extra or []), data
+
+    @staticmethod
+    def json(status: int, content: Any) -> Tuple[int, Headers, bytes]:
+        return (
+            status,
+            [(b"content-type", b"application/json")],
+            json.dumps(content).encode(),
+        )
+
+
+@pytest.fixture
+def catalog() -> Catalog:
+    catalog = Catalog()
+    for id in range(1, 6):
+        catalog.set({"id": id, "name": f"item{id}"})
+    return catalog
+
+
+@pytest.fixture
+def configuration() -> Configuration:
+    return Configuration(host="http://catalog")
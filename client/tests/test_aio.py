@@ -0,0 +1,103 @@
+from typing import Any, Awaitable, Callable, List, TypeVar
+
+import asyncio
+
+import pytest
+
+from ds_catalog.aio import ApiClient, ItemsApi
+from ds_catalog.aio.asgi import ASGITransport
+from ds_catalog.configuration import Configuration
+from ds_catalog.exceptions import ApiException
+from ds_catalog.models.item import Item
+from ds_catalog.models.item_change import ItemChange
+
+from .conftest import Catalog
+
+T = TypeVar("T")
+
+
+def run(
+    catalog: Catalog,
+    configuration: Configuration,
+    call: Callable[[ItemsApi], Awaitable[T]],
+) -> T:
+    """Return the result of a call of the items API of an asyncio client
+    sending its requests to the catalog
+    """
+
+    async def main() -> T:
+        async with ApiClient(
+            configuration, transport=ASGITransport(catalog)
+        ) as api_client:
+            return await call(ItemsApi(api_client))
+
+    return asyncio.run(main())
+
+
+def test_create_and_read_item(catalog: Catalog, configuration: Configuration) -> None:
+    async def call(api: ItemsApi) -> List[Any]:
+        created = await api.items_create(Item(id=6, name="item6"))
+        read = await api.items_read_item(6)
+        # The second read is revalidated with the ETag of the first
+        again = await api.items_read_item(6)
+        return [created, read, again]
+
+    item = Item(id=6, name="item6")
+    assert run(catalog, configuration, call) == [item, item, item]
+    assert catalog.requests[-1][2]["if-none-match"] == '"6"'
+
+
+def test_error_status(catalog: Catalog, configuration: Configuration) -> None:
+    with pytest.raises(ApiException) as info:
+        run(catalog, configuration, lambda api: api.items_read_item(7))
+    assert info.value.status == 404
+    assert info.value.body == '{"detail": "Item not found"}'
+
+
+def test_read_all_pages(catalog: Catalog, configuration: Configuration) -> None:
+    async def call(api: ItemsApi) -> List[List[int]]:
+        return [
+            [item.id for item in page]
+            async for page in api.items_read_all_pages(limit=2)
+        ]
+
+    assert run(catalog, configuration, call) == [[1, 2], [3, 4], [5]]
+    assert [path for _, path, _ in catalog.requests] == ["/item/"] * 3
+
+
+def test_read_all_iter(catalog: Catalog, configuration: Configuration) -> None:
+    async def call(api: ItemsApi) -> List[Item]:
+        return [item async for item in api.items_read_all_iter(limit=3)]
+
+    assert run(catalog, configuration, call) == [
+        Item(id=id, name=f"item{id}") for id in range(1, 6)
+    ]
+
+
+def test_stream(catalog: Catalog, configuration: Configuration) -> None:
+    async def call(api: ItemsApi) -> List[Item]:
+        return [item async for item in api.items_stream()]
+
+    assert run(catalog, configuration, call) == [
+        Item(id=id, name=f"item{id}") for id in range(1, 6)
+    ]
+
+
+def test_read_changes_iter(catalog: Catalog, configuration: Configuration) -> None:
+    async def call(api: ItemsApi) -> List[ItemChange]:
+        changes = []
+        async for change in api.items_read_changes_iter(since=3, limit=1, wait=0):
+            changes.append(change)
+            if change.version == 5:
+                catalog.set({"id": 1, "name": "updated"})
+            if change.version == 6:
+                return changes
+        raise AssertionError("The changes ended")
+
+    changes = run(catalog, configuration, call)
+    assert [(change.version, change.id) for change in changes] == [
+        (4, 4),
+        (5, 5),
+        (6, 1),
+    ]
+    assert changes[-1].item == Item(id=1, name="updated")
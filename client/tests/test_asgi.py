@@ -0,0 +1,136 @@
+from typing import Any, Dict, Tuple
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+from ds_catalog import aio
+from ds_catalog.aio.asgi import ASGITransport as AsyncASGITransport
+from ds_catalog.api.items_api import ItemsApi
+from ds_catalog.api_client import ApiClient
+from ds_catalog.asgi import ASGITransport
+from ds_catalog.configuration import Configuration
+from ds_catalog.exceptions import ApiException
+from ds_catalog.models.item import Item
+
+from .conftest import Catalog
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class Blocked:
+    """ASGI application that never answers, and records its cancellation"""
+
+    def __init__(self) -> None:
+        self.cancelled = threading.Event()
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+
+
+class TestASGITransport:
+    def test_request_and_response(self, catalog: Catalog) -> None:
+        with ASGITransport(catalog) as transport:
+            response = transport.request(
+                "POST",
+                "http://catalog/item/?a=b",
+                headers=JSON_HEADERS,
+                body={"id": 6, "name": "item6"},
+            )
+        assert response.status == 201
+        assert response.getheader("content-type") == "application/json"
+        assert response.read() == b'{"id": 6, "name": "item6"}'
+        method, path, headers = catalog.requests[-1]
+        assert (method, path) == ("POST", "/item/")
+        assert headers["host"] == "catalog"
+        assert headers["content-type"] == "application/json"
+        assert headers["content-length"] == "26"
+
+    def test_error_status(
+        self, catalog: Catalog, configuration: Configuration
+    ) -> None:
+        with ASGITransport(catalog) as transport:
+            response = transport.request("GET", "http://catalog/item/7/")
+            assert response.status == 404
+            assert response.read() == b'{"detail": "Item not found"}'
+            api = ItemsApi(ApiClient(configuration, transport=transport))
+            with pytest.raises(ApiException) as info:
+                api.items_read_item(7)
+        assert info.value.status == 404
+
+    def test_close(self, catalog: Catalog, configuration: Configuration) -> None:
+        transport = ASGITransport(catalog)
+        api = ItemsApi(ApiClient(configuration, transport=transport))
+        assert api.items_read_item(1) == Item(id=1, name="item1")
+        assert catalog.lifespan == ["lifespan.startup"]
+        transport.close()
+        assert catalog.lifespan == ["lifespan.startup", "lifespan.shutdown"]
+        assert not transport.thread.is_alive()
+        transport.close()
+
+    def test_timeout_cancels_request(self) -> None:
+        app = Blocked()
+        with ASGITransport(app, lifespan=False) as transport:
+            with pytest.raises(concurrent.futures.TimeoutError):
+                transport.request("GET", "http://catalog/", _request_timeout=0.1)
+            assert app.cancelled.wait(5)
+
+
+class TestAsyncASGITransport:
+    def test_request_and_response(self, catalog: Catalog) -> None:
+        async def main() -> Tuple[int, str, bytes]:
+            transport = AsyncASGITransport(catalog)
+            response = await transport.request(
+                "POST",
+                "http://catalog/item/?a=b",
+                headers=JSON_HEADERS,
+                body={"id": 6, "name": "item6"},
+            )
+            await transport.close()
+            return (
+                response.status,
+                response.getheader("content-type"),
+                await response.read(),
+            )
+
+        assert asyncio.run(main()) == (
+            201,
+            "application/json",
+            b'{"id": 6, "name": "item6"}',
+        )
+        method, path, headers = catalog.requests[-1]
+        assert (method, path) == ("POST", "/item/")
+        assert headers["host"] == "catalog"
+        assert headers["content-length"] == "26"
+
+    def test_error_status(
+        self, catalog: Catalog, configuration: Configuration
+    ) -> None:
+        async def main() -> int:
+            transport = AsyncASGITransport(catalog)
+            async with aio.ApiClient(configuration, transport=transport) as client:
+                response = await transport.request("GET", "http://catalog/item/7/")
+                assert await response.read() == b'{"detail": "Item not found"}'
+                with pytest.raises(ApiException) as info:
+                    await aio.ItemsApi(client).items_read_item(7)
+                assert info.value.status == 404
+            return response.status
+
+        assert asyncio.run(main()) == 404
+
+    def test_close(self, catalog: Catalog, configuration: Configuration) -> None:
+        async def main() -> None:
+            async with aio.ApiClient(
+                configuration, transport=AsyncASGITransport(catalog)
+            ) as client:
+                await aio.ItemsApi(client).items_read_item(1)
+                assert catalog.lifespan == ["lifespan.startup"]
+
+        asyncio.run(main())
+        assert catalog.lifespan == ["lifespan.startup", "lifespan.shutdown"]
@@ -0,0 +1,257 @@
+from typing import Any, Dict, List, Optional
+
+import datetime
+import io
+import json
+
+import pytest
+import urllib3
+from pydantic import BaseModel
+
+from ds_catalog import rest
+from ds_catalog.api_client import ApiClient
+from ds_catalog.configuration import Configuration
+from ds_catalog.exceptions import ApiException
+from ds_catalog.models.item import Item
+
+
+class Event(BaseModel):
+    """Model with datetime fields, as generated for `format: date-time`"""
+
+    at: datetime.datetime
+    until: Optional[datetime.datetime] = None
+    items: Optional[List[Item]] = None
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional["Event"]:
+        if obj is None:
+            return None
+        return cls.model_validate(
+            {
+                "at": obj.get("at"),
+                "until": obj.get("until"),
+                "items": [Item.from_dict(item) for item in obj["items"]]
+                if obj.get("items") is not None
+                else None,
+            }
+        )
+
+
+@pytest.fixture
+def api_client(configuration: Configuration) -> ApiClient:
+    return ApiClient(configuration)
+
+
+def legacy(api_client: ApiClient, text: str, response_type: Any) -> Any:
+    """Deserialize a response with `__deserialize`, value by value"""
+    return getattr(api_client, "_ApiClient__deserialize")(
+        json.loads(text), response_type
+    )
+
+
+def response(status: int, data: bytes, content_type: str) -> rest.RESTResponse:
+    response_data = rest.RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(data),
+            headers={"Content-Type": content_type},
+            status=status,
+            preload_content=False,
+        )
+    )
+    response_data.read()
+    return response_data
+
+
+@pytest.mark.parametrize(
+    "response_type, text",
+    [
+        ("Item", '{"id": 1, "name": "item1"}'),
+        ("Item", "null"),
+        ("List[Item]", '[{"id": 1, "name": "a"}, null, {"id": 2, "name": "b"}]'),
+        ("List[Item]", "[]"),
+        ("Dict[str, Item]", '{"a": {"id": 1, "name": "a"}, "b": null}'),
+        ("List[List[Item]]", '[[{"id": 1, "name": "a"}], [], null]'),
+        ("ItemChange", '{"version": 3, "op": "delete", "id": 1}'),
+        ("ItemChange", '{"version": 3, "op": "clear", "id": null, "item": null}'),
+        (
+            "ItemChanges",
+            '{"changes": [{"version": 1, "op": "set", "id": 1, '
+            '"item": {"id": 1, "name": "a"}}], "version": 1}',
+        ),
+        (
+            "List[BulkItemResult]",
+            '[{"id": 1, "status": 201}, '
+            '{"id": 2, "status": 400, "detail": "Item already exists"}]',
+        ),
+        (Event, '{"at": "2024-01-02T03:04:05Z"}'),
+        (
+            Event,
+            '{"at": "2024-01-02T03:04:05.123456+01:00", '
+            '"until": "2024-01-03T00:00:00", "items": [{"id": 1, "name": "a"}]}',
+        ),
+    ],
+)
+def test_compiled_matches_legacy(
+    api_client: ApiClient, response_type: Any, text: str
+) -> None:
+    assert api_client.type_adapter(response_type) is not None
+    expected = legacy(api_client, text, response_type)
+    assert api_client.deserialize(text, response_type) == expected
+    assert api_client.deserialize(text.encode(), response_type) == expected
+
+
+def test_datetime_fields(api_client: ApiClient) -> None:
+    event = api_client.deserialize('{"at": "2024-01-02T03:04:05+01:00"}', Event)
+    assert event.at == datetime.datetime(
+        2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
+    )
+
+
+@pytest.mark.parametrize(
+    "response_type, text",
+    [
+        ("Item", '{"id": "1", "name": "item1"}'),
+        ("ItemChange", '{"version": 1, "op": "unknown"}'),
+        (Event, '{"at": "yesterday"}'),
+    ],
+)
+def test_invalid_values_are_rejected(
+    api_client: ApiClient, response_type: Any, text: str
+) -> None:
+    with pytest.raises(ValueError):
+        legacy(api_client, text, response_type)
+    with pytest.raises(ValueError):
+        api_client.deserialize(text, response_type)
+
+
+def test_uncompiled_types(api_client: ApiClient) -> None:
+    # anyOf models, and the models with anyOf fields, deserialize themselves
+    assert api_client.type_adapter("ValidationErrorLocInner") is None
+    assert api_client.type_adapter("HTTPValidationError") is None
+    assert api_client.type_adapter("str") is None
+    assert api_client.type_adapter("datetime") is None
+    assert api_client.deserialize('"2024-01-02T03:04:05Z"', "datetime") == (
+        datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    )
+
+
+@pytest.mark.parametrize(
+    "status, response_type, text",
+    [
+        (
+            422,
+            "HTTPValidationError",
+            '{"detail": [{"loc": ["body", 0, "id"], "msg": "Field required", '
+            '"type": "missing"}]}',
+        ),
+        (400, "BulkItemResult", '{"id": 1, "status": 400, "detail": "Exists"}'),
+        (404, "Item", '{"detail": "Item not found"}'),
+    ],
+)
+def test_error_bodies(
+    api_client: ApiClient, status: int, response_type: str, text: str
+) -> None:
+    types_map: Dict[str, Any] = {"200": "Item", str(status): response_type}
+    with pytest.raises(ApiException) as info:
+        api_client.response_deserialize(
+            response(status, text.encode(), "application/json"), types_map
+        )
+    assert info.value.status == status
+    assert info.value.body == text
+    if response_type == "Item":
+        # A body that is not the model of the status is only kept as text,
+        # as the legacy deserialization fails on it too
+        assert info.value.data is None
+        with pytest.raises(ValueError):
+            legacy(api_client, text, response_type)
+    else:
+        assert info.value.data == legacy(api_client, text, response_type)
+
+
+class TestResponseDeserialize:
+    @pytest.fixture
+    def contents(
+        self, api_client: ApiClient, monkeypatch: pytest.MonkeyPatch
+    ) -> List[Any]:
+        """Contents passed to `deserialize` by `response_deserialize`"""
+        contents: List[Any] = []
+        deserialize = api_client.deserialize
+
+        def recorded(content: Any, response_type: Any) -> Any:
+            contents.append(content)
+            return deserialize(content, response_type)
+
+        monkeypatch.setattr(api_client, "deserialize", recorded)
+        return contents
+
+    def test_utf8_is_validated_from_bytes(
+        self, api_client: ApiClient, contents: List[Any]
+    ) -> None:
+        data = '{"id": 1, "name": "é"}'.encode()
+        for content_type in ["application/json", "application/json; charset=UTF-8"]:
+            result = api_client.response_deserialize(
+                response(200, data, content_type), {"200": "Item"}
+            )
+            assert result.data == Item(id=1, name="é")
+            assert result.raw_data == data
+        assert contents == [data, data]
+
+    def test_other_charsets_are_decoded(
+        self, api_client: ApiClient, contents: List[Any]
+    ) -> None:
+        data = '{"id": 1, "name": "é"}'.encode("latin-1")
+        result = api_client.response_deserialize(
+            response(200, data, "application/json; charset=ISO-8859-1"),
+            {"200": "Item"},
+        )
+        assert result.data == Item(id=1, name="é")
+        assert contents == ['{"id": 1, "name": "é"}']
+
+    def test_error_statuses_are_decoded(
+        self, api_client: ApiClient, contents: List[Any]
+    ) -> None:
+        with pytest.raises(ApiException) as info:
+            api_client.response_deserialize(
+                response(409, b'{"id": 1, "name": "a"}', "application/json"),
+                {"2XX": "Item", "4XX": "Item"},
+            )
+        assert contents == ['{"id": 1, "name": "a"}']
+        assert info.value.body == '{"id": 1, "name": "a"}'
+        assert info.value.data == Item(id=1, name="a")
+
+
+class TestResponseDeserializeStream:
+    @staticmethod
+    def stream(status: int, data: bytes) -> rest.RESTResponse:
+        return rest.RESTResponse(
+            urllib3.HTTPResponse(
+                body=io.BytesIO(data),
+                headers={"Content-Type": "application/x-ndjson"},
+                status=status,
+                preload_content=False,
+            )
+        )
+
+    def test_lines(self, api_client: ApiClient) -> None:
+        # Blank lines are skipped, the last line may have no newline
+        data = (
+            b'{"id": 1, "name": "a"}\n\n'
+            b'{"id": 2, "name": "b"}\n'
+            b'{"id": 3, "name": "c"}'
+        )
+        items = api_client.response_deserialize_stream(
+            self.stream(200, data), {"200": "Item"}
+        )
+        assert list(items) == [
+            Item(id=1, name="a"),
+            Item(id=2, name="b"),
+            Item(id=3, name="c"),
+        ]
+
+    def test_error_status(self, api_client: ApiClient) -> None:
+        with pytest.raises(ApiException) as info:
+            api_client.response_deserialize_stream(
+                self.stream(500, b'{"detail": "Internal error"}'), {"200": "Item"}
+            )
+        assert info.value.status == 500
+        assert info.value.body == '{"detail": "Internal error"}'
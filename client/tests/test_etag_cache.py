@@ -0,0 +1,68 @@
+from typing import Iterator
+
+import pytest
+
+from ds_catalog.api.items_api import ItemsApi
+from ds_catalog.api_client import ApiClient
+from ds_catalog.asgi import ASGITransport
+from ds_catalog.configuration import Configuration
+from ds_catalog.models.item import Item
+
+from .conftest import Catalog
+
+
+@pytest.fixture
+def transport(catalog: Catalog) -> Iterator[ASGITransport]:
+    with ASGITransport(catalog) as transport:
+        yield transport
+
+
+def test_revalidated_response_is_reused(
+    catalog: Catalog, configuration: Configuration, transport: ASGITransport
+) -> None:
+    api = ItemsApi(ApiClient(configuration, transport=transport))
+    assert api.items_read_item(1) == Item(id=1, name="item1")
+    assert "if-none-match" not in catalog.requests[-1][2]
+
+    assert api.items_read_item(1) == Item(id=1, name="item1")
+    assert catalog.requests[-1][2]["if-none-match"] == '"1"'
+
+    # A changed item is read again and replaces the cached response
+    catalog.set({"id": 1, "name": "updated"})
+    assert api.items_read_item(1) == Item(id=1, name="updated")
+    assert api.items_read_item(1) == Item(id=1, name="updated")
+    assert catalog.requests[-1][2]["if-none-match"] == '"6"'
+
+
+def test_responses_are_cached_by_request_headers(
+    catalog: Catalog, configuration: Configuration, transport: ASGITransport
+) -> None:
+    api = ItemsApi(ApiClient(configuration, transport=transport))
+    api.items_read_item(1, _headers={"Authorization": "Bearer first"})
+    api.items_read_item(1, _headers={"Authorization": "Bearer second"})
+    assert "if-none-match" not in catalog.requests[-1][2]
+    api.items_read_item(1, _headers={"Authorization": "Bearer first"})
+    assert catalog.requests[-1][2]["if-none-match"] == '"1"'
+
+
+def test_cache_is_bounded_by_bytes(
+    catalog: Catalog, configuration: Configuration, transport: ASGITransport
+) -> None:
+    # Room for the bodies of two items of 26 bytes, {"id": 1, "name": "item1"}
+    configuration.etag_cache_size = 60
+    api_client = ApiClient(configuration, transport=transport)
+    api = ItemsApi(api_client)
+    for id in (1, 2, 3):
+        api.items_read_item(id)
+    assert api_client.etag_cache_bytes == 52
+    assert [key[0] for key in api_client.etag_cache] == [
+        "http://catalog/item/2/",
+        "http://catalog/item/3/",
+    ]
+    # Responses larger than the cache are not kept
+    api.items_read_all()
+    assert len(api_client.etag_cache) == 2
+
+    configuration.etag_cache_size = 0
+    api.items_read_item(2)
+    assert "if-none-match" not in catalog.requests[-1][2]
@@ -0,0 +1,75 @@
+from typing import List, Tuple
+
+import asyncio
+import json
+
+import pytest
+
+from ds_catalog.aio import ApiClient, ItemsApi
+from ds_catalog.configuration import Configuration
+from ds_catalog.models.item import Item
+
+pytest.importorskip("h2")
+
+from h2.config import H2Configuration  # noqa: E402
+from h2.connection import H2Connection  # noqa: E402
+from h2.events import RequestReceived  # noqa: E402
+
+
+class Server:
+    """HTTP/2 server of cleartext connections with prior knowledge, which
+    answers every request with an item and fails on HTTP/1.1 requests
+    """
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.requests: List[Tuple[bytes, bytes]] = []
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        connection = H2Connection(H2Configuration(client_side=False))
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+        while data := await reader.read(65536):
+            for event in connection.receive_data(data):
+                if isinstance(event, RequestReceived):
+                    headers = dict(event.headers or [])
+                    self.requests.append((headers[b":method"], headers[b":path"]))
+                    body = json.dumps({"id": 1, "name": "item1"}).encode()
+                    connection.send_headers(
+                        event.stream_id,
+                        [
+                            (":status", "200"),
+                            ("content-type", "application/json"),
+                            ("content-length", str(len(body))),
+                        ],
+                    )
+                    connection.send_data(event.stream_id, body, end_stream=True)
+            writer.write(connection.data_to_send())
+            await writer.drain()
+        writer.close()
+
+
+def test_cleartext_prior_knowledge() -> None:
+    server = Server()
+
+    async def main() -> Tuple[List[Item], str]:
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        configuration = Configuration(host=f"http://127.0.0.1:{port}")
+        configuration.http2 = True
+        async with listener, ApiClient(configuration) as api_client:
+            api = ItemsApi(api_client)
+            items = await asyncio.gather(*(api.items_read_item(1) for _ in range(5)))
+            response = await api.items_read_item_without_preload_content(1)
+            await response.aread()
+            return items, response.http_version
+
+    items, http_version = asyncio.run(main())
+    assert items == [Item(id=1, name="item1")] * 5
+    assert http_version == "HTTP/2"
+    # The concurrent requests are multiplexed on one connection
+    assert server.connections == 1
+    assert server.requests == [(b"GET", b"/item/1/")] * 6
@@ -0,0 +1,255 @@
+from typing import Sequence
+
+import asyncio
+import bisect
+import hashlib
+
+import httpx
+from fastapi import HTTPException, Request, Response, status
+
+from .settings import Settings
+
+# Header of the requests between nodes, which are served from the partition
+# of the node that receives them, without forwarding them again
+PARTITION_HEADER = "X-Catalog-Partition"
+# Header of the responses forwarded from the node owning the item
+OWNER_HEADER = "X-Catalog-Owner"
+
+VIRTUAL_NODES = 64
+REQUEST_TIMEOUT = 10.0
+
+# Headers of a single connection, not forwarded between nodes
+HOP_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "host",
+    "keep-alive",
+    "transfer-encoding",
+    "upgrade",
+}
+
+
+async def send_request(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    params: Sequence[tuple[str, str]] = (),
+    headers: Sequence[tuple[str, str]] = (),
+    content: bytes | None = None,
+) -> httpx.Response:
+    """Send a request to another node, which answers with Bad Gateway if it
+    is unavailable
+    """
+    try:
+        return await client.request(
+            method,
+            url,
+            params=list(params),
+            headers=[
+                (name, value)
+                for name, value in headers
+                if name.lower() not in HOP_HEADERS
+            ],
+            content=content,
+        )
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Node {url} is unavailable: {e}",
+        )
+
+
+async def forward_request(
+    client: httpx.AsyncClient,
+    request: Request,
+    node: str,
+    headers: Sequence[tuple[str, str]] = (),
+) -> Response:
+    """Return the response of another node to a request, with `headers`"""
+    response = await send_request(
+        client,
+        request.method,
+        node + request.url.path,
+        request.query_params.multi_items(),
+        [*request.headers.items(), *headers],
+        await request.body(),
+    )
+    return Response(
+        response.content,
+        response.status_code,
+        {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in HOP_HEADERS
+        },
+    )
+
+
+def ring_hash(value: bytes) -> int:
+    """Position of a value on the hash ring, the same in every process
+
+    >>> ring_hash(b"1")
+    17797172410793473910
+    """
+    return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hashing of item ids to the nodes of a cluster.
+
+    Every node is placed at `virtual_nodes` points of the ring, and a key
+    belongs to the node of the first point at or after its hash. A node
+    added to or removed from the ring only takes or gives away the keys of
+    its own points, about one in the number of nodes.
+
+    >>> ring = HashRing(["http://a", "http://b"])
+    >>> ring.owner(1) == ring.owner(1) and ring.owner(1) in ring.nodes
+    True
+
+    :param nodes: URLs of the nodes
+    :param virtual_nodes: points of every node on the ring
+    """
+
+    def __init__(
+        self, nodes: Sequence[str], virtual_nodes: int = VIRTUAL_NODES
+    ) -> None:
+        if not nodes:
+            raise ValueError("A hash ring needs at least one node")
+        self.nodes = list(nodes)
+        points = sorted(
+            (ring_hash(f"{node}#{index}".encode()), node)
+            for node in self.nodes
+            for index in range(virtual_nodes)
+        )
+        self.hashes = [hash for hash, _ in points]
+        self.owners = [node for _, node in points]
+
+    def owner(self, key: int) -> str:
+        """Return the node owning `key`"""
+        index = bisect.bisect_left(self.hashes, ring_hash(str(key).encode()))
+        return self.owners[index % len(self.owners)]
+
+
+class Cluster:
+    """Nodes serving partitions of the catalog, and the client of the
+    requests between them.
+
+    :param node: URL of this node, one of `nodes`
+    :param nodes: URLs of all the nodes
+    :param virtual_nodes: points of every node on the hash ring
+    :param forward: whether requests for items of other nodes are forwarded
+        to them, or redirected
+    :param client: client of the other nodes, created if not given
+    """
+
+    def __init__(
+        self,
+        node: str,
+        nodes: Sequence[str],
+        virtual_nodes: int = VIRTUAL_NODES,
+        forward: bool = True,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        if node not in nodes:
+            raise ValueError(f"The node {node} is not one of the cluster nodes")
+        if client is None:
+            client = httpx.AsyncClient(timeout=REQUEST_TIMEOUT)
+        self.node = node
+        self.ring = HashRing(nodes, virtual_nodes)
+        self.forward = forward
+        self.client = client
+
+    @property
+    def nodes(self) -> list[str]:
+        return self.ring.nodes
+
+    def owner(self, key: int) -> str:
+        return self.ring.owner(key)
+
+    def partition(self, keys: Sequence[int]) -> dict[str, list[int]]:
+        """Return the indexes of `keys` by the node owning them, in order"""
+        indexes: dict[str, list[int]] = {}
+        for index, key in enumerate(keys):
+            indexes.setdefault(self.owner(key), []).append(index)
+        return indexes
+
+    async def send(
+        self,
+        node: str,
+        method: str,
+        path: str,
+        params: Sequence[tuple[str, str]] = (),
+        headers: Sequence[tuple[str, str]] = (),
+        content: bytes | None = None,
+    ) -> httpx.Response:
+        """Send a request to the partition of `node`"""
+        return await send_request(
+            self.client,
+            method,
+            node + path,
+            params,
+            [*headers, (PARTITION_HEADER, self.node)],
+            content,
+        )
+
+    async def call(
+        self,
+        node: str,
+        method: str,
+        path: str,
+        params: Sequence[tuple[str, str]] = (),
+        headers: Sequence[tuple[str, str]] = (),
+        content: bytes | None = None,
+    ) -> httpx.Response:
+        """Send a request to the partition of `node`, which has to succeed"""
+        response = await self.send(node, method, path, params, headers, content)
+        if response.status_code != status.HTTP_200_OK:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"Node {node} failed with {response.status_code}",
+            )
+        return response
+
+    async def gather(
+        self, method: str, path: str, params: Sequence[tuple[str, str]] = ()
+    ) -> dict[str, httpx.Response]:
+        """Send a request to the partitions of the other nodes at once"""
+        nodes = [node for node in self.nodes if node != self.node]
+        responses = await asyncio.gather(
+            *(self.call(node, method, path, params) for node in nodes)
+        )
+        return dict(zip(nodes, responses))
+
+    async def route(self, request: Request, node: str) -> Response:
+        """Forward a request to the node owning its item, or redirect the
+        client to it
+        """
+        if not self.forward:
+            location = node + request.url.path
+            if request.url.query:
+                location += "?" + request.url.query
+            return Response(
+                status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+                headers={"Location": location, OWNER_HEADER: node},
+            )
+        response = await forward_request(
+            self.client, request, node, [(PARTITION_HEADER, self.node)]
+        )
+        response.headers[OWNER_HEADER] = node
+        return response
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def create_cluster(settings: Settings) -> Cluster | None:
+    """Create the cluster of the settings, None for a single node"""
+    if not settings.cluster_nodes:
+        return None
+    return Cluster(
+        settings.cluster_node,
+        settings.cluster_nodes,
+        settings.cluster_virtual_nodes,
+        settings.cluster_forward,
+    )
@@ -6,71 +6,805 @@
 # https://gitlab.com/companionlabs-opensource/classy-fastapi
 
 
-from typing import Optional
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, TypeVar
 
+import asyncio
+import base64
+import binascii
+import heapq
+import json
 from enum import Enum
+from itertools import islice
+from operator import attrgetter
 
 from classy_fastapi import Routable, delete, get, post, put
-from fastapi import HTTPException, status
-from pydantic import BaseModel
+from fastapi import Header, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError, WithJsonSchema
+
+from .cluster import PARTITION_HEADER, Cluster
+from .models import Item, ItemChange
+from .replication import Follower
+from .responses import PydanticJSONResponse
+from .search import SearchIndex
+from .storage import (
+    AsyncStorage,
+    AsyncStorageAdapter,
+    SingleFlightStorage,
+    Storage,
+)
 
 TAGS: list[str | Enum] = ["items"]
 
+MAX_PAGE_LIMIT = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+IF_MATCH_HEADER = "If-Match"
+
+ETAG_HEADER_SCHEMA = {
+    "description": "Version of the response, sent back in If-None-Match",
+    "schema": {"type": "string"},
+}
+NOT_MODIFIED_RESPONSE = {
+    "description": "Not modified since the version sent in If-None-Match",
+    "headers": {ETAG_HEADER: ETAG_HEADER_SCHEMA},
+}
+PRECONDITION_FAILED_RESPONSE = {
+    "description": "The item does not have the version sent in If-Match",
+}
+
+# Longest wait for a change in seconds, and the interval at which the
+# storage is read again while waiting, to see changes of other processes
+MAX_CHANGES_WAIT = 60.0
+CHANGES_POLL_INTERVAL = 1.0
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_BATCH_SIZE = 1000
+# Changes applied to the search index per storage call
+SEARCH_INDEX_BATCH_SIZE = 10000
+
+# Orders of the items of a listing, by id or by name
+ITEM_ID = attrgetter("id")
+ITEM_NAME_ID = attrgetter("name", "id")
+
+# Optional query parameters are documented without the `null` alternative,
+# the client generator turns OpenAPI 3.1 nullable unions into models
+PageLimit = Annotated[
+    int | None,
+    Query(ge=1, le=MAX_PAGE_LIMIT),
+    WithJsonSchema({"type": "integer", "minimum": 1, "maximum": MAX_PAGE_LIMIT}),
+]
+PageCursor = Annotated[str | None, WithJsonSchema({"type": "string"})]
+NameFilter = Annotated[
+    str | None,
+    Query(description="Exact name of the items"),
+    WithJsonSchema({"type": "string"}),
+]
+NamePrefixFilter = Annotated[
+    str | None,
+    Query(description="Prefix of the item names, items are sorted by name"),
+    WithJsonSchema({"type": "string"}),
+]
+
+SearchQuery = Annotated[
+    str, Query(description="Words to search for in the text fields of items")
+]
+
+ChangesSince = Annotated[
+    int | None,
+    Query(
+        ge=0,
+        description="Catalog version to read the changes after, "
+        "only the current version is returned if omitted",
+    ),
+    WithJsonSchema({"type": "integer", "minimum": 0}),
+]
+ChangesWait = Annotated[
+    float,
+    Query(
+        ge=0,
+        le=MAX_CHANGES_WAIT,
+        description="Seconds to wait for a change if there is none yet",
+    ),
+]
+
+IfMatch = Annotated[
+    str | None,
+    Header(
+        alias=IF_MATCH_HEADER,
+        description="ETag of the item read before the change, "
+        "the item is only changed if it still has this version",
+    ),
+    WithJsonSchema({"type": "string"}),
+]
+
+T = TypeVar("T")
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of a bulk operation for a single item"""
 
-class Item(BaseModel):
     id: int
-    name: str
+    status: int
+    detail: Annotated[str | None, WithJsonSchema({"type": "string"})] = None
 
     model_config = {
         "json_schema_extra": {
             "examples": [
                 {
                     "id": 1,
-                    "name": "test name",
+                    "status": 201,
                 }
             ]
         }
     }
 
 
-class Storage:
-    def __init__(self, initial: Optional[dict[int, Item]] = None) -> None:
-        self.kvs: dict[int, Item] = initial if initial is not None else {}
+class ItemChanges(BaseModel):
+    """Changes of the catalog after a version"""
+
+    changes: list[ItemChange]
+    # Catalog version to read the next changes after
+    version: int
+
+
+def bulk_request_body(name: str, schema: dict[str, Any]) -> dict[str, Any]:
+    """OpenAPI request body of a bulk operation on `schema` elements"""
+    return {
+        "x-codegen-request-body-name": name,
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": schema}},
+                NDJSON_MEDIA_TYPE: {"schema": schema},
+            },
+        },
+    }
+
+
+def parse_bulk_body(
+    body: bytes, content_type: str | None, adapter: TypeAdapter[list[T]]
+) -> list[T]:
+    """Parse a JSON array or a newline-delimited JSON request body.
+
+    The errors of a JSON array are located by the index of the element, the
+    errors of newline-delimited JSON by the number of the line, from 1.
+    """
+    lines: list[tuple[int, bytes]] | None = None
+    if content_type is not None and content_type.startswith(NDJSON_MEDIA_TYPE):
+        lines = [
+            (number, line)
+            for number, line in enumerate(body.splitlines(), 1)
+            if line.strip()
+        ]
+        body = b"[" + b",".join(line for _, line in lines) + b"]"
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        errors = list(e.errors()) if lines is None else ndjson_errors(lines, adapter)
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in errors]
+        )
+
+
+def ndjson_errors(
+    lines: list[tuple[int, bytes]], adapter: TypeAdapter[list[T]]
+) -> list[Any]:
+    """Validation errors of the numbered lines of a newline-delimited JSON
+    body, located by the number of the line instead of the index of the
+    element
+    """
+    errors: list[Any] = []
+    for number, line in lines:
+        try:
+            adapter.validate_json(b"[" + line + b"]")
+        except ValidationError as e:
+            errors.extend(
+                {**error, "loc": (number, *error["loc"][1:])} for error in e.errors()
+            )
+    return errors
+
+
+def make_etag(version: int) -> str:
+    """Strong entity tag of a response generated at a storage version"""
+    return f'"{version}"'
+
+
+def make_cluster_etag(etags: list[str]) -> str:
+    """Strong entity tag of a response merged from the responses of the
+    nodes of a cluster, with their entity tags
+
+    >>> make_cluster_etag(['"3"', '"5"'])
+    '"3.5"'
+    """
+    return '"' + ".".join(etag.strip('"') for etag in etags) + '"'
 
-    def has(self, key: int) -> bool:
-        return key in self.kvs
 
-    def set(self, key: int, value: Item) -> None:
-        self.kvs[key] = value
+def etag_matches(header: str | None, etag: str, weak: bool = True) -> bool:
+    """Whether an If-None-Match or If-Match header matches an entity tag.
 
-    def get(self, key: int) -> Item | None:
-        return self.kvs.get(key)
+    If-None-Match is evaluated with the weak comparison, If-Match with the
+    strong comparison, where weak tags never match.
 
-    def all(self) -> list[Item]:
-        return list(self.kvs.values())
+    >>> etag_matches('W/"1", "2"', '"1"')
+    True
+    >>> etag_matches('W/"1", "2"', '"1"', weak=False)
+    False
+    >>> etag_matches('"2"', '"1"')
+    False
+    """
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in header.split(","))
+    if weak:
+        tags = (tag.removeprefix("W/") for tag in tags)
+    return etag in tags
 
-    def delete(self, key: int) -> None:
-        self.kvs.pop(key)
 
-    def clear(self) -> None:
-        self.kvs = {}
+ITEMS_ADAPTER = TypeAdapter(list[Item])
+IDS_ADAPTER = TypeAdapter(list[int])
+BULK_RESULTS_ADAPTER = TypeAdapter(list[BulkItemResult])
+CHANGES_ADAPTER = TypeAdapter(ItemChanges)
+
+
+def items_response(items: list[Item], response: Response) -> Response:
+    """Return items serialized by their compiled serializer, with the headers
+    set on the `response` of the route
+    """
+    return PydanticJSONResponse(items, ITEMS_ADAPTER, headers=response.headers)
+
+
+def encode_cursor(key: int) -> str:
+    """Encode the last key of a page as an opaque continuation token"""
+    return base64.urlsafe_b64encode(str(key).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a continuation token produced by `encode_cursor`"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def encode_position_cursor(position: tuple[Any, int]) -> str:
+    """Encode the last (sort value, key) of a page as an opaque continuation
+    token
+    """
+    encoded = json.dumps(position).encode()
+    return base64.urlsafe_b64encode(encoded).decode().rstrip("=")
+
+
+def decode_position_cursor(cursor: str, value_type: type[T]) -> tuple[T, int]:
+    """Decode a continuation token produced by `encode_position_cursor`"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        value, key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(value, value_type) or type(key) is not int:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return value, key
+
+
+def page_cursor(item: Item, by_name: bool) -> str:
+    """Encode the continuation token after the last item of a page, sorted
+    by name or by id
+    """
+    return (
+        encode_position_cursor((item.name, item.id))
+        if by_name
+        else encode_cursor(item.id)
+    )
 
 
 class ItemRoutes(Routable):
-    def __init__(self, storage: Storage) -> None:
+    """Routes of the items of a storage.
+
+    In a cluster, the storage holds the partition of the node: requests for
+    an item of another node are routed to it, listings and bulk operations
+    are spread over the partitions of all the nodes. Search and the change
+    feed are only served from the partition of a node: their rankings and
+    versions are those of the partition, so they are refused to requests
+    without the partition header. On a follower, the
+    storage holds the copy of the catalog of the primary: writes are
+    forwarded to the primary, and so are reads while the copy is too far
+    behind it.
+    """
+
+    def __init__(
+        self,
+        storage: Storage | AsyncStorage,
+        cluster: Cluster | None = None,
+        follower: Follower | None = None,
+    ) -> None:
         super().__init__()
-        self.__storage = storage
+        self.__cluster = cluster
+        self.__follower = follower
+        if isinstance(storage, Storage):
+            storage = AsyncStorageAdapter(storage)
+        if isinstance(storage, AsyncStorageAdapter):
+            # Reads that do not block return before another read can start,
+            # there is nothing to share
+            shared = storage.storage.blocking and storage.storage.blocking_reads
+        else:
+            shared = True
+        # Concurrent identical reads of the routes share one storage read
+        self.__storage: AsyncStorage = (
+            SingleFlightStorage(storage) if shared else storage
+        )
+        self.__search_index = SearchIndex()
+        # Catalog version of the last change applied to the index, None
+        # until the index is built
+        self.__search_index_version: int | None = None
+        self.__search_index_lock = asyncio.Lock()
+        # Set and replaced on every change, wakes up the readers of changes
+        self.__changed = asyncio.Event()
+        # Catalog version and response body of the last listing of all
+        # items, served again until the catalog changes
+        self.__listing: tuple[int, bytes] | None = None
+
+    async def update_search_index(self) -> None:
+        """Apply the changes of the storage to the search index.
+
+        The index is built from all items on the first call, at startup,
+        and then follows the change feed of the storage, which also has
+        the changes made by other processes. It is built again if the
+        changes since its version are no longer kept.
+        """
+        async with self.__search_index_lock:
+            built = False
+            while True:
+                if self.__search_index_version is None:
+                    version = await self.__storage.catalog_version()
+                    self.__search_index.clear()
+                    async for item in self.__storage.all():
+                        self.__search_index.add(item.id, item)
+                    self.__search_index_version = version
+                    built = True
+                changes = await self.__storage.changes(
+                    self.__search_index_version, SEARCH_INDEX_BATCH_SIZE
+                )
+                if changes is None and not built:
+                    self.__search_index_version = None
+                    continue
+                # The index is built at most once per update, so writers
+                # faster than the change buffer do not keep it rebuilding
+                if not changes:
+                    return
+                for change in changes:
+                    if change.op == "clear":
+                        self.__search_index.clear()
+                    elif change.id is not None and change.item is not None:
+                        self.__search_index.add(change.id, change.item)
+                    elif change.id is not None:
+                        self.__search_index.remove(change.id)
+                self.__search_index_version = changes[-1].version
 
     @get(
         "/item/",
         operation_id="items__read_all",
         summary="Read all items",
         response_model=list[Item],
+        responses={
+            status.HTTP_200_OK: {
+                "headers": {
+                    NEXT_CURSOR_HEADER: {
+                        "description": "Continuation token of the next page",
+                        "schema": {"type": "string"},
+                    },
+                    ETAG_HEADER: ETAG_HEADER_SCHEMA,
+                }
+            },
+            status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE,
+        },
+        openapi_extra={
+            "x-pagination": {
+                "cursor_param": "cursor",
+                "next_cursor_header": NEXT_CURSOR_HEADER,
+            }
+        },
+        tags=TAGS,
+    )
+    async def read_items(
+        self,
+        request: Request,
+        response: Response,
+        limit: PageLimit = None,
+        cursor: PageCursor = None,
+        name: NameFilter = None,
+        name_prefix: NamePrefixFilter = None,
+    ) -> Response:
+        """Read all items or a page of items from the storage"""
+        if name is not None and name_prefix is not None:
+            raise HTTPException(
+                status_code=400, detail="Filter by either name or name_prefix"
+            )
+        if (routed := await self.__route(request)) is not None:
+            return routed
+
+        if (cluster := self.__gathering(request)) is not None:
+            return await self.__read_cluster_items(
+                cluster, request, response, limit, cursor, name, name_prefix
+            )
+
+        # The version is read before the items, so the response is at least
+        # as recent as its tag
+        version = await self.__storage.catalog_version()
+        etag = make_etag(version)
+        if etag_matches(request.headers.get(IF_NONE_MATCH_HEADER), etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag}
+            )
+        response.headers[ETAG_HEADER] = etag
+
+        if limit is None and cursor is None and name is None and name_prefix is None:
+            return Response(
+                await self.__read_listing(version),
+                media_type=JSON_MEDIA_TYPE,
+                headers=response.headers,
+            )
+
+        page = await self.__read_page(limit, cursor, name, name_prefix)
+        if limit is not None and len(page) > limit:
+            page = page[:limit]
+            response.headers[NEXT_CURSOR_HEADER] = page_cursor(
+                page[-1], name_prefix is not None
+            )
+        return items_response(page, response)
+
+    async def __read_listing(self, version: int) -> bytes:
+        """Return the encoded listing of all items, rebuilt if the catalog
+        changed since it was encoded
+        """
+        listing = self.__listing
+        if listing is not None and listing[0] == version:
+            return listing[1]
+        body = b"[" + b",".join(await self.__storage.all_encoded()) + b"]"
+        # Items changed while they were read are newer than the version,
+        # the listing is rebuilt on the next request
+        self.__listing = version, body
+        return body
+
+    async def __read_page(
+        self,
+        limit: int | None,
+        cursor: str | None,
+        name: str | None,
+        name_prefix: str | None,
+    ) -> list[Item]:
+        """Return the items of a page and the first item of the next one"""
+        try:
+            if name_prefix is not None:
+                position = (
+                    decode_position_cursor(cursor, str) if cursor is not None else None
+                )
+                return await self.__storage.find_by_name_prefix(
+                    name_prefix, limit + 1 if limit is not None else None, position
+                )
+            after = decode_cursor(cursor) if cursor is not None else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if name is not None:
+            return await self.__storage.find_by_name(
+                name, limit + 1 if limit is not None else None, after
+            )
+        return await self.__storage.page(
+            limit + 1 if limit is not None else None, after
+        )
+
+    def __gathering(self, request: Request) -> Cluster | None:
+        """Return the cluster whose partitions a request is spread over,
+        None if it is served from the storage of this node
+        """
+        if PARTITION_HEADER in request.headers:
+            return None
+        return self.__cluster
+
+    def __check_partition(self, request: Request, feature: str) -> None:
+        """Refuse a request spread over the partitions of a cluster, for a
+        feature served from the partition of one node
+        """
+        if self.__gathering(request) is not None:
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail=f"{feature} is only served from the partition of a node, "
+                f"with the {PARTITION_HEADER} header",
+            )
+
+    async def __route(
+        self, request: Request, key: int | None = None, write: bool = False
+    ) -> Response | None:
+        """Return the response of the primary to a write or a read of a
+        stale copy, or of the node owning `key` to a request, None if it is
+        served from the storage of this node
+        """
+        follower = self.__follower
+        if follower is not None and (write or follower.stale()):
+            return await follower.forward(request)
+        cluster = self.__gathering(request)
+        if cluster is None or key is None:
+            return None
+        owner = cluster.owner(key)
+        if owner == cluster.node:
+            return None
+        return await cluster.route(request, owner)
+
+    async def __read_cluster_items(
+        self,
+        cluster: Cluster,
+        request: Request,
+        response: Response,
+        limit: int | None,
+        cursor: str | None,
+        name: str | None,
+        name_prefix: str | None,
+    ) -> Response:
+        """Read the items of all the partitions, merged in order.
+
+        Every node reads a page of its partition after the cursor, which is
+        the same for all of them, and the first `limit` items of the pages
+        are returned. The tag of the response has the versions of all the
+        partitions.
+        """
+        page, more, etag = await self.__gather_page(
+            cluster,
+            request.query_params.multi_items(),
+            limit,
+            cursor,
+            name,
+            name_prefix,
+        )
+        if etag_matches(request.headers.get(IF_NONE_MATCH_HEADER), etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag}
+            )
+        response.headers[ETAG_HEADER] = etag
+        if more:
+            response.headers[NEXT_CURSOR_HEADER] = page_cursor(
+                page[-1], name_prefix is not None
+            )
+        return items_response(page, response)
+
+    async def __gather_page(
+        self,
+        cluster: Cluster,
+        params: list[tuple[str, str]],
+        limit: int | None,
+        cursor: str | None,
+        name: str | None = None,
+        name_prefix: str | None = None,
+    ) -> tuple[list[Item], bool, str]:
+        """Return a page of the items of all the partitions, whether items
+        follow it, and the tag of the versions of the partitions
+        """
+        version = await self.__storage.catalog_version()
+        # The page of this partition has the first item of the next page,
+        # the other nodes send a cursor if their partition has more items.
+        # It is read first, an invalid cursor is not sent to the other nodes
+        local = await self.__read_page(limit, cursor, name, name_prefix)
+        remote = await cluster.gather("GET", "/item/", params)
+        pages = {cluster.node: local}
+        etags = {cluster.node: make_etag(version)}
+        more = limit is not None and len(local) > limit
+        for node, node_response in remote.items():
+            pages[node] = ITEMS_ADAPTER.validate_json(node_response.content)
+            etags[node] = node_response.headers[ETAG_HEADER]
+            more = more or NEXT_CURSOR_HEADER in node_response.headers
+        merged = heapq.merge(
+            *pages.values(), key=ITEM_NAME_ID if name_prefix is not None else ITEM_ID
+        )
+        page = list(islice(merged, limit + 1 if limit is not None else None))
+        if limit is not None and len(page) > limit:
+            page = page[:limit]
+            more = True
+        return page, more, make_cluster_etag([etags[node] for node in cluster.nodes])
+
+    @get(
+        "/item/stream",
+        operation_id="items__stream",
+        summary="Stream all items",
+        response_class=StreamingResponse,
+        responses={
+            status.HTTP_200_OK: {
+                "content": {
+                    NDJSON_MEDIA_TYPE: {"schema": {"$ref": "#/components/schemas/Item"}}
+                }
+            }
+        },
+        openapi_extra={"x-ndjson": True},
+        tags=TAGS,
+    )
+    async def stream_items(self, request: Request) -> Response:
+        """Stream all items from the storage as newline-delimited JSON"""
+        if (routed := await self.__route(request)) is not None:
+            return routed
+        return StreamingResponse(
+            self.__stream_items(self.__gathering(request)),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    async def __stream_items(self, cluster: Cluster | None) -> AsyncIterator[bytes]:
+        # Items are read in batches of ascending keys, so memory usage does
+        # not depend on the catalog size and the iteration is not broken by
+        # concurrent writes.
+        after: int | None = None
+        while True:
+            if cluster is None:
+                page = await self.__storage.page(STREAM_BATCH_SIZE, after)
+            else:
+                cursor = encode_cursor(after) if after is not None else None
+                params = [("limit", str(STREAM_BATCH_SIZE))]
+                if cursor is not None:
+                    params.append(("cursor", cursor))
+                page, _, _ = await self.__gather_page(
+                    cluster, params, STREAM_BATCH_SIZE, cursor
+                )
+            if not page:
+                return
+            yield b"".join(item.model_dump_json().encode() + b"\n" for item in page)
+            after = page[-1].id
+
+    @get("/item/snapshot", include_in_schema=False)
+    async def read_snapshot(self) -> StreamingResponse:
+        """Stream all items with their versions as newline-delimited JSON
+        changes, for the followers of this node. The tag of the response is
+        the catalog version read before the items, the changes after it
+        complete the snapshot.
+        """
+        version = await self.__storage.catalog_version()
+        return StreamingResponse(
+            self.__stream_snapshot(),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={ETAG_HEADER: make_etag(version)},
+        )
+
+    async def __stream_snapshot(self) -> AsyncIterator[bytes]:
+        after: int | None = None
+        while page := await self.__storage.page_versioned(STREAM_BATCH_SIZE, after):
+            yield b"".join(
+                ItemChange(version=version, op="set", id=item.id, item=item)
+                .model_dump_json()
+                .encode()
+                + b"\n"
+                for item, version in page
+            )
+            after = page[-1][0].id
+
+    @get(
+        "/item/changes",
+        operation_id="items__read_changes",
+        summary="Read changes of items",
+        response_model=ItemChanges,
+        responses={
+            status.HTTP_410_GONE: {
+                "description": "Changes after the version are no longer kept, "
+                "all items have to be read again"
+            }
+        },
+        openapi_extra={
+            "x-change-feed": {
+                "since_param": "since",
+                "wait_param": "wait",
+                "default_wait": int(MAX_CHANGES_WAIT / 2),
+                "changes_field": "changes",
+                "version_field": "version",
+                "change_model": "ItemChange",
+                "change_module": "item_change",
+            }
+        },
+        tags=TAGS,
+    )
+    async def read_changes(
+        self,
+        request: Request,
+        since: ChangesSince = None,
+        limit: PageLimit = None,
+        wait: ChangesWait = 0,
+    ) -> Response:
+        """Read the changes made after a catalog version, in order.
+
+        Waits up to `wait` seconds for a change if there is none, so that
+        readers follow the catalog with one pending request. The version of
+        the response is the `since` of the next request.
+        """
+        self.__check_partition(request, "The change feed")
+        if since is None:
+            return PydanticJSONResponse(
+                ItemChanges(changes=[], version=await self.__storage.catalog_version()),
+                CHANGES_ADAPTER,
+            )
+        limit = limit if limit is not None else MAX_PAGE_LIMIT
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        while True:
+            # Taken before the read, a change made after it sets this event
+            changed = self.__changed
+            changes = await self.__storage.changes(since, limit)
+            if changes is None:
+                raise HTTPException(
+                    status_code=status.HTTP_410_GONE,
+                    detail="Changes are no longer available",
+                )
+            remaining = deadline - loop.time()
+            if changes or remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(
+                    changed.wait(), min(remaining, CHANGES_POLL_INTERVAL)
+                )
+            except asyncio.TimeoutError:
+                pass
+        return PydanticJSONResponse(
+            ItemChanges(
+                changes=changes, version=changes[-1].version if changes else since
+            ),
+            CHANGES_ADAPTER,
+        )
+
+    def __notify_changes(self) -> None:
+        self.__changed.set()
+        self.__changed = asyncio.Event()
+
+    @get(
+        "/item/search",
+        operation_id="items__search",
+        summary="Search items",
+        response_model=list[Item],
+        responses={
+            status.HTTP_200_OK: {
+                "headers": {
+                    NEXT_CURSOR_HEADER: {
+                        "description": "Continuation token of the next page",
+                        "schema": {"type": "string"},
+                    }
+                }
+            }
+        },
+        openapi_extra={
+            "x-pagination": {
+                "cursor_param": "cursor",
+                "next_cursor_header": NEXT_CURSOR_HEADER,
+            }
+        },
         tags=TAGS,
     )
-    async def read_items(self) -> list[Item]:
-        """Read all items from the storage"""
-        return self.__storage.all()
+    async def search_items(
+        self,
+        request: Request,
+        response: Response,
+        q: SearchQuery,
+        limit: PageLimit = None,
+        cursor: PageCursor = None,
+    ) -> Response:
+        """Search items by words, ranked by relevance"""
+        if (routed := await self.__route(request)) is not None:
+            return routed
+        self.__check_partition(request, "Search")
+        try:
+            after = (
+                decode_position_cursor(cursor, float) if cursor is not None else None
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        await self.update_search_index()
+        results = self.__search_index.search(
+            q, limit + 1 if limit is not None else None, after
+        )
+        if limit is not None and len(results) > limit:
+            results = results[:limit]
+            response.headers[NEXT_CURSOR_HEADER] = encode_position_cursor(results[-1])
+        items = await self.__storage.get_many(key for _, key in results)
+        return items_response(
+            [items[key] for _, key in results if key in items], response
+        )
 
     @post(
         "/item/",
@@ -80,39 +814,279 @@ class ItemRoutes(Routable):
         status_code=status.HTTP_201_CREATED,
         tags=TAGS,
     )
-    async def create_item(self, item: Item) -> Item:
+    async def create_item(self, item: Item, request: Request) -> Item | Response:
         """Create a new item in the storage"""
-        if self.__storage.has(item.id):
+        if (routed := await self.__route(request, item.id, write=True)) is not None:
+            return routed
+        if await self.__storage.compare_and_set(item.id, item, None) is None:
             raise HTTPException(status_code=400, detail="Item already exists")
-        self.__storage.set(item.id, item)
+        self.__notify_changes()
         return item
 
+    @post(
+        "/item/bulk",
+        operation_id="items__bulk_create",
+        summary="Create items",
+        response_model=list[BulkItemResult],
+        openapi_extra=bulk_request_body("items", {"$ref": "#/components/schemas/Item"}),
+        tags=TAGS,
+    )
+    async def bulk_create_items(self, request: Request) -> Response:
+        """Create new items in the storage, existing items are left untouched"""
+        if (routed := await self.__route(request, write=True)) is not None:
+            return routed
+        values = parse_bulk_body(
+            await request.body(), request.headers.get("content-type"), ITEMS_ADAPTER
+        )
+        return await self.__apply_bulk(
+            request,
+            values,
+            [item.id for item in values],
+            ITEMS_ADAPTER,
+            self.__bulk_create_items,
+        )
+
+    async def __bulk_create_items(self, values: list[Item]) -> list[BulkItemResult]:
+        # The first item of an id is created, the storage checks and sets the
+        # items at once so concurrent writers do not overwrite each other
+        new: dict[int, Item] = {}
+        for item in values:
+            new.setdefault(item.id, item)
+        created = await self.__storage.create_many(new)
+        results = []
+        for item in values:
+            if item.id in created:
+                created.discard(item.id)
+                results.append(
+                    BulkItemResult(id=item.id, status=status.HTTP_201_CREATED)
+                )
+            else:
+                results.append(
+                    BulkItemResult(
+                        id=item.id,
+                        status=status.HTTP_400_BAD_REQUEST,
+                        detail="Item already exists",
+                    )
+                )
+        return results
+
+    @put(
+        "/item/bulk",
+        operation_id="items__bulk_upsert",
+        summary="Create or update items",
+        response_model=list[BulkItemResult],
+        openapi_extra=bulk_request_body("items", {"$ref": "#/components/schemas/Item"}),
+        tags=TAGS,
+    )
+    async def bulk_upsert_items(self, request: Request) -> Response:
+        """Create new items and update existing items in the storage, whatever
+        their versions. Bulk writes do not take If-Match, the last write wins.
+        """
+        if (routed := await self.__route(request, write=True)) is not None:
+            return routed
+        values = parse_bulk_body(
+            await request.body(), request.headers.get("content-type"), ITEMS_ADAPTER
+        )
+        return await self.__apply_bulk(
+            request,
+            values,
+            [item.id for item in values],
+            ITEMS_ADAPTER,
+            self.__bulk_upsert_items,
+        )
+
+    async def __bulk_upsert_items(self, values: list[Item]) -> list[BulkItemResult]:
+        # The last item of an id is stored, the first one reports its creation
+        created = await self.__storage.upsert_many({item.id: item for item in values})
+        results = []
+        for item in values:
+            if item.id in created:
+                created.discard(item.id)
+                results.append(
+                    BulkItemResult(id=item.id, status=status.HTTP_201_CREATED)
+                )
+            else:
+                results.append(BulkItemResult(id=item.id, status=status.HTTP_200_OK))
+        return results
+
+    @delete(
+        "/item/bulk",
+        operation_id="items__bulk_delete",
+        summary="Delete items",
+        response_model=list[BulkItemResult],
+        openapi_extra=bulk_request_body("ids", {"type": "integer"}),
+        tags=TAGS,
+    )
+    async def bulk_delete_items(self, request: Request) -> Response:
+        """Delete items with the given ids from the storage, whatever their
+        versions. Bulk writes do not take If-Match, the last write wins.
+        """
+        if (routed := await self.__route(request, write=True)) is not None:
+            return routed
+        ids = parse_bulk_body(
+            await request.body(), request.headers.get("content-type"), IDS_ADAPTER
+        )
+        return await self.__apply_bulk(
+            request, ids, ids, IDS_ADAPTER, self.__bulk_delete_items
+        )
+
+    async def __bulk_delete_items(self, ids: list[int]) -> list[BulkItemResult]:
+        deleted = await self.__storage.discard_many(ids)
+        results = []
+        for id in ids:
+            if id in deleted:
+                deleted.discard(id)
+                results.append(BulkItemResult(id=id, status=status.HTTP_204_NO_CONTENT))
+            else:
+                results.append(
+                    BulkItemResult(
+                        id=id,
+                        status=status.HTTP_404_NOT_FOUND,
+                        detail="Item not found",
+                    )
+                )
+        return results
+
+    async def __apply_bulk(
+        self,
+        request: Request,
+        values: list[T],
+        keys: list[int],
+        adapter: TypeAdapter[list[T]],
+        apply: Callable[[list[T]], Awaitable[list[BulkItemResult]]],
+    ) -> Response:
+        """Apply a bulk operation to the values of the storage, and send the
+        values of the other partitions to their nodes, with the results in
+        the order of the values
+        """
+        # Items are written at new versions whatever their current ones, a
+        # condition on one version cannot apply to the whole batch
+        if IF_MATCH_HEADER in request.headers:
+            raise HTTPException(
+                status_code=400, detail="Bulk writes do not support If-Match"
+            )
+        cluster = self.__gathering(request)
+        if cluster is None:
+            results = await apply(values)
+        else:
+            node_results: dict[int, BulkItemResult] = {}
+
+            async def apply_partition(node: str, indexes: list[int]) -> None:
+                part = [values[index] for index in indexes]
+                if node == cluster.node:
+                    part_results = await apply(part)
+                else:
+                    node_response = await cluster.call(
+                        node,
+                        request.method,
+                        request.url.path,
+                        headers=[("content-type", JSON_MEDIA_TYPE)],
+                        content=adapter.dump_json(part),
+                    )
+                    part_results = BULK_RESULTS_ADAPTER.validate_json(
+                        node_response.content
+                    )
+                node_results.update(zip(indexes, part_results))
+
+            # Every item of a partition is applied by its node, the items of
+            # a key keep their order
+            await asyncio.gather(
+                *(
+                    apply_partition(node, indexes)
+                    for node, indexes in cluster.partition(keys).items()
+                )
+            )
+            results = [node_results[index] for index in range(len(values))]
+        self.__notify_changes()
+        return PydanticJSONResponse(results, BULK_RESULTS_ADAPTER)
+
     @get(
         "/item/{id}/",
         operation_id="items__read_item",
         summary="Read an item",
         response_model=Item,
+        responses={
+            status.HTTP_200_OK: {"headers": {ETAG_HEADER: ETAG_HEADER_SCHEMA}},
+            status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE,
+        },
         tags=TAGS,
     )
-    async def read_item(self, id: int) -> Item | None:
+    async def read_item(
+        self, id: int, request: Request, response: Response
+    ) -> Response:
         """Read item from the storage"""
-        item = self.__storage.get(id)
-        if item is None:
+        if (routed := await self.__route(request, id)) is not None:
+            return routed
+        encoded = await self.__storage.get_encoded(id)
+        if encoded is None:
             raise HTTPException(status_code=404, detail="Item not found")
-        return item
+        body, version = encoded
+        etag = make_etag(version)
+        if etag_matches(request.headers.get(IF_NONE_MATCH_HEADER), etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag}
+            )
+        response.headers[ETAG_HEADER] = etag
+        return Response(body, media_type=JSON_MEDIA_TYPE, headers=response.headers)
+
+    async def __read_version(self, id: int, if_match: str | None) -> int:
+        """Return the version of the item to change, checked against the
+        If-Match header
+        """
+        versioned = await self.__storage.get_versioned(id)
+        if versioned is None:
+            if if_match is not None:
+                raise HTTPException(
+                    status_code=status.HTTP_412_PRECONDITION_FAILED,
+                    detail="Item not found",
+                )
+            raise HTTPException(status_code=404, detail="Item not found")
+        _, version = versioned
+        if if_match is not None and not etag_matches(
+            if_match, make_etag(version), weak=False
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Item has changed",
+            )
+        return version
 
     @put(
         "/item/{id}/",
         operation_id="items__update_item",
         summary="Update an item",
         response_model=Item,
+        responses={
+            status.HTTP_200_OK: {"headers": {ETAG_HEADER: ETAG_HEADER_SCHEMA}},
+            status.HTTP_412_PRECONDITION_FAILED: PRECONDITION_FAILED_RESPONSE,
+        },
         tags=TAGS,
     )
-    async def update_item(self, id: int, item: Item) -> Item:
+    async def update_item(
+        self,
+        id: int,
+        item: Item,
+        request: Request,
+        response: Response,
+        if_match: IfMatch = None,
+    ) -> Item | Response:
         """Update an item in the storage"""
-        if not self.__storage.has(id):
-            raise HTTPException(status_code=404, detail="Item not found")
-        self.__storage.set(item.id, item)
+        if (routed := await self.__route(request, id, write=True)) is not None:
+            return routed
+        # The item is set only if it has the version that was checked, an
+        # item changed in the meantime is checked again
+        while True:
+            version: int | None = await self.__read_version(id, if_match)
+            if item.id != id:
+                # The item of the path is checked, the item is set under its
+                # own id
+                versioned = await self.__storage.get_versioned(item.id)
+                version = None if versioned is None else versioned[1]
+            new_version = await self.__storage.compare_and_set(item.id, item, version)
+            if new_version is not None:
+                break
+        self.__notify_changes()
+        response.headers[ETAG_HEADER] = make_etag(new_version)
         return item
 
     @delete(
@@ -121,15 +1095,20 @@ class ItemRoutes(Routable):
         summary="Delete an item",
         status_code=status.HTTP_204_NO_CONTENT,
         response_model=None,
+        responses={
+            status.HTTP_412_PRECONDITION_FAILED: PRECONDITION_FAILED_RESPONSE,
+        },
         tags=TAGS,
     )
-    async def delete_item(self, id: int) -> None:
+    async def delete_item(
+        self, id: int, request: Request, if_match: IfMatch = None
+    ) -> Response | None:
         """Delete an item from the storage"""
-        if not self.__storage.has(id):
-            raise HTTPException(status_code=404, detail="Item not found")
-        self.__storage.delete(id)
-        return
-
-
-storage = Storage()
-routes = ItemRoutes(storage)
+        if (routed := await self.__route(request, id, write=True)) is not None:
+            return routed
+        while True:
+            version = await self.__read_version(id, if_match)
+            if await self.__storage.compare_and_delete(id, version):
+                break
+        self.__notify_changes()
+        return None
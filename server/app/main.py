@@ -1,10 +1,18 @@
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict
+
+import asyncio
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from . import example, items
+from .cluster import create_cluster
+from .replication import create_follower
+from .responses import PydanticJSONResponse
+from .settings import Settings
+from .storage import AsyncStorageAdapter, create_storage
 
 
 class CustomFastAPI(FastAPI):
@@ -32,11 +40,36 @@ class CustomFastAPI(FastAPI):
         return self.openapi_schema
 
 
-app = CustomFastAPI()
+settings = Settings()
+storage = AsyncStorageAdapter(
+    create_storage(settings), max_workers=settings.storage_max_workers
+)
+
+
+cluster = create_cluster(settings)
+follower = create_follower(settings, storage.storage)
+item_routes = items.ItemRoutes(storage, cluster, follower)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await item_routes.update_search_index()
+    replication = asyncio.create_task(follower.run()) if follower else None
+    yield
+    if replication is not None:
+        replication.cancel()
+    if follower is not None:
+        await follower.close()
+    if cluster is not None:
+        await cluster.close()
+    await storage.close()
+
+
+app = CustomFastAPI(lifespan=lifespan, default_response_class=PydanticJSONResponse)
 
 
 Instrumentator().instrument(app).expose(app)
 
 
 app.include_router(example.router)
-app.include_router(items.routes.router)
+app.include_router(item_routes.router)
@@ -0,0 +1,46 @@
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, WithJsonSchema
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "id": 1,
+                    "name": "test name",
+                }
+            ]
+        }
+    }
+
+
+class ItemChange(BaseModel):
+    """A change of the catalog: an item set or deleted, or all items deleted"""
+
+    # Catalog version after the change
+    version: int
+    op: Literal["set", "delete", "clear"]
+    # Key of the item, none for "clear"
+    id: Annotated[int | None, WithJsonSchema({"type": "integer"})] = None
+    # New value of the item, only for "set"
+    item: Annotated[
+        Item | None, WithJsonSchema({"$ref": "#/components/schemas/Item"})
+    ] = None
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "version": 2,
+                    "op": "set",
+                    "id": 1,
+                    "item": {"id": 1, "name": "test name"},
+                }
+            ]
+        }
+    }
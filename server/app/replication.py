@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import math
+import time
+
+import httpx
+from fastapi import Request, Response, status
+from prometheus_client import Gauge
+from pydantic import TypeAdapter
+
+from .cluster import REQUEST_TIMEOUT, forward_request
+from .models import ItemChange
+from .settings import Settings
+from .storage import ReplicaStorage, Storage
+
+logger = logging.getLogger(__name__)
+
+# Changes read per request, and the seconds a request waits for a change
+# when the copy has all the changes of the primary
+CHANGES_LIMIT = 1000
+CHANGES_WAIT = 1.0
+# Seconds between attempts to reach an unavailable primary
+RETRY_INTERVAL = 1.0
+# Seconds the copy of a follower may be behind the primary before its reads
+# are forwarded to the primary
+MAX_LAG = 5.0
+
+REPLICATION_LAG = Gauge(
+    "catalog_replication_lag_seconds",
+    "Seconds since the follower last had all the changes of the primary",
+)
+
+CHANGE_ADAPTER = TypeAdapter(ItemChange)
+CHANGES_ADAPTER = TypeAdapter(list[ItemChange])
+
+
+class Follower:
+    """Replication of the catalog of a primary node to a `ReplicaStorage`.
+
+    The follower loads the items of the primary with their versions from
+    `/item/snapshot`, then follows `/item/changes` with one pending request,
+    which the primary answers as soon as it has a change, and loads the
+    items again if the changes it missed are no longer kept.
+
+    The lag is the time since the follower last had all the changes of the
+    primary: idle, it is up to `CHANGES_WAIT`. Reads are forwarded to the
+    primary while the lag is over `max_lag`, so their staleness is bounded,
+    and writes always are.
+
+    :param primary: URL of the primary node
+    :param storage: copy of the catalog
+    :param max_lag: lag in seconds after which reads go to the primary
+    :param client: client of the primary, created if not given
+    """
+
+    def __init__(
+        self,
+        primary: str,
+        storage: ReplicaStorage,
+        max_lag: float = MAX_LAG,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        if client is None:
+            client = httpx.AsyncClient(timeout=REQUEST_TIMEOUT)
+        self.primary = primary
+        self.storage = storage
+        self.max_lag = max_lag
+        self.client = client
+        # Catalog version of the copy, None until the items are loaded
+        self.version: int | None = None
+        # Monotonic time at which the copy had all the changes of the primary
+        self.synced_at: float | None = None
+
+    def lag(self) -> float:
+        """Return the seconds since the copy had all the changes of the
+        primary, infinite until it is loaded
+        """
+        if self.synced_at is None:
+            return math.inf
+        return time.monotonic() - self.synced_at
+
+    def stale(self) -> bool:
+        return self.lag() > self.max_lag
+
+    async def run(self) -> None:
+        """Replicate the changes of the primary until cancelled"""
+        while True:
+            try:
+                await self.sync()
+            # Invalid responses are validation errors, which are value errors
+            except (httpx.HTTPError, KeyError, ValueError) as e:
+                logger.warning("Replication from %s failed: %s", self.primary, e)
+                await asyncio.sleep(RETRY_INTERVAL)
+
+    async def sync(self) -> None:
+        """Apply the next changes of the primary, loading its items first if
+        the copy has none of its versions
+        """
+        if self.version is None:
+            await self.load()
+            return
+        response = await self.client.get(
+            self.primary + "/item/changes",
+            params={
+                "since": self.version,
+                "limit": CHANGES_LIMIT,
+                "wait": CHANGES_WAIT,
+            },
+            timeout=CHANGES_WAIT + REQUEST_TIMEOUT,
+        )
+        if response.status_code == status.HTTP_410_GONE:
+            self.version = None
+            return
+        response.raise_for_status()
+        body = response.json()
+        changes = CHANGES_ADAPTER.validate_python(body["changes"])
+        self.storage.apply(changes)
+        self.version = body["version"]
+        # Fewer changes than the limit are all the changes of the primary
+        if len(changes) < CHANGES_LIMIT:
+            self.synced_at = time.monotonic()
+
+    async def load(self) -> None:
+        """Replace the copy by the items of the primary"""
+        async with self.client.stream(
+            "GET", self.primary + "/item/snapshot"
+        ) as response:
+            response.raise_for_status()
+            version = int(response.headers["ETag"].strip('"'))
+            items = []
+            async for line in response.aiter_lines():
+                if line:
+                    change = CHANGE_ADAPTER.validate_json(line)
+                    if change.item is not None:
+                        items.append((change.item, change.version))
+        self.storage.load(items, version)
+        self.version = version
+        logger.info(
+            "Loaded %d items from %s at version %d", len(items), self.primary, version
+        )
+
+    async def forward(self, request: Request) -> Response:
+        """Return the response of the primary to a request"""
+        return await forward_request(self.client, request, self.primary)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def create_follower(settings: Settings, storage: Storage) -> Follower | None:
+    """Create the follower of the primary of the settings, None for a
+    primary node
+    """
+    if not settings.replication_primary:
+        return None
+    if not isinstance(storage, ReplicaStorage):
+        raise ValueError("A follower keeps the catalog in a replica storage")
+    follower = Follower(
+        settings.replication_primary, storage, settings.replication_max_lag
+    )
+    REPLICATION_LAG.set_function(follower.lag)
+    return follower
@@ -0,0 +1,35 @@
+from typing import Any, Mapping
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response serialized by pydantic-core.
+
+    With an `adapter`, the content is serialized by the serializer compiled
+    for its type, otherwise the type of every value is inferred. A route
+    returning this response skips the validation and encoding of its
+    response model by FastAPI, which would convert validated models to
+    dictionaries and validate them again before serializing them.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        adapter: TypeAdapter[Any] | None = None,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        # Set before the content is rendered by the base class
+        self.adapter = adapter
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if self.adapter is not None:
+            return self.adapter.dump_json(content)
+        return pydantic_core.to_json(content)
@@ -0,0 +1,147 @@
+from typing import Mapping
+
+import heapq
+import math
+import re
+from collections import Counter
+
+from .models import Item
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split a text into lowercase words
+
+    >>> tokenize("Sentinel-2 L2A, Europe")
+    ['sentinel', '2', 'l2a', 'europe']
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+# Indexed fields of items
+TEXT_FIELDS = [
+    name for name, field in Item.model_fields.items() if field.annotation is str
+]
+
+
+def item_tokens(item: Item) -> list[str]:
+    """Return the words of the text fields of an item"""
+    return [token for field in TEXT_FIELDS for token in tokenize(getattr(item, field))]
+
+
+class SearchIndex:
+    """Inverted index of the text fields of items, ranked with Okapi BM25.
+
+    The index maps every word to the keys of the items containing it and
+    the number of occurrences, so a query only visits the items that
+    contain at least one of its words. Results are ordered by descending
+    score and ascending key.
+
+    :param k1: saturation of the term frequency
+    :param b: normalization by the item length
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        # Word -> key -> occurrences of the word in the item
+        self.postings: dict[str, dict[int, int]] = {}
+        # Key -> words of the item, used to remove the item
+        self.terms: dict[int, tuple[str, ...]] = {}
+        # Key -> number of words in the item
+        self.lengths: dict[int, int] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def add(self, key: int, item: Item) -> None:
+        """Add an item to the index or replace its indexed version"""
+        self.remove(key)
+        tokens = item_tokens(item)
+        counts = Counter(tokens)
+        for term, count in counts.items():
+            self.postings.setdefault(term, {})[key] = count
+        self.terms[key] = tuple(counts)
+        self.lengths[key] = len(tokens)
+        self.total_length += len(tokens)
+
+    def add_many(self, values: Mapping[int, Item]) -> None:
+        for key, value in values.items():
+            self.add(key, value)
+
+    def remove(self, key: int) -> None:
+        """Remove an item from the index, if indexed"""
+        terms = self.terms.pop(key, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self.postings[term]
+            del postings[key]
+            if not postings:
+                del self.postings[term]
+        self.total_length -= self.lengths.pop(key)
+
+    def clear(self) -> None:
+        self.postings = {}
+        self.terms = {}
+        self.lengths = {}
+        self.total_length = 0
+
+    def search(
+        self,
+        query: str,
+        limit: int | None = None,
+        after: tuple[float, int] | None = None,
+    ) -> list[tuple[float, int]]:
+        """Return up to `limit` (score, key) pairs of the items matching any
+        word of `query`, ranked after the (score, key) pair `after`
+        """
+        terms = set(tokenize(query))
+        if not terms or not self.lengths:
+            return []
+
+        count = len(self.lengths)
+        # Parts of the BM25 denominator that do not depend on the term
+        # frequency: k1 * (1 - b + b * length / average length)
+        base = self.k1 * (1 - self.b)
+        scale = self.k1 * self.b * count / self.total_length if self.total_length else 0
+        lengths = self.lengths
+        scores: dict[int, float] = {}
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            frequency = len(postings)
+            idf = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+            weight = idf * (self.k1 + 1)
+            if not scores:
+                scores = {
+                    key: weight
+                    * occurrences
+                    / (occurrences + base + scale * lengths[key])
+                    for key, occurrences in postings.items()
+                }
+                continue
+            for key, occurrences in postings.items():
+                score = (
+                    weight * occurrences / (occurrences + base + scale * lengths[key])
+                )
+                scores[key] = scores.get(key, 0.0) + score
+
+        if after is not None:
+            after_score, after_key = after
+            scores = {
+                key: score
+                for key, score in scores.items()
+                if score < after_score or (score == after_score and key > after_key)
+            }
+        if limit is not None and len(scores) > limit:
+            # Only the items scoring at least the `limit`-th best score are
+            # sorted, instead of all matching items
+            threshold = heapq.nlargest(limit, scores.values())[-1]
+            scores = {key: score for key, score in scores.items() if score >= threshold}
+        # Best matches first, ties by ascending key
+        ranked = sorted((-score, key) for key, score in scores.items())[:limit]
+        return [(-score, key) for score, key in ranked]
@@ -0,0 +1,86 @@
+from typing import Literal
+
+from pydantic import model_validator
+from pydantic_settings import BaseSettings
+
+
+class Settings(BaseSettings):
+    """Application settings, read from environment variables"""
+
+    # Storage implementation: "memory" keeps the catalog in the process
+    # memory, "columnar" too in compact columns instead of item objects,
+    # "sqlite" persists it in an embedded database file, "lmdb" in a
+    # memory-mapped database read without copies
+    storage_backend: Literal["memory", "columnar", "sqlite", "lmdb"] = "memory"
+    # Threads running the operations of a blocking storage backend
+    storage_max_workers: int = 8
+    # Recent changes kept for the change feed, readers further behind have
+    # to read all items again
+    storage_change_buffer_size: int = 10000
+
+    # Directory of the write-ahead log and snapshots of the "memory" storage,
+    # the catalog is lost on restart if unset
+    memory_data_dir: str | None = None
+    # Log size in bytes after which a snapshot is taken
+    memory_snapshot_log_size: int = 64 * 1024 * 1024
+    # Whether the "memory" storage keeps the JSON encoding of the items read
+    memory_cache_encoded: bool = True
+
+    # Worker processes started by uvicorn, which reads the same variable
+    web_concurrency: int = 1
+
+    sqlite_path: str = "catalog.db"
+    # Size of the SQLite page cache in KiB
+    sqlite_cache_size: int = 65536
+
+    # Directory of the "lmdb" database
+    lmdb_path: str = "catalog.lmdb"
+    # Maximum size of the "lmdb" database in bytes
+    lmdb_map_size: int = 1024 * 1024 * 1024
+
+    # URLs of the nodes of a cluster, as a JSON list, each serving the items
+    # of its partition of the hash ring; empty for a single node
+    cluster_nodes: list[str] = []
+    # URL of this node in `cluster_nodes`
+    cluster_node: str = ""
+    # Points of every node on the hash ring
+    cluster_virtual_nodes: int = 64
+    # Whether requests for the items of other nodes are forwarded to them,
+    # or redirected
+    cluster_forward: bool = True
+
+    # URL of the primary node whose catalog this follower node copies, in
+    # memory; empty for a primary
+    replication_primary: str = ""
+    # Seconds the copy may be behind the primary before reads are forwarded
+    # to the primary
+    replication_max_lag: float = 5.0
+
+    @model_validator(mode="after")
+    def check_storage_is_shared(self) -> "Settings":
+        if self.web_concurrency > 1 and self.storage_backend in ("memory", "columnar"):
+            raise ValueError(
+                f"The {self.storage_backend} storage is private to a process, "
+                "several workers need STORAGE_BACKEND=sqlite or lmdb"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def check_cluster_node(self) -> "Settings":
+        if self.cluster_nodes and self.cluster_node not in self.cluster_nodes:
+            raise ValueError("CLUSTER_NODE has to be one of CLUSTER_NODES")
+        return self
+
+    @model_validator(mode="after")
+    def check_replication(self) -> "Settings":
+        if not self.replication_primary:
+            return self
+        if self.cluster_nodes:
+            raise ValueError("A follower of REPLICATION_PRIMARY is not a cluster node")
+        if self.storage_backend != "memory" or self.memory_data_dir:
+            raise ValueError(
+                "A follower keeps its copy of the catalog in memory, "
+                "REPLICATION_PRIMARY needs STORAGE_BACKEND=memory "
+                "without MEMORY_DATA_DIR"
+            )
+        return self
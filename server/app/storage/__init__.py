@@ -0,0 +1,60 @@
+from ..settings import Settings
+from .adapter import AsyncStorage, AsyncStorageAdapter
+from .base import Storage
+from .columnar import ColumnarMemoryStorage
+from .durable import DurableMemoryStorage
+from .lmdb import LMDBStorage
+from .memory import MemoryStorage
+from .replica import ReplicaStorage
+from .singleflight import SingleFlightStorage
+from .sqlite import SQLiteStorage
+
+__all__ = [
+    "AsyncStorage",
+    "AsyncStorageAdapter",
+    "SingleFlightStorage",
+    "Storage",
+    "MemoryStorage",
+    "ColumnarMemoryStorage",
+    "ReplicaStorage",
+    "DurableMemoryStorage",
+    "SQLiteStorage",
+    "LMDBStorage",
+    "create_storage",
+]
+
+
+def create_storage(settings: Settings) -> Storage:
+    """Create the storage backend selected in the settings"""
+    if settings.replication_primary:
+        return ReplicaStorage(
+            change_buffer_size=settings.storage_change_buffer_size,
+            cache_encoded=settings.memory_cache_encoded,
+        )
+    if settings.storage_backend == "sqlite":
+        return SQLiteStorage(
+            settings.sqlite_path,
+            settings.sqlite_cache_size,
+            change_buffer_size=settings.storage_change_buffer_size,
+        )
+    if settings.storage_backend == "lmdb":
+        return LMDBStorage(
+            settings.lmdb_path,
+            settings.lmdb_map_size,
+            change_buffer_size=settings.storage_change_buffer_size,
+        )
+    if settings.storage_backend == "columnar":
+        return ColumnarMemoryStorage(
+            change_buffer_size=settings.storage_change_buffer_size
+        )
+    if settings.memory_data_dir:
+        return DurableMemoryStorage(
+            settings.memory_data_dir,
+            settings.memory_snapshot_log_size,
+            change_buffer_size=settings.storage_change_buffer_size,
+            cache_encoded=settings.memory_cache_encoded,
+        )
+    return MemoryStorage(
+        change_buffer_size=settings.storage_change_buffer_size,
+        cache_encoded=settings.memory_cache_encoded,
+    )
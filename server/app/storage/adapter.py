@@ -0,0 +1,257 @@
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Mapping,
+    ParamSpec,
+    Protocol,
+    Set,
+    TypeVar,
+)
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from ..models import Item, ItemChange
+from .base import Storage
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class AsyncStorage(Protocol):
+    """Storage interface for the event loop, see `Storage`"""
+
+    async def has(self, key: int) -> bool:
+        ...
+
+    async def has_many(self, keys: Iterable[int]) -> set[int]:
+        ...
+
+    async def set(self, key: int, value: Item) -> None:
+        ...
+
+    async def set_many(self, values: Mapping[int, Item]) -> None:
+        ...
+
+    async def create_many(self, values: Mapping[int, Item]) -> Set[int]:
+        ...
+
+    async def upsert_many(self, values: Mapping[int, Item]) -> Set[int]:
+        ...
+
+    async def compare_and_set(
+        self, key: int, value: Item, version: int | None
+    ) -> int | None:
+        ...
+
+    async def get(self, key: int) -> Item | None:
+        ...
+
+    async def get_many(self, keys: Iterable[int]) -> dict[int, Item]:
+        ...
+
+    async def get_versioned(self, key: int) -> tuple[Item, int] | None:
+        ...
+
+    async def get_encoded(self, key: int) -> tuple[bytes, int] | None:
+        ...
+
+    async def catalog_version(self) -> int:
+        ...
+
+    async def changes(
+        self, since: int, limit: int | None = None
+    ) -> list[ItemChange] | None:
+        ...
+
+    def all(self) -> AsyncIterator[Item]:
+        ...
+
+    async def all_encoded(self) -> list[bytes]:
+        ...
+
+    async def page(
+        self, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        ...
+
+    async def page_versioned(
+        self, limit: int | None = None, after: int | None = None
+    ) -> list[tuple[Item, int]]:
+        ...
+
+    async def find_by_name(
+        self, name: str, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        ...
+
+    async def find_by_name_prefix(
+        self,
+        prefix: str,
+        limit: int | None = None,
+        after: tuple[str, int] | None = None,
+    ) -> list[Item]:
+        ...
+
+    async def delete(self, key: int) -> None:
+        ...
+
+    async def compare_and_delete(self, key: int, version: int) -> bool:
+        ...
+
+    async def delete_many(self, keys: Iterable[int]) -> None:
+        ...
+
+    async def discard_many(self, keys: Iterable[int]) -> Set[int]:
+        ...
+
+    async def clear(self) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class AsyncStorageAdapter:
+    """Adapts a synchronous `Storage` to the `AsyncStorage` interface.
+
+    Operations of a blocking storage run in a bounded thread pool, so
+    waiting for I/O does not stall the event loop. Operations of a
+    non-blocking storage, and the reads of a storage whose reads do not
+    block, are called directly, without a thread switch.
+
+    :param storage: adapted storage
+    :param max_workers: size of the thread pool
+    :param batch_size: items per storage call when iterating over `all`
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        max_workers: int | None = None,
+        batch_size: int = 1000,
+    ) -> None:
+        self.storage = storage
+        self.batch_size = batch_size
+        self.executor = (
+            ThreadPoolExecutor(max_workers, thread_name_prefix="storage")
+            if storage.blocking
+            else None
+        )
+
+    async def _run(
+        self, function: Callable[P, R], *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        if self.executor is None:
+            return function(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(function, *args, **kwargs)
+        )
+
+    async def _read(
+        self, function: Callable[P, R], *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        if not self.storage.blocking_reads:
+            return function(*args, **kwargs)
+        return await self._run(function, *args, **kwargs)
+
+    async def has(self, key: int) -> bool:
+        return await self._read(self.storage.has, key)
+
+    async def has_many(self, keys: Iterable[int]) -> set[int]:
+        return await self._read(self.storage.has_many, keys)
+
+    async def set(self, key: int, value: Item) -> None:
+        await self._run(self.storage.set, key, value)
+
+    async def set_many(self, values: Mapping[int, Item]) -> None:
+        await self._run(self.storage.set_many, values)
+
+    async def create_many(self, values: Mapping[int, Item]) -> Set[int]:
+        return await self._run(self.storage.create_many, values)
+
+    async def upsert_many(self, values: Mapping[int, Item]) -> Set[int]:
+        return await self._run(self.storage.upsert_many, values)
+
+    async def compare_and_set(
+        self, key: int, value: Item, version: int | None
+    ) -> int | None:
+        return await self._run(self.storage.compare_and_set, key, value, version)
+
+    async def get(self, key: int) -> Item | None:
+        return await self._read(self.storage.get, key)
+
+    async def get_many(self, keys: Iterable[int]) -> dict[int, Item]:
+        return await self._read(self.storage.get_many, keys)
+
+    async def get_versioned(self, key: int) -> tuple[Item, int] | None:
+        return await self._read(self.storage.get_versioned, key)
+
+    async def get_encoded(self, key: int) -> tuple[bytes, int] | None:
+        return await self._read(self.storage.get_encoded, key)
+
+    async def catalog_version(self) -> int:
+        return await self._read(self.storage.catalog_version)
+
+    async def changes(
+        self, since: int, limit: int | None = None
+    ) -> list[ItemChange] | None:
+        return await self._read(self.storage.changes, since, limit)
+
+    async def all(self) -> AsyncIterator[Item]:
+        # Items are read in batches of ascending keys, the keys of the
+        # catalog are item ids
+        after: int | None = None
+        while page := await self.page(self.batch_size, after):
+            for item in page:
+                yield item
+            after = page[-1].id
+
+    async def all_encoded(self) -> list[bytes]:
+        return await self._read(self.storage.all_encoded)
+
+    async def page(
+        self, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        return await self._read(self.storage.page, limit, after)
+
+    async def page_versioned(
+        self, limit: int | None = None, after: int | None = None
+    ) -> list[tuple[Item, int]]:
+        return await self._read(self.storage.page_versioned, limit, after)
+
+    async def find_by_name(
+        self, name: str, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        return await self._read(self.storage.find_by_name, name, limit, after)
+
+    async def find_by_name_prefix(
+        self,
+        prefix: str,
+        limit: int | None = None,
+        after: tuple[str, int] | None = None,
+    ) -> list[Item]:
+        return await self._read(self.storage.find_by_name_prefix, prefix, limit, after)
+
+    async def delete(self, key: int) -> None:
+        await self._run(self.storage.delete, key)
+
+    async def compare_and_delete(self, key: int, version: int) -> bool:
+        return await self._run(self.storage.compare_and_delete, key, version)
+
+    async def delete_many(self, keys: Iterable[int]) -> None:
+        await self._run(self.storage.delete_many, keys)
+
+    async def discard_many(self, keys: Iterable[int]) -> Set[int]:
+        return await self._run(self.storage.discard_many, keys)
+
+    async def clear(self) -> None:
+        await self._run(self.storage.clear)
+
+    async def close(self) -> None:
+        await self._run(self.storage.close)
+        if self.executor is not None:
+            self.executor.shutdown()
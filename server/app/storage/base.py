@@ -0,0 +1,189 @@
+from typing import Iterable, Mapping, Set
+
+from abc import ABC, abstractmethod
+
+from ..models import Item, ItemChange
+
+
+class Storage(ABC):
+    """Key-value storage of catalog items.
+
+    Keys are ordered, `page` returns items in ascending order of keys.
+    `delete` raises `KeyError` if the key does not exist. Items are indexed
+    by name, `find_by_name` and `find_by_name_prefix` do not scan the
+    storage.
+
+    Every change increments the catalog version, which is the version of
+    the items changed by it: item versions are unique and increase with
+    every change of the item. The most recent changes are kept, so that
+    readers can follow the catalog with `changes`. `compare_and_set` and
+    `compare_and_delete` change an item only if its version is the one
+    the caller read, atomically, so concurrent writers do not overwrite
+    each other. `create_many`, `upsert_many` and `discard_many` check and
+    change a batch of items atomically and return the keys they created or
+    deleted; the default implementations are atomic for the storages used
+    from one thread, the thread-safe storages override them. `get_encoded`
+    and `all_encoded` return items encoded in JSON, which backends may keep
+    instead of encoding them on every read.
+    """
+
+    # Whether operations may wait for I/O and have to be kept off the
+    # event loop, see `AsyncStorageAdapter`
+    blocking: bool = True
+    # Whether the reads of a blocking storage may wait too, the reads of a
+    # storage whose reads only wait briefly for its writers are called on
+    # the event loop
+    blocking_reads: bool = True
+
+    @abstractmethod
+    def has(self, key: int) -> bool:
+        ...
+
+    def has_many(self, keys: Iterable[int]) -> set[int]:
+        """Return the subset of `keys` that exist in the storage"""
+        return {key for key in keys if self.has(key)}
+
+    @abstractmethod
+    def set(self, key: int, value: Item) -> None:
+        ...
+
+    def set_many(self, values: Mapping[int, Item]) -> None:
+        for key, value in values.items():
+            self.set(key, value)
+
+    def create_many(self, values: Mapping[int, Item]) -> Set[int]:
+        """Set the items of the keys that do not exist and return these keys.
+
+        Keys are checked and items set atomically, an item that exists is
+        left untouched even when it was created by a concurrent writer.
+        """
+        existing = self.has_many(values)
+        created = {key: value for key, value in values.items() if key not in existing}
+        self.set_many(created)
+        return set(created)
+
+    def upsert_many(self, values: Mapping[int, Item]) -> Set[int]:
+        """Set the items and return the keys that did not exist, atomically"""
+        existing = self.has_many(values)
+        self.set_many(values)
+        return set(values) - existing
+
+    @abstractmethod
+    def compare_and_set(self, key: int, value: Item, version: int | None) -> int | None:
+        """Set the item of `key` if its version is `version`, or if it does
+        not exist when `version` is None, and return its new version.
+        Return None without a change if the version differs.
+        """
+
+    @abstractmethod
+    def get(self, key: int) -> Item | None:
+        ...
+
+    def get_many(self, keys: Iterable[int]) -> dict[int, Item]:
+        """Return the items of the `keys` that exist in the storage"""
+        items = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                items[key] = value
+        return items
+
+    @abstractmethod
+    def get_versioned(self, key: int) -> tuple[Item, int] | None:
+        """Return the item of `key` and its version"""
+
+    def get_encoded(self, key: int) -> tuple[bytes, int] | None:
+        """Return the item of `key` encoded in JSON and its version"""
+        versioned = self.get_versioned(key)
+        if versioned is None:
+            return None
+        value, version = versioned
+        return value.model_dump_json().encode(), version
+
+    @abstractmethod
+    def catalog_version(self) -> int:
+        """Return the version of the last change of the storage"""
+
+    @abstractmethod
+    def changes(self, since: int, limit: int | None = None) -> list[ItemChange] | None:
+        """Return up to `limit` changes made after the catalog version
+        `since` in the order they were made, or None if the changes after
+        `since` are no longer kept
+        """
+
+    @abstractmethod
+    def all(self) -> list[Item]:
+        ...
+
+    def all_encoded(self) -> list[bytes]:
+        """Return all items encoded in JSON, in ascending order of keys"""
+        return [value.model_dump_json().encode() for value in self.page()]
+
+    @abstractmethod
+    def page(self, limit: int | None = None, after: int | None = None) -> list[Item]:
+        """Return up to `limit` items with keys greater than `after`"""
+
+    def page_versioned(
+        self, limit: int | None = None, after: int | None = None
+    ) -> list[tuple[Item, int]]:
+        """Return up to `limit` items with keys greater than `after` and
+        their versions
+        """
+        versioned = []
+        for value in self.page(limit, after):
+            # Each item is read again with its version, items deleted in the
+            # meantime are left out
+            item = self.get_versioned(value.id)
+            if item is not None:
+                versioned.append(item)
+        return versioned
+
+    @abstractmethod
+    def find_by_name(
+        self, name: str, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        """Return up to `limit` items named `name` with keys greater than
+        `after`, in ascending order of keys
+        """
+
+    @abstractmethod
+    def find_by_name_prefix(
+        self,
+        prefix: str,
+        limit: int | None = None,
+        after: tuple[str, int] | None = None,
+    ) -> list[Item]:
+        """Return up to `limit` items with names starting with `prefix` and
+        (name, key) greater than `after`, in ascending order of (name, key)
+        """
+
+    @abstractmethod
+    def delete(self, key: int) -> None:
+        ...
+
+    @abstractmethod
+    def compare_and_delete(self, key: int, version: int) -> bool:
+        """Delete the item of `key` if its version is `version` and return
+        whether it was deleted
+        """
+
+    def delete_many(self, keys: Iterable[int]) -> None:
+        for key in keys:
+            self.delete(key)
+
+    def discard_many(self, keys: Iterable[int]) -> Set[int]:
+        """Delete the items of the keys that exist and return these keys,
+        atomically
+        """
+        keys = list(dict.fromkeys(keys))
+        existing = self.has_many(keys)
+        deleted = [key for key in keys if key in existing]
+        self.delete_many(deleted)
+        return set(deleted)
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def close(self) -> None:
+        """Release resources held by the storage"""
@@ -0,0 +1,37 @@
+from collections import deque
+from itertools import islice
+
+from ..models import ItemChange
+
+
+class ChangeBuffer:
+    """Ring buffer of the most recent changes of a storage.
+
+    Every change advances the catalog version by one, so the changes after
+    a version are found by their offset from the oldest change kept.
+
+    :param size: number of changes kept
+    :param version: catalog version before the first change appended
+    """
+
+    def __init__(self, size: int, version: int = 0) -> None:
+        self.changes: deque[ItemChange] = deque(maxlen=size)
+        # Catalog version before the oldest change kept
+        self.start = version
+
+    def append(self, change: ItemChange) -> None:
+        if len(self.changes) == self.changes.maxlen:
+            self.start = self.changes[0].version if self.changes else change.version
+        self.changes.append(change)
+
+    def since(self, version: int, limit: int | None = None) -> list[ItemChange] | None:
+        """Return up to `limit` changes after `version`, or None if they are
+        no longer kept or `version` is not a version of the storage
+        """
+        end = self.changes[-1].version if self.changes else self.start
+        if not self.start <= version <= end:
+            return None
+        offset = version - self.start
+        return list(
+            islice(self.changes, offset, None if limit is None else offset + limit)
+        )
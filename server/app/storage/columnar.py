@@ -0,0 +1,465 @@
+from typing import Any, Callable, Mapping, Optional
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from pydantic_core import to_json
+
+from ..models import Item, ItemChange
+from .base import Storage
+from .changes import ChangeBuffer
+from .memory import CHANGE_BUFFER_SIZE
+
+# Fibonacci hashing: keys are multiplied by 2**64 divided by the golden
+# ratio, the high bits of the product select the slot
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+HASH_MASK = (1 << 64) - 1
+MIN_INDEX_BITS = 4
+# The name arena is compacted when it is larger than twice the names of
+# the items and this size in bytes
+ARENA_SLACK = 1 << 20
+# A batch of `set_many` is sorted and merged into the ordered rows instead
+# of inserting each row in order, when it has more than MERGE_SIZE items or
+# 1/MERGE_RATIO of the rows: an insertion moves the following rows
+MERGE_SIZE = 1000
+MERGE_RATIO = 64
+
+
+def encode_item(key: int, name: str) -> bytes:
+    """Encode an item in the JSON of `Item.model_dump_json`
+
+    >>> encode_item(1, 'a "b"')
+    b'{"id":1,"name":"a \\\\"b\\\\""}'
+    >>> encode_item(2, "é") == Item(id=2, name="é").model_dump_json().encode()
+    True
+    """
+    return b'{"id":%d,"name":%s}' % (key, to_json(name))
+
+
+def merge_rows(
+    rows: "array[int]",
+    removed: list[int],
+    added: list[int],
+    key: Callable[[int], Any],
+) -> "array[int]":
+    """Return ordered rows without the rows at the positions `removed` and
+    with the rows `added`, in the order of `key`.
+
+    Only the added rows are sorted, the ordered rows are copied in slices.
+
+    >>> merge_rows(array("q", [1, 3, 5, 7]), [1], [6, 0], key=int).tolist()
+    [0, 1, 5, 6, 7]
+    """
+    if removed:
+        kept = array("q")
+        previous = 0
+        for position in sorted(removed):
+            kept += rows[previous:position]
+            previous = position + 1
+        kept += rows[previous:]
+        rows = kept
+    merged = array("q")
+    previous = 0
+    for row in sorted(added, key=key):
+        position = bisect_left(rows, key(row), previous, key=key)
+        merged += rows[previous:position]
+        merged.append(row)
+        previous = position
+    merged += rows[previous:]
+    return merged
+
+
+class KeyIndex:
+    """Hash index of item keys to rows.
+
+    The index is an open-addressing table of 8-byte slots with linear
+    probing. A slot holds a row plus one, 0 is empty, and the keys are read
+    from the key column, so the table holds no Python objects.
+
+    >>> keys = array("q", [10, -3, 7])
+    >>> index = KeyIndex(keys)
+    >>> for row, key in enumerate(keys):
+    ...     index.add(key, row)
+    >>> index.remove(10)
+    >>> index.find(-3), index.find(10)
+    (1, None)
+
+    :param keys: key column, indexed by row
+    """
+
+    def __init__(self, keys: "array[int]") -> None:
+        self.keys = keys
+        self.count = 0
+        self._allocate(MIN_INDEX_BITS)
+
+    def _allocate(self, bits: int) -> None:
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.slots = array("q", bytes(8 << bits))
+
+    def _home(self, key: int) -> int:
+        return ((key * HASH_MULTIPLIER) & HASH_MASK) >> (64 - self.bits)
+
+    def _insert(self, key: int, row: int) -> None:
+        slots, mask = self.slots, self.mask
+        slot = self._home(key)
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = row + 1
+
+    def find(self, key: int) -> int | None:
+        """Return the row of `key`, None if it is not indexed"""
+        slots, keys, mask = self.slots, self.keys, self.mask
+        slot = self._home(key)
+        while entry := slots[slot]:
+            if keys[entry - 1] == key:
+                return entry - 1
+            slot = (slot + 1) & mask
+        return None
+
+    def add(self, key: int, row: int) -> None:
+        """Index the row of a key that is not indexed"""
+        if (self.count + 1) * 2 > len(self.slots):
+            previous = self.slots
+            self._allocate(self.bits + 1)
+            for entry in previous:
+                if entry:
+                    self._insert(self.keys[entry - 1], entry - 1)
+        self._insert(key, row)
+        self.count += 1
+
+    def remove(self, key: int) -> None:
+        """Remove an indexed key"""
+        slots, keys, mask = self.slots, self.keys, self.mask
+        slot = self._home(key)
+        while keys[slots[slot] - 1] != key:
+            slot = (slot + 1) & mask
+        # The following entries of the cluster are shifted back into the
+        # emptied slot when it is between them and their home slot, so that
+        # lookups do not stop at it
+        empty = slot
+        while True:
+            slot = (slot + 1) & mask
+            entry = slots[slot]
+            if not entry:
+                break
+            home = self._home(keys[entry - 1])
+            if empty <= slot:
+                stays = empty < home <= slot
+            else:
+                stays = home <= slot or home > empty
+            if not stays:
+                slots[empty] = entry
+                empty = slot
+        slots[empty] = 0
+        self.count -= 1
+
+
+class ColumnarMemoryStorage(Storage):
+    """Storage in columns of the process memory, for large catalogs.
+
+    Items are not kept as objects: a row holds the key, the version and the
+    location of the name in an arena of UTF-8 bytes, in arrays of machine
+    integers. Rows with the same name share their bytes in the arena. The
+    row of a key is found with a `KeyIndex`, and arrays of rows sorted by
+    key and by (name, key) serve pages and name searches, like the indexes
+    of `MemoryStorage`. Items are materialized when they are read, and
+    encoded in JSON directly from the columns.
+
+    The id of an item is its key, a signed 64-bit integer. A row freed by
+    a delete has version 0 and is reused by the next new item.
+
+    :param initial: initial items
+    :param change_buffer_size: number of recent changes kept for `changes`
+    """
+
+    blocking = False
+
+    def __init__(
+        self,
+        initial: Optional[Mapping[int, Item]] = None,
+        change_buffer_size: int = CHANGE_BUFFER_SIZE,
+    ) -> None:
+        self._reset()
+        self.sequence = 0
+        if initial:
+            for key in sorted(initial):
+                self.sequence += 1
+                start, size = self._append_name(initial[key].name)
+                self._add_row(key, start, size, self.sequence)
+            self._reindex()
+        self.recent_changes = ChangeBuffer(change_buffer_size, self.sequence)
+
+    def _reset(self) -> None:
+        # Columns indexed by row
+        self.ids = array("q")
+        self.versions = array("q")
+        self.name_starts = array("q")
+        self.name_sizes = array("I")
+        self.arena = bytearray()
+        # Bytes of the names of all items, counting shared names once per item
+        self.name_bytes = 0
+        self.free_rows = array("q")
+        self.index = KeyIndex(self.ids)
+        # Rows in ascending order of keys, and of (name, key)
+        self.key_rows = array("q")
+        self.name_rows = array("q")
+
+    def _name(self, row: int) -> str:
+        start = self.name_starts[row]
+        return self.arena[start : start + self.name_sizes[row]].decode()
+
+    def _name_key(self, row: int) -> tuple[str | int, ...]:
+        return self._name(row), self.ids[row]
+
+    def _name_index(self, name_key: tuple[str | int, ...], right: bool = False) -> int:
+        """Return the position of a (name, key) pair in the rows ordered by
+        name, a (name,) 1-tuple is before all pairs of the name
+        """
+        search = bisect_right if right else bisect_left
+        return search(self.name_rows, name_key, key=self._name_key)
+
+    def _materialize(self, row: int) -> Item:
+        # Validation of the two fields is faster than `model_construct`
+        return Item(id=self.ids[row], name=self._name(row))
+
+    def _append_name(self, name: str) -> tuple[int, int]:
+        """Append a name to the arena and return its start and size"""
+        data = name.encode()
+        start = len(self.arena)
+        self.arena += data
+        return start, len(data)
+
+    def _intern(self, name: str) -> tuple[int, int]:
+        """Return the start and size of `name` in the arena, shared with a
+        row of the same name if there is one
+        """
+        index = self._name_index((name,))
+        if index < len(self.name_rows):
+            row = self.name_rows[index]
+            if self._name(row) == name:
+                return self.name_starts[row], self.name_sizes[row]
+        return self._append_name(name)
+
+    def _rename(self, row: int, start: int, size: int) -> None:
+        self.name_bytes += size - self.name_sizes[row]
+        self.name_starts[row] = start
+        self.name_sizes[row] = size
+
+    def _add_row(self, key: int, start: int, size: int, version: int) -> int:
+        """Add a row and its key to the index, without ordering it"""
+        self.name_bytes += size
+        if self.free_rows:
+            row = self.free_rows.pop()
+            self.ids[row] = key
+            self.versions[row] = version
+            self.name_starts[row] = start
+            self.name_sizes[row] = size
+        else:
+            row = len(self.ids)
+            self.ids.append(key)
+            self.versions.append(version)
+            self.name_starts.append(start)
+            self.name_sizes.append(size)
+        self.index.add(key, row)
+        return row
+
+    def _reindex(self) -> None:
+        """Sort the rows by key and by name, and compact the arena"""
+        rows = [row for row in range(len(self.ids)) if self.versions[row]]
+        self.key_rows = array("q", sorted(rows, key=self.ids.__getitem__))
+        self.name_rows = array("q", sorted(rows, key=self._name_key))
+        self._compact()
+
+    def _compact(self) -> None:
+        """Copy the names of the rows to a new arena, in the order of names,
+        so that rows with the same name share their bytes
+        """
+        arena = bytearray()
+        previous: bytearray | None = None
+        start = 0
+        for row in self.name_rows:
+            name_start = self.name_starts[row]
+            data = self.arena[name_start : name_start + self.name_sizes[row]]
+            if data != previous:
+                start = len(arena)
+                arena += data
+                previous = data
+            self.name_starts[row] = start
+        self.arena = arena
+
+    def _release_names(self) -> None:
+        """Compact the arena when most of it holds names no longer used"""
+        if len(self.arena) > 2 * self.name_bytes + ARENA_SLACK:
+            self._compact()
+
+    def _order(self, row: int) -> None:
+        self.key_rows.insert(
+            bisect_left(self.key_rows, self.ids[row], key=self.ids.__getitem__), row
+        )
+        self.name_rows.insert(self._name_index(self._name_key(row)), row)
+
+    def _unorder_name(self, row: int) -> None:
+        index = self._name_index(self._name_key(row))
+        del self.name_rows[index]
+
+    def has(self, key: int) -> bool:
+        return self.index.find(key) is not None
+
+    def set(self, key: int, value: Item) -> None:
+        row = self.index.find(key)
+        self.sequence += 1
+        if row is None:
+            start, size = self._intern(value.name)
+            row = self._add_row(key, start, size, self.sequence)
+            self._order(row)
+        elif self._name(row) != value.name:
+            self._unorder_name(row)
+            self._rename(row, *self._intern(value.name))
+            self.name_rows.insert(self._name_index((value.name, key)), row)
+            self._release_names()
+        self.versions[row] = self.sequence
+        self.recent_changes.append(
+            ItemChange(version=self.sequence, op="set", id=key, item=value)
+        )
+
+    def set_many(self, values: Mapping[int, Item]) -> None:
+        if len(values) <= min(MERGE_SIZE, len(self.key_rows) // MERGE_RATIO):
+            super().set_many(values)
+            return
+        # The batch is merged into the ordered rows in one pass. Rows are
+        # renamed after the loop, the rows ordered by name stay sorted for
+        # the searches of their positions and of the names to share
+        added: list[int] = []
+        renamed: dict[int, tuple[int, int]] = {}
+        positions: list[int] = []
+        names: dict[str, tuple[int, int]] = {}
+        for key, value in values.items():
+            self.sequence += 1
+            if value.name not in names:
+                names[value.name] = self._intern(value.name)
+            row = self.index.find(key)
+            if row is None:
+                added.append(self._add_row(key, *names[value.name], self.sequence))
+            else:
+                if self._name(row) != value.name:
+                    positions.append(self._name_index(self._name_key(row)))
+                    renamed[row] = names[value.name]
+                self.versions[row] = self.sequence
+            self.recent_changes.append(
+                ItemChange(version=self.sequence, op="set", id=key, item=value)
+            )
+        for row, location in renamed.items():
+            self._rename(row, *location)
+        self.key_rows = merge_rows(self.key_rows, [], added, key=self.ids.__getitem__)
+        self.name_rows = merge_rows(
+            self.name_rows, positions, added + list(renamed), key=self._name_key
+        )
+        self._release_names()
+
+    def compare_and_set(self, key: int, value: Item, version: int | None) -> int | None:
+        row = self.index.find(key)
+        if (None if row is None else self.versions[row]) != version:
+            return None
+        self.set(key, value)
+        return self.sequence
+
+    def get(self, key: int) -> Item | None:
+        row = self.index.find(key)
+        return None if row is None else self._materialize(row)
+
+    def get_versioned(self, key: int) -> tuple[Item, int] | None:
+        row = self.index.find(key)
+        if row is None:
+            return None
+        return self._materialize(row), self.versions[row]
+
+    def get_encoded(self, key: int) -> tuple[bytes, int] | None:
+        row = self.index.find(key)
+        if row is None:
+            return None
+        return encode_item(key, self._name(row)), self.versions[row]
+
+    def catalog_version(self) -> int:
+        return self.sequence
+
+    def changes(self, since: int, limit: int | None = None) -> list[ItemChange] | None:
+        return self.recent_changes.since(since, limit)
+
+    def all(self) -> list[Item]:
+        return [self._materialize(row) for row in self.key_rows]
+
+    def all_encoded(self) -> list[bytes]:
+        return [encode_item(self.ids[row], self._name(row)) for row in self.key_rows]
+
+    def page(self, limit: int | None = None, after: int | None = None) -> list[Item]:
+        start = (
+            0
+            if after is None
+            else bisect_right(self.key_rows, after, key=self.ids.__getitem__)
+        )
+        stop = None if limit is None else start + limit
+        return [self._materialize(row) for row in self.key_rows[start:stop]]
+
+    def find_by_name(
+        self, name: str, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        if after is None:
+            index = self._name_index((name,))
+        else:
+            index = self._name_index((name, after), right=True)
+        items: list[Item] = []
+        while index < len(self.name_rows) and (limit is None or len(items) < limit):
+            row = self.name_rows[index]
+            if self._name(row) != name:
+                break
+            items.append(self._materialize(row))
+            index += 1
+        return items
+
+    def find_by_name_prefix(
+        self,
+        prefix: str,
+        limit: int | None = None,
+        after: tuple[str, int] | None = None,
+    ) -> list[Item]:
+        # A 1-tuple sorts before all pairs with the same name
+        index = self._name_index((prefix,))
+        if after is not None:
+            index = max(index, self._name_index(after, right=True))
+        items: list[Item] = []
+        while index < len(self.name_rows) and (limit is None or len(items) < limit):
+            row = self.name_rows[index]
+            if not self._name(row).startswith(prefix):
+                break
+            items.append(self._materialize(row))
+            index += 1
+        return items
+
+    def delete(self, key: int) -> None:
+        row = self.index.find(key)
+        if row is None:
+            raise KeyError(key)
+        del self.key_rows[bisect_left(self.key_rows, key, key=self.ids.__getitem__)]
+        self._unorder_name(row)
+        self.index.remove(key)
+        self.name_bytes -= self.name_sizes[row]
+        self.versions[row] = 0
+        self.free_rows.append(row)
+        self._release_names()
+        self.sequence += 1
+        self.recent_changes.append(
+            ItemChange(version=self.sequence, op="delete", id=key)
+        )
+
+    def compare_and_delete(self, key: int, version: int) -> bool:
+        row = self.index.find(key)
+        if row is None or self.versions[row] != version:
+            return False
+        self.delete(key)
+        return True
+
+    def clear(self) -> None:
+        self._reset()
+        self.sequence += 1
+        self.recent_changes.append(ItemChange(version=self.sequence, op="clear"))
@@ -0,0 +1,538 @@
+from typing import BinaryIO, Iterable, Mapping, Set
+
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections import deque
+from pathlib import Path
+
+from ..models import Item, ItemChange
+from .memory import CHANGE_BUFFER_SIZE, MemoryStorage
+
+# Log record: CRC32 of the rest of the record, operation, key, payload length,
+# followed by the payload. A record with a wrong checksum or cut short is a
+# torn write of a crash and ends the replay of its log. Every record is one
+# change, so replaying the records reproduces the versions of the items.
+RECORD_HEADER = struct.Struct("<IBqI")
+OP_SET = 1
+OP_DELETE = 2
+OP_CLEAR = 3
+
+# Snapshot: magic, catalog version, number of items, followed by the items in
+# ascending order of keys, each as key, version, value length and the value
+# in JSON
+SNAPSHOT_MAGIC = b"DSCSNAP2"
+SNAPSHOT_HEADER = struct.Struct("<8sQQ")
+SNAPSHOT_ENTRY = struct.Struct("<qQI")
+
+
+# A change staged until its record is committed: operation, key, item set
+# and record
+Change = tuple[int, int, Item | None, bytes]
+
+
+def encode_record(op: int, key: int, payload: bytes = b"") -> bytes:
+    body = RECORD_HEADER.pack(0, op, key, len(payload))[4:] + payload
+    return struct.pack("<I", zlib.crc32(body)) + body
+
+
+def set_change(key: int, value: Item) -> Change:
+    return (
+        OP_SET,
+        key,
+        value,
+        encode_record(OP_SET, key, value.model_dump_json().encode()),
+    )
+
+
+def delete_change(key: int) -> Change:
+    return OP_DELETE, key, None, encode_record(OP_DELETE, key)
+
+
+class DurableMemoryStorage(MemoryStorage):
+    """Storage in the process memory that survives restarts.
+
+    Reads are served from the dictionary of `MemoryStorage`. Every change
+    is appended to a write-ahead log and synced to the disk before the call
+    returns. Writers that wait for a sync at the same time share it, so
+    concurrent writes are committed in groups with one `fsync`. A change is
+    applied to the items once committed, in the order of the log, so a
+    change that a crash would lose is never read and its version is not
+    reused. Reads only wait for the changes of the items in memory, not for
+    the log, and do not block the event loop (`blocking_reads` is false).
+
+    When the log grows beyond `snapshot_log_size` bytes, the items are
+    written to a snapshot by a background thread and a new log is started.
+    At startup the latest snapshot is read through `mmap` and the logs
+    written after it are replayed, the changes replayed are kept for
+    `changes`. The directory is locked, it cannot be used by several
+    processes at the same time.
+
+    :param path: directory of the snapshots and logs
+    :param snapshot_log_size: log size in bytes that triggers a snapshot
+    :param fsync: whether a commit waits for the log to reach the disk
+    :param change_buffer_size: number of recent changes kept for `changes`
+    :param cache_encoded: whether the JSON encoding of an item is kept once
+        read, until the item changes
+    """
+
+    blocking = True
+    blocking_reads = False
+
+    def __init__(
+        self,
+        path: str | Path,
+        snapshot_log_size: int = 64 * 1024 * 1024,
+        fsync: bool = True,
+        change_buffer_size: int = CHANGE_BUFFER_SIZE,
+        cache_encoded: bool = True,
+    ) -> None:
+        super().__init__(
+            change_buffer_size=change_buffer_size, cache_encoded=cache_encoded
+        )
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        # A second process would append to the same logs and replace the
+        # snapshots, the lock is released when the file is closed
+        self.lock_file = open(self.path / "lock", "wb")
+        try:
+            fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self.lock_file.close()
+            raise RuntimeError(f"{self.path} is used by another process")
+        self.snapshot_log_size = snapshot_log_size
+        self.fsync = fsync
+        # `log_lock` orders the writers and guards the log and the staged
+        # changes, `lock` guards the items and is only held while they are
+        # read or changed, never during I/O. `sync_lock` is held while the
+        # log is synced, the locks are always acquired in the order
+        # `sync_lock`, `log_lock`, `lock`
+        self.log_lock = threading.Lock()
+        self.lock = threading.Lock()
+        self.sync_lock = threading.Lock()
+        self.snapshot_lock = threading.Lock()
+        self.generation, self.log_size = self._recover()
+        self.log = self._open_log()
+        # Changes appended to the log and not yet applied to the items, with
+        # the log position committing them, in the order of the log
+        self.staged: deque[tuple[int, list[Change]]] = deque()
+        # Writers decide on the items as changed by the staged changes: the
+        # version of the last change, the log position and version of the
+        # items they change, None for a delete, and the log position of a
+        # clear
+        self.log_sequence = self.sequence
+        self.pending: dict[int, tuple[int, int | None]] = {}
+        self.pending_clear: int | None = None
+        # A failed sync leaves the records of the log in an unknown state,
+        # the changes staged are never applied and no change is accepted
+        # until the storage is opened again
+        self.failure: OSError | None = None
+        # Bytes written to the logs and synced, counted since startup
+        self.written = 0
+        self.synced = 0
+
+    def _snapshot_path(self, generation: int) -> Path:
+        return self.path / f"snapshot-{generation:010d}.bin"
+
+    def _log_path(self, generation: int) -> Path:
+        return self.path / f"log-{generation:010d}.bin"
+
+    def _generations(self, pattern: str) -> list[int]:
+        return sorted(int(path.stem.split("-")[1]) for path in self.path.glob(pattern))
+
+    def _open_log(self) -> BinaryIO:
+        log = open(self._log_path(self.generation), "ab")
+        self._sync_directory()
+        return log
+
+    def _sync_directory(self) -> None:
+        if not self.fsync:
+            return
+        descriptor = os.open(self.path, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def _recover(self) -> tuple[int, int]:
+        """Load the latest snapshot, replay the logs written after it and
+        return the generation of a new log and the size of the replayed logs
+        """
+        for path in self.path.glob("*.tmp"):
+            path.unlink()
+        snapshots = self._generations("snapshot-*.bin")
+        latest = snapshots[-1] if snapshots else 0
+        if snapshots:
+            self._load_snapshot(self._snapshot_path(latest))
+        logs = self._generations("log-*.bin")
+        size = 0
+        for generation in logs:
+            if generation >= latest:
+                size += self._replay(self._log_path(generation))
+        self._reindex()
+        # Logs are not appended to after a restart, a new log starts after a
+        # possibly torn record at the end of the last one
+        return max([latest, *logs]) + 1, size
+
+    def _load_snapshot(self, path: Path) -> None:
+        with open(path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as view:
+            magic, self.sequence, count = SNAPSHOT_HEADER.unpack_from(view)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"Invalid snapshot {path}")
+            offset = SNAPSHOT_HEADER.size
+            for _ in range(count):
+                key, self.versions[key], length = SNAPSHOT_ENTRY.unpack_from(
+                    view, offset
+                )
+                offset += SNAPSHOT_ENTRY.size
+                self.kvs[key] = Item.model_validate_json(view[offset : offset + length])
+                offset += length
+        # Changes before the snapshot are not known
+        self.recent_changes.start = self.sequence
+
+    def _replay(self, path: Path) -> int:
+        data = path.read_bytes()
+        offset = 0
+        while offset + RECORD_HEADER.size <= len(data):
+            checksum, op, key, length = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            end = start + length
+            if end > len(data) or zlib.crc32(data[offset + 4 : end]) != checksum:
+                break
+            self.sequence += 1
+            if op == OP_SET:
+                value = Item.model_validate_json(data[start:end])
+                self.kvs[key] = value
+                self.versions[key] = self.sequence
+                self.recent_changes.append(
+                    ItemChange(version=self.sequence, op="set", id=key, item=value)
+                )
+            elif op == OP_DELETE:
+                self.kvs.pop(key, None)
+                self.versions.pop(key, None)
+                self.recent_changes.append(
+                    ItemChange(version=self.sequence, op="delete", id=key)
+                )
+            elif op == OP_CLEAR:
+                self.kvs.clear()
+                self.versions.clear()
+                self.recent_changes.append(
+                    ItemChange(version=self.sequence, op="clear")
+                )
+            offset = end
+        return offset
+
+    def _append(self, records: Iterable[bytes]) -> int:
+        """Append records to the log and return the position to sync"""
+        for record in records:
+            self.log.write(record)
+            self.written += len(record)
+            self.log_size += len(record)
+        return self.written
+
+    def _stage(self, changes: list[Change]) -> int:
+        """Append changes to the log and stage them until they are committed,
+        return the position to sync. Called with `log_lock` held.
+        """
+        self._check()
+        position = self._append(record for _, _, _, record in changes)
+        for op, key, _, _ in changes:
+            self.log_sequence += 1
+            if op == OP_CLEAR:
+                self.pending = {}
+                self.pending_clear = position
+            else:
+                self.pending[key] = (
+                    position,
+                    self.log_sequence if op == OP_SET else None,
+                )
+        self.staged.append((position, changes))
+        return position
+
+    def _check(self) -> None:
+        if self.failure is not None:
+            raise OSError("The log failed to sync, reopen the storage") from (
+                self.failure
+            )
+
+    def _version(self, key: int) -> int | None:
+        """Return the version of an item after the staged changes, None if
+        it does not exist. Called with `log_lock` held.
+        """
+        pending = self.pending.get(key)
+        if pending is not None:
+            return pending[1]
+        if self.pending_clear is not None:
+            return None
+        return self.versions.get(key)
+
+    def _apply_committed(self) -> None:
+        """Apply the staged changes that are committed to the items, in the
+        order of the log. Called with `log_lock` held.
+        """
+        synced = self.synced
+        with self.lock:
+            while self.staged and self.staged[0][0] <= synced:
+                _, changes = self.staged.popleft()
+                for op, key, value, _ in changes:
+                    if op == OP_SET:
+                        assert value is not None
+                        MemoryStorage.set(self, key, value)
+                    elif op == OP_DELETE:
+                        MemoryStorage.delete(self, key)
+                    else:
+                        MemoryStorage.clear(self)
+        self.pending = {
+            key: pending for key, pending in self.pending.items() if pending[0] > synced
+        }
+        if self.pending_clear is not None and self.pending_clear <= synced:
+            self.pending_clear = None
+
+    def _flush(self) -> None:
+        # Called with `sync_lock` held, `log_lock` is only held to read the
+        # state of the log, so writers append while the previous group is
+        # synced
+        with self.log_lock:
+            self.log.flush()
+            written = self.written
+            descriptor = self.log.fileno()
+        if self.fsync:
+            os.fsync(descriptor)
+        self.synced = written
+
+    def _commit(self, position: int) -> None:
+        with self.sync_lock:
+            # A sync started after the record was appended has committed it
+            self._check()
+            if self.synced < position:
+                try:
+                    self._flush()
+                except OSError as error:
+                    self.failure = error
+                    raise
+        with self.log_lock:
+            self._apply_committed()
+        if self.log_size >= self.snapshot_log_size and self.snapshot_lock.acquire(
+            blocking=False
+        ):
+            # The writer returns once committed, the snapshot is written by a
+            # thread of its own unless one is in progress
+            threading.Thread(
+                target=self._snapshot, name="snapshot", daemon=True
+            ).start()
+
+    def snapshot(self, wait: bool = True) -> None:
+        """Write the items to a snapshot and start a new log.
+
+        The items are copied while the writers wait and written without
+        blocking them, so writes continue to the new log while the snapshot
+        is written. Readers do not wait for the snapshot.
+
+        :param wait: wait for a snapshot in progress instead of skipping
+        """
+        if self.snapshot_lock.acquire(blocking=wait):
+            self._snapshot()
+
+    def _snapshot(self) -> None:
+        # Called with `snapshot_lock` held, released when done
+        try:
+            # Writers change the items with `log_lock` held, readers only
+            # need `lock`
+            with self.sync_lock, self.log_lock:
+                self._check()
+                # Records appended to the old log are committed before it
+                # is closed, later commits sync the new one
+                self.log.flush()
+                if self.fsync:
+                    os.fsync(self.log.fileno())
+                self.synced = self.written
+                self._apply_committed()
+                self.log.close()
+                self.generation += 1
+                self.log = self._open_log()
+                self.log_size = 0
+                generation = self.generation
+                sequence = self.sequence
+                items = [(key, self.versions[key], self.kvs[key]) for key in self.keys]
+            self._write_snapshot(generation, sequence, items)
+            for old in self._generations("log-*.bin"):
+                if old < generation:
+                    self._log_path(old).unlink()
+            for old in self._generations("snapshot-*.bin"):
+                if old < generation:
+                    self._snapshot_path(old).unlink()
+        finally:
+            self.snapshot_lock.release()
+
+    def _write_snapshot(
+        self, generation: int, sequence: int, items: list[tuple[int, int, Item]]
+    ) -> None:
+        path = self._snapshot_path(generation)
+        temporary = path.with_suffix(".tmp")
+        with open(temporary, "wb") as file:
+            file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, sequence, len(items)))
+            for key, version, value in items:
+                payload = value.model_dump_json().encode()
+                file.write(SNAPSHOT_ENTRY.pack(key, version, len(payload)))
+                file.write(payload)
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+        temporary.rename(path)
+        self._sync_directory()
+
+    def set(self, key: int, value: Item) -> None:
+        change = set_change(key, value)
+        with self.log_lock:
+            position = self._stage([change])
+        self._commit(position)
+
+    def set_many(self, values: Mapping[int, Item]) -> None:
+        changes = [set_change(key, value) for key, value in values.items()]
+        with self.log_lock:
+            position = self._stage(changes)
+        self._commit(position)
+
+    def create_many(self, values: Mapping[int, Item]) -> Set[int]:
+        changes = {key: set_change(key, value) for key, value in values.items()}
+        with self.log_lock:
+            created = [key for key in values if self._version(key) is None]
+            position = self._stage([changes[key] for key in created])
+        self._commit(position)
+        return set(created)
+
+    def upsert_many(self, values: Mapping[int, Item]) -> Set[int]:
+        changes = [set_change(key, value) for key, value in values.items()]
+        with self.log_lock:
+            created = {key for key in values if self._version(key) is None}
+            position = self._stage(changes)
+        self._commit(position)
+        return created
+
+    def compare_and_set(self, key: int, value: Item, version: int | None) -> int | None:
+        change = set_change(key, value)
+        with self.log_lock:
+            if self._version(key) != version:
+                return None
+            position = self._stage([change])
+            new_version = self.log_sequence
+        self._commit(position)
+        return new_version
+
+    def has(self, key: int) -> bool:
+        with self.lock:
+            return super().has(key)
+
+    def has_many(self, keys: Iterable[int]) -> Set[int]:
+        with self.lock:
+            return {key for key in keys if key in self.kvs}
+
+    def get(self, key: int) -> Item | None:
+        with self.lock:
+            return super().get(key)
+
+    def get_many(self, keys: Iterable[int]) -> dict[int, Item]:
+        with self.lock:
+            return super().get_many(keys)
+
+    def get_versioned(self, key: int) -> tuple[Item, int] | None:
+        with self.lock:
+            return super().get_versioned(key)
+
+    def get_encoded(self, key: int) -> tuple[bytes, int] | None:
+        with self.lock:
+            return super().get_encoded(key)
+
+    def catalog_version(self) -> int:
+        with self.lock:
+            return super().catalog_version()
+
+    def changes(self, since: int, limit: int | None = None) -> list[ItemChange] | None:
+        with self.lock:
+            return super().changes(since, limit)
+
+    def all(self) -> list[Item]:
+        with self.lock:
+            return super().all()
+
+    def all_encoded(self) -> list[bytes]:
+        with self.lock:
+            return super().all_encoded()
+
+    def page(self, limit: int | None = None, after: int | None = None) -> list[Item]:
+        with self.lock:
+            return super().page(limit, after)
+
+    def page_versioned(
+        self, limit: int | None = None, after: int | None = None
+    ) -> list[tuple[Item, int]]:
+        with self.lock:
+            return super().page_versioned(limit, after)
+
+    def find_by_name(
+        self, name: str, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        with self.lock:
+            return super().find_by_name(name, limit, after)
+
+    def find_by_name_prefix(
+        self,
+        prefix: str,
+        limit: int | None = None,
+        after: tuple[str, int] | None = None,
+    ) -> list[Item]:
+        with self.lock:
+            return super().find_by_name_prefix(prefix, limit, after)
+
+    def delete(self, key: int) -> None:
+        with self.log_lock:
+            if self._version(key) is None:
+                raise KeyError(key)
+            position = self._stage([delete_change(key)])
+        self._commit(position)
+
+    def compare_and_delete(self, key: int, version: int) -> bool:
+        with self.log_lock:
+            if self._version(key) != version:
+                return False
+            position = self._stage([delete_change(key)])
+        self._commit(position)
+        return True
+
+    def delete_many(self, keys: Iterable[int]) -> None:
+        keys = list(keys)
+        with self.log_lock:
+            # Nothing is deleted if a key is missing
+            seen: set[int] = set()
+            for key in keys:
+                if key in seen or self._version(key) is None:
+                    raise KeyError(key)
+                seen.add(key)
+            position = self._stage([delete_change(key) for key in keys])
+        self._commit(position)
+
+    def discard_many(self, keys: Iterable[int]) -> Set[int]:
+        with self.log_lock:
+            deleted = [
+                key for key in dict.fromkeys(keys) if self._version(key) is not None
+            ]
+            position = self._stage([delete_change(key) for key in deleted])
+        self._commit(position)
+        return set(deleted)
+
+    def clear(self) -> None:
+        with self.log_lock:
+            position = self._stage([(OP_CLEAR, 0, None, encode_record(OP_CLEAR, 0))])
+        self._commit(position)
+
+    def close(self) -> None:
+        with self.snapshot_lock, self.sync_lock:
+            if self.failure is None:
+                self._flush()
+            self.log.close()
+            self.lock_file.close()
@@ -0,0 +1,445 @@
+from typing import Any, Iterable, Mapping, Set
+
+from pathlib import Path
+
+from ..models import Item, ItemChange
+from .base import Storage
+from .memory import CHANGE_BUFFER_SIZE
+
+try:
+    import lmdb
+except ImportError:  # pragma: no cover
+    lmdb = None  # type: ignore[assignment]
+
+# Keys are signed 64-bit integers, offset to sort as unsigned big-endian bytes
+KEY_OFFSET = 1 << 63
+VERSION_KEY = b"version"
+# Bytes of the escaped name in a key of the name index, below the default
+# LMDB key size limit of 511 bytes with the marker and the item key
+NAME_KEY_SIZE = 400
+# Markers following the escaped name in the name index: the name is
+# complete, or it was cut to NAME_KEY_SIZE bytes
+NAME_END = b"\x00\x00"
+NAME_CUT = b"\x00\x01"
+
+
+def encode_key(key: int) -> bytes:
+    """Encode an item key in 8 bytes ordered as the key
+
+    >>> encode_key(-1) < encode_key(0) < encode_key(1)
+    True
+    """
+    return (key + KEY_OFFSET).to_bytes(8, "big")
+
+
+def decode_key(data: bytes) -> int:
+    """
+    >>> decode_key(encode_key(-5))
+    -5
+    """
+    return int.from_bytes(data, "big") - KEY_OFFSET
+
+
+def escape_name(name: str) -> bytes:
+    """Encode a name in UTF-8 with its zero bytes escaped, so that a marker
+    starting with a zero byte ends it. The bytes are ordered as the names.
+
+    >>> escape_name("a\\x00b")
+    b'a\\x00\\xffb'
+    """
+    return name.encode().replace(b"\x00", b"\x00\xff")
+
+
+def cut_name(escaped: bytes) -> bytes:
+    """Cut an escaped name to NAME_KEY_SIZE bytes, without splitting an
+    escaped zero byte
+    """
+    cut = escaped[:NAME_KEY_SIZE]
+    if cut.endswith(b"\x00"):
+        cut = cut[:-1]
+    return cut
+
+
+def name_key(name: str) -> bytes:
+    """Return the prefix of the keys of a name in the name index: the
+    escaped name and a marker, before the item key. Long names are cut,
+    items whose names have the same first bytes share a prefix.
+
+    >>> name_key("ab")
+    b'ab\\x00\\x00'
+    >>> len(name_key("a" * 1000)) == NAME_KEY_SIZE + len(NAME_CUT)
+    True
+    """
+    escaped = escape_name(name)
+    if len(escaped) <= NAME_KEY_SIZE:
+        return escaped + NAME_END
+    return cut_name(escaped) + NAME_CUT
+
+
+class LMDBStorage(Storage):
+    """Storage in an LMDB database, a B-tree in a memory-mapped file.
+
+    Reads do not copy pages into the process: values are decoded from the
+    mapped file, and the encoded items are stored in the JSON encoding of
+    the responses, so `get_encoded` and `all_encoded` copy them once into
+    the response body. Worker processes opening the same directory share
+    the pages in the page cache of the operating system, and read from a
+    snapshot without locks. Writes run in a single-writer transaction,
+    serialized across processes by LMDB.
+
+    Values are the 8-byte version of the item followed by its JSON. Names
+    are indexed by keys of the escaped name and the item key; names too
+    long for a key are cut, and the items sharing the cut name are
+    filtered and sorted by their full name when read.
+
+    :param path: database directory, created if missing
+    :param map_size: maximum size of the database in bytes
+    :param sync: whether a commit is flushed to disk before returning
+    :param change_buffer_size: number of recent changes kept for `changes`
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        map_size: int = 1 << 30,
+        sync: bool = True,
+        change_buffer_size: int = CHANGE_BUFFER_SIZE,
+    ) -> None:
+        if lmdb is None:
+            raise RuntimeError("The lmdb storage requires the lmdb package")
+        self.path = Path(path)
+        self.change_buffer_size = change_buffer_size
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Random reads of a catalog larger than the memory do not benefit
+        # from reading ahead
+        self.env = lmdb.open(
+            str(self.path), map_size=map_size, sync=sync, max_dbs=4, readahead=False
+        )
+        self.items = self.env.open_db(b"items")
+        self.names = self.env.open_db(b"names")
+        self.changelog = self.env.open_db(b"changes")
+        self.meta = self.env.open_db(b"meta")
+
+    def _read(self) -> Any:
+        """Begin a read transaction returning buffers of the mapped file,
+        valid until the transaction ends or the cursor moves
+        """
+        return self.env.begin(buffers=True)
+
+    def _advance(self, txn: Any, changes: list[ItemChange]) -> int:
+        """Advance the catalog version by the changes made in the transaction,
+        numbering and recording them, and return the version of the first one
+        """
+        version = self._catalog_version(txn)
+        first = version + 1
+        for change_version, change in enumerate(changes, first):
+            change.version = change_version
+            txn.put(
+                encode_key(change_version),
+                change.model_dump_json().encode(),
+                db=self.changelog,
+            )
+        version += len(changes)
+        txn.put(VERSION_KEY, version.to_bytes(8, "big"), db=self.meta)
+        # Changes older than the buffer size are removed
+        cursor = txn.cursor(db=self.changelog)
+        bound = version - self.change_buffer_size
+        while cursor.first() and decode_key(cursor.key()) <= bound:
+            cursor.delete()
+        return first
+
+    def _catalog_version(self, txn: Any) -> int:
+        value = txn.get(VERSION_KEY, db=self.meta)
+        return 0 if value is None else int.from_bytes(bytes(value), "big")
+
+    def _put(self, txn: Any, key: int, value: Item, version: int) -> None:
+        encoded_key = encode_key(key)
+        previous = txn.get(encoded_key, db=self.items)
+        if previous is not None:
+            previous_name = Item.model_validate_json(bytes(previous)[8:]).name
+            txn.delete(name_key(previous_name) + encoded_key, db=self.names)
+        data = version.to_bytes(8, "big") + value.model_dump_json().encode()
+        txn.put(encoded_key, data, db=self.items)
+        txn.put(name_key(value.name) + encoded_key, b"", db=self.names)
+
+    def _remove(self, txn: Any, key: int) -> bool:
+        encoded_key = encode_key(key)
+        previous = txn.get(encoded_key, db=self.items)
+        if previous is None:
+            return False
+        name = Item.model_validate_json(bytes(previous)[8:]).name
+        txn.delete(name_key(name) + encoded_key, db=self.names)
+        txn.delete(encoded_key, db=self.items)
+        return True
+
+    def _version(self, txn: Any, key: int) -> int | None:
+        value = txn.get(encode_key(key), db=self.items)
+        return None if value is None else int.from_bytes(bytes(value[:8]), "big")
+
+    def has(self, key: int) -> bool:
+        with self._read() as txn:
+            return txn.get(encode_key(key), db=self.items) is not None
+
+    def has_many(self, keys: Iterable[int]) -> set[int]:
+        with self._read() as txn:
+            return {
+                key
+                for key in keys
+                if txn.get(encode_key(key), db=self.items) is not None
+            }
+
+    def set(self, key: int, value: Item) -> None:
+        with self.env.begin(write=True) as txn:
+            version = self._advance(
+                txn, [ItemChange(version=0, op="set", id=key, item=value)]
+            )
+            self._put(txn, key, value, version)
+
+    def _put_many(self, txn: Any, values: Mapping[int, Item]) -> None:
+        first = self._advance(
+            txn,
+            [
+                ItemChange(version=0, op="set", id=key, item=value)
+                for key, value in values.items()
+            ],
+        )
+        for version, (key, value) in enumerate(values.items(), first):
+            self._put(txn, key, value, version)
+
+    def set_many(self, values: Mapping[int, Item]) -> None:
+        with self.env.begin(write=True) as txn:
+            self._put_many(txn, values)
+
+    def create_many(self, values: Mapping[int, Item]) -> Set[int]:
+        with self.env.begin(write=True) as txn:
+            created = {
+                key: value
+                for key, value in values.items()
+                if txn.get(encode_key(key), db=self.items) is None
+            }
+            self._put_many(txn, created)
+        return set(created)
+
+    def upsert_many(self, values: Mapping[int, Item]) -> Set[int]:
+        with self.env.begin(write=True) as txn:
+            created = {
+                key for key in values if txn.get(encode_key(key), db=self.items) is None
+            }
+            self._put_many(txn, values)
+        return created
+
+    def compare_and_set(self, key: int, value: Item, version: int | None) -> int | None:
+        with self.env.begin(write=True) as txn:
+            if self._version(txn, key) != version:
+                return None
+            new_version = self._advance(
+                txn, [ItemChange(version=0, op="set", id=key, item=value)]
+            )
+            self._put(txn, key, value, new_version)
+        return new_version
+
+    def get(self, key: int) -> Item | None:
+        with self._read() as txn:
+            value = txn.get(encode_key(key), db=self.items)
+            if value is None:
+                return None
+            return Item.model_validate_json(bytes(value[8:]))
+
+    def get_many(self, keys: Iterable[int]) -> dict[int, Item]:
+        items = {}
+        with self._read() as txn:
+            for key in keys:
+                value = txn.get(encode_key(key), db=self.items)
+                if value is not None:
+                    items[key] = Item.model_validate_json(bytes(value[8:]))
+        return items
+
+    def get_versioned(self, key: int) -> tuple[Item, int] | None:
+        with self._read() as txn:
+            value = txn.get(encode_key(key), db=self.items)
+            if value is None:
+                return None
+            version = int.from_bytes(bytes(value[:8]), "big")
+            return Item.model_validate_json(bytes(value[8:])), version
+
+    def get_encoded(self, key: int) -> tuple[bytes, int] | None:
+        with self._read() as txn:
+            value = txn.get(encode_key(key), db=self.items)
+            if value is None:
+                return None
+            return bytes(value[8:]), int.from_bytes(bytes(value[:8]), "big")
+
+    def catalog_version(self) -> int:
+        with self._read() as txn:
+            return self._catalog_version(txn)
+
+    def changes(self, since: int, limit: int | None = None) -> list[ItemChange] | None:
+        changes: list[ItemChange] = []
+        with self._read() as txn:
+            # The version and the changes are read from the same snapshot
+            version = self._catalog_version(txn)
+            if since > version:
+                return None
+            cursor = txn.cursor(db=self.changelog)
+            if cursor.set_range(encode_key(since + 1)):
+                for _, value in cursor:
+                    if limit is not None and len(changes) >= limit:
+                        break
+                    changes.append(ItemChange.model_validate_json(bytes(value)))
+        if since < version and (not changes or changes[0].version != since + 1):
+            return None
+        return changes
+
+    def all(self) -> list[Item]:
+        return self.page()
+
+    def all_encoded(self) -> list[bytes]:
+        with self._read() as txn:
+            return [bytes(value[8:]) for _, value in txn.cursor(db=self.items)]
+
+    def page(self, limit: int | None = None, after: int | None = None) -> list[Item]:
+        items: list[Item] = []
+        with self._read() as txn:
+            cursor = txn.cursor(db=self.items)
+            if after is None:
+                found = cursor.first()
+            else:
+                found = cursor.set_range(encode_key(after))
+                if found and decode_key(bytes(cursor.key())) == after:
+                    found = cursor.next()
+            if not found:
+                return items
+            for _, value in cursor:
+                if limit is not None and len(items) >= limit:
+                    break
+                items.append(Item.model_validate_json(bytes(value[8:])))
+        return items
+
+    def _scan_names(
+        self,
+        txn: Any,
+        start: bytes,
+        prefix: bytes,
+        after: tuple[str, int] | None,
+        limit: int | None,
+        match: Any,
+    ) -> list[Item]:
+        """Read the items of the name index from the key `start` while keys
+        start with `prefix`, in order of (name, key), keeping the items
+        for which `match(item)` is true and (name, key) is after `after`
+        """
+        items: list[Item] = []
+        cursor = txn.cursor(db=self.names)
+        # LMDB keys are not empty, the index is read from its first key
+        if not (cursor.set_range(start) if start else cursor.first()):
+            return items
+        # Items of a cut name, sorted by full name before they are returned
+        group: list[Item] = []
+        group_prefix = b""
+
+        def flush() -> None:
+            group.sort(key=lambda item: (item.name, item.id))
+            items.extend(
+                item
+                for item in group
+                if match(item) and (after is None or (item.name, item.id) > after)
+            )
+            group.clear()
+
+        for buffer in cursor.iternext(values=False):
+            key = bytes(buffer)
+            if not key.startswith(prefix):
+                break
+            if group and key[:-8] != group_prefix:
+                flush()
+            if limit is not None and len(items) >= limit:
+                break
+            value = txn.get(key[-8:], db=self.items)
+            item = Item.model_validate_json(bytes(value[8:]))
+            if key[-10:-8] == NAME_CUT:
+                group_prefix = key[:-8]
+                group.append(item)
+            elif match(item) and (after is None or (item.name, item.id) > after):
+                items.append(item)
+        flush()
+        return items[:limit]
+
+    def find_by_name(
+        self, name: str, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        prefix = name_key(name)
+        start = prefix if after is None else prefix + encode_key(after)
+        with self._read() as txn:
+            return self._scan_names(
+                txn,
+                start,
+                prefix,
+                None if after is None else (name, after),
+                limit,
+                lambda item: item.name == name,
+            )
+
+    def find_by_name_prefix(
+        self,
+        prefix: str,
+        limit: int | None = None,
+        after: tuple[str, int] | None = None,
+    ) -> list[Item]:
+        lower = cut_name(escape_name(prefix))
+        start = lower
+        if after is not None:
+            name, key = after
+            after_key = name_key(name)
+            if not after_key.endswith(NAME_CUT):
+                after_key += encode_key(key)
+            start = max(start, after_key)
+        with self._read() as txn:
+            return self._scan_names(
+                txn,
+                start,
+                lower,
+                after,
+                limit,
+                lambda item: item.name.startswith(prefix),
+            )
+
+    def delete(self, key: int) -> None:
+        with self.env.begin(write=True) as txn:
+            if not self._remove(txn, key):
+                raise KeyError(key)
+            self._advance(txn, [ItemChange(version=0, op="delete", id=key)])
+
+    def compare_and_delete(self, key: int, version: int) -> bool:
+        with self.env.begin(write=True) as txn:
+            if self._version(txn, key) != version:
+                return False
+            self._remove(txn, key)
+            self._advance(txn, [ItemChange(version=0, op="delete", id=key)])
+        return True
+
+    def delete_many(self, keys: Iterable[int]) -> None:
+        keys = list(keys)
+        with self.env.begin(write=True) as txn:
+            for key in keys:
+                if not self._remove(txn, key):
+                    raise KeyError(key)
+            self._advance(
+                txn, [ItemChange(version=0, op="delete", id=key) for key in keys]
+            )
+
+    def discard_many(self, keys: Iterable[int]) -> Set[int]:
+        with self.env.begin(write=True) as txn:
+            deleted = [key for key in dict.fromkeys(keys) if self._remove(txn, key)]
+            self._advance(
+                txn, [ItemChange(version=0, op="delete", id=key) for key in deleted]
+            )
+        return set(deleted)
+
+    def clear(self) -> None:
+        with self.env.begin(write=True) as txn:
+            txn.drop(self.items, delete=False)
+            txn.drop(self.names, delete=False)
+            self._advance(txn, [ItemChange(version=0, op="clear")])
+
+    def close(self) -> None:
+        self.env.close()
@@ -0,0 +1,192 @@
+from typing import Iterable, Optional
+
+from bisect import bisect_left, bisect_right, insort
+
+from ..models import Item, ItemChange
+from .base import Storage
+from .changes import ChangeBuffer
+
+# Changes kept for readers of `changes`
+CHANGE_BUFFER_SIZE = 10000
+
+
+class MemoryStorage(Storage):
+    """Storage in a dictionary of the process memory.
+
+    :param initial: initial items
+    :param change_buffer_size: number of recent changes kept for `changes`
+    :param cache_encoded: whether the JSON encoding of an item is kept once
+        read, until the item changes
+    """
+
+    blocking = False
+
+    def __init__(
+        self,
+        initial: Optional[dict[int, Item]] = None,
+        change_buffer_size: int = CHANGE_BUFFER_SIZE,
+        cache_encoded: bool = True,
+    ) -> None:
+        self.kvs: dict[int, Item] = initial if initial is not None else {}
+        self.cache_encoded = cache_encoded
+        # JSON encoding of the items read since their last change
+        self.encoded: dict[int, bytes] = {}
+        self._reindex()
+        # Version of the last change and versions of the items
+        self.sequence = len(self.keys)
+        self.versions: dict[int, int] = {
+            key: version for version, key in enumerate(self.keys, 1)
+        }
+        self.recent_changes = ChangeBuffer(change_buffer_size, self.sequence)
+
+    def _reindex(self) -> None:
+        """Rebuild the indexes from the items"""
+        # Keys in ascending order, used for cursor-based pagination
+        self.keys: list[int] = sorted(self.kvs)
+        # Hash index of names to keys in ascending order
+        self.names: dict[str, list[int]] = {}
+        for key in self.keys:
+            self.names.setdefault(self.kvs[key].name, []).append(key)
+        # (name, key) pairs in ascending order, used for prefix search
+        self.name_keys: list[tuple[str, int]] = sorted(
+            (value.name, key) for key, value in self.kvs.items()
+        )
+
+    def _index(self, key: int, value: Item) -> None:
+        insort(self.names.setdefault(value.name, []), key)
+        insort(self.name_keys, (value.name, key))
+
+    def _unindex(self, key: int, value: Item) -> None:
+        keys = self.names[value.name]
+        del keys[bisect_left(keys, key)]
+        if not keys:
+            del self.names[value.name]
+        del self.name_keys[bisect_left(self.name_keys, (value.name, key))]
+
+    def _encode(self, key: int, value: Item) -> bytes:
+        encoded = self.encoded.get(key)
+        if encoded is None:
+            encoded = value.model_dump_json().encode()
+            if self.cache_encoded:
+                self.encoded[key] = encoded
+        return encoded
+
+    def has(self, key: int) -> bool:
+        return key in self.kvs
+
+    def set(self, key: int, value: Item) -> None:
+        previous = self.kvs.get(key)
+        if previous is None:
+            insort(self.keys, key)
+            self._index(key, value)
+        elif previous.name != value.name:
+            self._unindex(key, previous)
+            self._index(key, value)
+        self.kvs[key] = value
+        self.encoded.pop(key, None)
+        self.sequence += 1
+        self.versions[key] = self.sequence
+        self.recent_changes.append(
+            ItemChange(version=self.sequence, op="set", id=key, item=value)
+        )
+
+    def compare_and_set(self, key: int, value: Item, version: int | None) -> int | None:
+        if self.versions.get(key) != version:
+            return None
+        # Not `self.set`: subclasses call this method with their lock held
+        MemoryStorage.set(self, key, value)
+        return self.sequence
+
+    def get(self, key: int) -> Item | None:
+        return self.kvs.get(key)
+
+    def get_many(self, keys: Iterable[int]) -> dict[int, Item]:
+        return {key: self.kvs[key] for key in keys if key in self.kvs}
+
+    def get_versioned(self, key: int) -> tuple[Item, int] | None:
+        value = self.kvs.get(key)
+        if value is None:
+            return None
+        return value, self.versions[key]
+
+    def get_encoded(self, key: int) -> tuple[bytes, int] | None:
+        value = self.kvs.get(key)
+        if value is None:
+            return None
+        return self._encode(key, value), self.versions[key]
+
+    def catalog_version(self) -> int:
+        return self.sequence
+
+    def changes(self, since: int, limit: int | None = None) -> list[ItemChange] | None:
+        return self.recent_changes.since(since, limit)
+
+    def all(self) -> list[Item]:
+        return list(self.kvs.values())
+
+    def all_encoded(self) -> list[bytes]:
+        return [self._encode(key, self.kvs[key]) for key in self.keys]
+
+    def page(self, limit: int | None = None, after: int | None = None) -> list[Item]:
+        start = 0 if after is None else bisect_right(self.keys, after)
+        stop = None if limit is None else start + limit
+        return [self.kvs[key] for key in self.keys[start:stop]]
+
+    def page_versioned(
+        self, limit: int | None = None, after: int | None = None
+    ) -> list[tuple[Item, int]]:
+        start = 0 if after is None else bisect_right(self.keys, after)
+        stop = None if limit is None else start + limit
+        return [(self.kvs[key], self.versions[key]) for key in self.keys[start:stop]]
+
+    def find_by_name(
+        self, name: str, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        keys = self.names.get(name, [])
+        start = 0 if after is None else bisect_right(keys, after)
+        stop = None if limit is None else start + limit
+        return [self.kvs[key] for key in keys[start:stop]]
+
+    def find_by_name_prefix(
+        self,
+        prefix: str,
+        limit: int | None = None,
+        after: tuple[str, int] | None = None,
+    ) -> list[Item]:
+        # A 1-tuple sorts before all pairs with the same name
+        index = bisect_left(self.name_keys, (prefix,))
+        if after is not None:
+            index = max(index, bisect_right(self.name_keys, after))
+        items: list[Item] = []
+        while index < len(self.name_keys) and (limit is None or len(items) < limit):
+            name, key = self.name_keys[index]
+            if not name.startswith(prefix):
+                break
+            items.append(self.kvs[key])
+            index += 1
+        return items
+
+    def delete(self, key: int) -> None:
+        value = self.kvs.pop(key)
+        del self.keys[bisect_right(self.keys, key) - 1]
+        self._unindex(key, value)
+        self.encoded.pop(key, None)
+        del self.versions[key]
+        self.sequence += 1
+        self.recent_changes.append(
+            ItemChange(version=self.sequence, op="delete", id=key)
+        )
+
+    def compare_and_delete(self, key: int, version: int) -> bool:
+        if self.versions.get(key) != version:
+            return False
+        MemoryStorage.delete(self, key)
+        return True
+
+    def clear(self) -> None:
+        self.kvs = {}
+        self._reindex()
+        self.encoded = {}
+        self.versions = {}
+        self.sequence += 1
+        self.recent_changes.append(ItemChange(version=self.sequence, op="clear"))
@@ -0,0 +1,50 @@
+from typing import Iterable
+
+from ..models import Item, ItemChange
+from .changes import ChangeBuffer
+from .memory import MemoryStorage
+
+
+class ReplicaStorage(MemoryStorage):
+    """Copy in the process memory of the catalog of a primary node.
+
+    The copy is loaded from the items of the primary with their versions,
+    then changed by the changes of the primary at their versions, so the
+    catalog version, item versions and change feed of the copy are those of
+    the primary. Items are not written to the copy otherwise.
+    """
+
+    def load(self, items: Iterable[tuple[Item, int]], version: int) -> None:
+        """Replace the copy by items with their versions, read from the
+        primary after its catalog version `version`
+        """
+        self.kvs = {}
+        self.versions = {}
+        for value, item_version in items:
+            self.kvs[value.id] = value
+            self.versions[value.id] = item_version
+        self._reindex()
+        self.encoded = {}
+        self.sequence = version
+        # Readers of the previous changes of the copy have to read it again
+        self.recent_changes = ChangeBuffer(
+            self.recent_changes.changes.maxlen or 0, version
+        )
+
+    def apply(self, changes: Iterable[ItemChange]) -> None:
+        """Apply changes of the primary made after the version of the copy"""
+        for change in changes:
+            # `MemoryStorage` numbers a change after the catalog version
+            self.sequence = change.version - 1
+            if change.op == "clear":
+                self.clear()
+            elif change.id is None:
+                raise ValueError(f"Change {change.version} has no item id")
+            elif change.item is not None:
+                self.set(change.id, change.item)
+            elif change.id in self.kvs:
+                self.delete(change.id)
+            else:
+                # Items loaded after the change may already miss it
+                self.sequence = change.version
+                self.recent_changes.append(change)
@@ -0,0 +1,197 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Set,
+    TypeVar,
+    cast,
+)
+
+import asyncio
+
+from ..models import Item, ItemChange
+from .adapter import AsyncStorage
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Calls shared by the concurrent callers with the same key.
+
+    The first caller of a key starts the call, the callers of the key that
+    come while it runs wait for its result, or its exception. A caller
+    cancelled while waiting does not cancel the call of the others.
+    """
+
+    def __init__(self) -> None:
+        self.calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        future = self.calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self.calls[key] = future
+            future.add_done_callback(lambda _: self._done(key, future))
+        return cast(T, await asyncio.shield(future))
+
+    def _done(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        # A call forgotten in the meantime may have been replaced
+        if self.calls.get(key) is future:
+            del self.calls[key]
+
+    def forget(self) -> None:
+        """Start new calls for the next callers, the callers of the running
+        calls still get their results
+        """
+        self.calls = {}
+
+
+class SingleFlightStorage:
+    """`AsyncStorage` whose concurrent identical reads share one read of
+    the storage.
+
+    When many requests read the same item or the same page at once, as
+    after a change of a popular item, the storage is read and the items
+    decoded once. After a write, reads start again instead of sharing a
+    read started before the write, so a reader sees the writes made through
+    this storage before its read started. So do the reads after a new
+    catalog version is read, the writes of other processes or storages
+    included: a reader that read a version only shares reads started after
+    it, which are at least as recent.
+
+    :param storage: storage read and written
+    """
+
+    def __init__(self, storage: AsyncStorage) -> None:
+        self.storage = storage
+        self.flights = SingleFlight()
+        # Last catalog version read
+        self.version: int | None = None
+
+    async def _write(self, write: Awaitable[T]) -> T:
+        try:
+            return await write
+        finally:
+            self.flights.forget()
+
+    async def has(self, key: int) -> bool:
+        return await self.flights.run(("has", key), lambda: self.storage.has(key))
+
+    async def has_many(self, keys: Iterable[int]) -> set[int]:
+        return await self.storage.has_many(keys)
+
+    async def set(self, key: int, value: Item) -> None:
+        await self._write(self.storage.set(key, value))
+
+    async def set_many(self, values: Mapping[int, Item]) -> None:
+        await self._write(self.storage.set_many(values))
+
+    async def create_many(self, values: Mapping[int, Item]) -> Set[int]:
+        return await self._write(self.storage.create_many(values))
+
+    async def upsert_many(self, values: Mapping[int, Item]) -> Set[int]:
+        return await self._write(self.storage.upsert_many(values))
+
+    async def compare_and_set(
+        self, key: int, value: Item, version: int | None
+    ) -> int | None:
+        return await self._write(self.storage.compare_and_set(key, value, version))
+
+    async def get(self, key: int) -> Item | None:
+        return await self.flights.run(("get", key), lambda: self.storage.get(key))
+
+    async def get_many(self, keys: Iterable[int]) -> dict[int, Item]:
+        return await self.storage.get_many(keys)
+
+    async def get_versioned(self, key: int) -> tuple[Item, int] | None:
+        return await self.flights.run(
+            ("get_versioned", key), lambda: self.storage.get_versioned(key)
+        )
+
+    async def get_encoded(self, key: int) -> tuple[bytes, int] | None:
+        return await self.flights.run(
+            ("get_encoded", key), lambda: self.storage.get_encoded(key)
+        )
+
+    async def catalog_version(self) -> int:
+        return await self.flights.run(("catalog_version",), self._catalog_version)
+
+    async def _catalog_version(self) -> int:
+        version = await self.storage.catalog_version()
+        if version != self.version:
+            # Reads started before are not shared with the callers of the
+            # new version, which get it once this call is done
+            self.version = version
+            self.flights.forget()
+        return version
+
+    async def changes(
+        self, since: int, limit: int | None = None
+    ) -> list[ItemChange] | None:
+        return await self.flights.run(
+            ("changes", since, limit), lambda: self.storage.changes(since, limit)
+        )
+
+    def all(self) -> AsyncIterator[Item]:
+        return self.storage.all()
+
+    async def all_encoded(self) -> list[bytes]:
+        return await self.flights.run(
+            ("all_encoded",), lambda: self.storage.all_encoded()
+        )
+
+    async def page(
+        self, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        return await self.flights.run(
+            ("page", limit, after), lambda: self.storage.page(limit, after)
+        )
+
+    async def page_versioned(
+        self, limit: int | None = None, after: int | None = None
+    ) -> list[tuple[Item, int]]:
+        return await self.flights.run(
+            ("page_versioned", limit, after),
+            lambda: self.storage.page_versioned(limit, after),
+        )
+
+    async def find_by_name(
+        self, name: str, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        return await self.flights.run(
+            ("find_by_name", name, limit, after),
+            lambda: self.storage.find_by_name(name, limit, after),
+        )
+
+    async def find_by_name_prefix(
+        self,
+        prefix: str,
+        limit: int | None = None,
+        after: tuple[str, int] | None = None,
+    ) -> list[Item]:
+        return await self.flights.run(
+            ("find_by_name_prefix", prefix, limit, after),
+            lambda: self.storage.find_by_name_prefix(prefix, limit, after),
+        )
+
+    async def delete(self, key: int) -> None:
+        await self._write(self.storage.delete(key))
+
+    async def compare_and_delete(self, key: int, version: int) -> bool:
+        return await self._write(self.storage.compare_and_delete(key, version))
+
+    async def delete_many(self, keys: Iterable[int]) -> None:
+        await self._write(self.storage.delete_many(keys))
+
+    async def discard_many(self, keys: Iterable[int]) -> Set[int]:
+        return await self._write(self.storage.discard_many(keys))
+
+    async def clear(self) -> None:
+        await self._write(self.storage.clear())
+
+    async def close(self) -> None:
+        await self.storage.close()
@@ -0,0 +1,432 @@
+from typing import Iterable, Iterator, Mapping, Set
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from ..models import Item, ItemChange
+from .base import Storage
+from .memory import CHANGE_BUFFER_SIZE
+
+# Statements are module constants: the sqlite3 module caches prepared
+# statements by their text, so each of them is compiled once per connection.
+CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS items (
+        id INTEGER PRIMARY KEY,
+        value TEXT NOT NULL,
+        version INTEGER NOT NULL DEFAULT 0
+    )
+"""
+SELECT_COLUMNS = "SELECT name FROM pragma_table_info('items')"
+ADD_VERSION_COLUMN = "ALTER TABLE items ADD COLUMN version INTEGER NOT NULL DEFAULT 0"
+# The catalog version is kept in a table of one row, so that it is shared by
+# all connections to the database
+CREATE_CATALOG = "CREATE TABLE IF NOT EXISTS catalog (version INTEGER NOT NULL)"
+INIT_CATALOG = """
+    INSERT INTO catalog (version) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM catalog)
+"""
+SELECT_CATALOG_VERSION = "SELECT version FROM catalog"
+ADVANCE_CATALOG_VERSION = "UPDATE catalog SET version = version + ?"
+# Recent changes, written in the transaction of the change: the id is null
+# for a clear and the value is null for a delete. Changes older than the
+# buffer size are removed by the transaction that adds newer ones.
+CREATE_CHANGES = """
+    CREATE TABLE IF NOT EXISTS changes (
+        version INTEGER PRIMARY KEY,
+        id INTEGER,
+        value TEXT
+    )
+"""
+INSERT_CHANGE = "INSERT INTO changes (version, id, value) VALUES (?, ?, ?)"
+TRIM_CHANGES = "DELETE FROM changes WHERE version <= ?"
+SELECT_CHANGES = """
+    SELECT version, id, value FROM changes WHERE version > ? ORDER BY version LIMIT ?
+"""
+# Items are indexed by name through an index on an expression, queries use
+# the index when they repeat the expression
+NAME = "json_extract(value, '$.name')"
+CREATE_NAME_INDEX = f"CREATE INDEX IF NOT EXISTS items_name ON items ({NAME}, id)"
+SELECT_EXISTS = "SELECT 1 FROM items WHERE id = ?"
+SELECT_EXISTING = "SELECT id FROM items WHERE id IN ({})"
+# Keys per `IN (...)` query, below the default SQLite variable limit
+EXISTING_BATCH_SIZE = 500
+SELECT_MANY = "SELECT id, value FROM items WHERE id IN ({})"
+SELECT_ONE = "SELECT value FROM items WHERE id = ?"
+SELECT_VERSIONED = "SELECT value, version FROM items WHERE id = ?"
+# Values are stored in the JSON encoding of the responses, they are read as
+# bytes to be sent without decoding
+SELECT_ENCODED = "SELECT CAST(value AS BLOB), version FROM items WHERE id = ?"
+SELECT_VERSION = "SELECT version FROM items WHERE id = ?"
+SELECT_ALL = "SELECT value FROM items ORDER BY id"
+SELECT_ALL_ENCODED = "SELECT CAST(value AS BLOB) FROM items ORDER BY id"
+SELECT_FIRST_PAGE = "SELECT value FROM items ORDER BY id LIMIT ?"
+SELECT_PAGE = "SELECT value FROM items WHERE id > ? ORDER BY id LIMIT ?"
+SELECT_FIRST_BY_NAME = f"SELECT value FROM items WHERE {NAME} = ? ORDER BY id LIMIT ?"
+SELECT_BY_NAME = f"""
+    SELECT value FROM items WHERE {NAME} = ? AND id > ? ORDER BY id LIMIT ?
+"""
+SELECT_FIRST_BY_NAME_RANGE = f"""
+    SELECT value FROM items WHERE {NAME} >= ? AND {NAME} < ?
+    ORDER BY {NAME}, id LIMIT ?
+"""
+# The index is searched from the name of the cursor, the rows of that name
+# up to the key of the cursor are skipped
+SELECT_BY_NAME_RANGE = f"""
+    SELECT value FROM items
+    WHERE {NAME} >= ? AND {NAME} < ? AND ({NAME} > ? OR id > ?)
+    ORDER BY {NAME}, id LIMIT ?
+"""
+UPSERT = """
+    INSERT INTO items (id, value, version) VALUES (?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET value = excluded.value, version = excluded.version
+"""
+DELETE = "DELETE FROM items WHERE id = ?"
+DELETE_VERSION = "DELETE FROM items WHERE id = ? AND version = ?"
+DELETE_ALL = "DELETE FROM items"
+
+
+def prefix_upper_bound(prefix: str) -> str | bytes:
+    """Return the least value greater than all strings starting with `prefix`
+
+    Text is compared by code points, which is the order of the UTF-8 bytes
+    compared by SQLite. Without such a string, an empty BLOB is returned,
+    SQLite sorts BLOBs after all text values.
+
+    >>> prefix_upper_bound("ab")
+    'ac'
+    >>> prefix_upper_bound("")
+    b''
+    """
+    prefix = prefix.rstrip(chr(0x10FFFF))
+    if not prefix:
+        return b""
+    following = ord(prefix[-1]) + 1
+    # Surrogates are not valid in UTF-8 and are skipped
+    if 0xD800 <= following <= 0xDFFF:
+        following = 0xE000
+    return prefix[:-1] + chr(following)
+
+
+class SQLiteStorage(Storage):
+    """Storage in an embedded SQLite database.
+
+    The database runs in WAL mode, so readers are not blocked by the writer
+    and a commit is a sequential append to the log. Batches are written in
+    a single transaction. Every thread reads through its own connection, so
+    reads from a thread pool run in parallel; an in-memory database is
+    private to its connection and is read through the writer connection.
+
+    :param path: database file path, or ":memory:"
+    :param cache_size: size of the page cache in KiB
+    :param busy_timeout: seconds to wait for a lock held by another process
+    :param change_buffer_size: number of recent changes kept for `changes`
+    """
+
+    def __init__(
+        self,
+        path: str,
+        cache_size: int = 65536,
+        busy_timeout: float = 5.0,
+        change_buffer_size: int = CHANGE_BUFFER_SIZE,
+    ) -> None:
+        self.path = path
+        self.cache_size = cache_size
+        self.busy_timeout = busy_timeout
+        self.change_buffer_size = change_buffer_size
+        self.lock = threading.Lock()
+        self.connection = self._connect()
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        with self._transaction() as connection:
+            connection.execute(CREATE_TABLE)
+            columns = {name for (name,) in connection.execute(SELECT_COLUMNS)}
+            if "version" not in columns:
+                connection.execute(ADD_VERSION_COLUMN)
+            connection.execute(CREATE_NAME_INDEX)
+            connection.execute(CREATE_CATALOG)
+            connection.execute(INIT_CATALOG)
+            connection.execute(CREATE_CHANGES)
+        self.local = threading.local()
+        self.readers: list[sqlite3.Connection] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA synchronous = NORMAL")
+        # A negative cache size is interpreted as KiB instead of pages
+        connection.execute(f"PRAGMA cache_size = -{int(self.cache_size)}")
+        return connection
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        if self.path == ":memory:":
+            with self.lock:
+                yield self.connection
+            return
+        reader = getattr(self.local, "connection", None)
+        if reader is None:
+            reader = self.local.connection = self._connect()
+            with self.lock:
+                self.readers.append(reader)
+        yield reader
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def _advance(
+        self,
+        connection: sqlite3.Connection,
+        changes: list[tuple[int | None, str | None]],
+    ) -> int:
+        """Advance the catalog version by the (id, value) changes made in the
+        transaction, record them and return the version of the first one
+        """
+        connection.execute(ADVANCE_CATALOG_VERSION, (len(changes),))
+        (version,) = connection.execute(SELECT_CATALOG_VERSION).fetchone()
+        first = int(version) - len(changes) + 1
+        connection.executemany(
+            INSERT_CHANGE,
+            (
+                (change_version, id, value)
+                for change_version, (id, value) in enumerate(changes, first)
+            ),
+        )
+        connection.execute(TRIM_CHANGES, (int(version) - self.change_buffer_size,))
+        return first
+
+    def _fetch(self, sql: str, *parameters: int | str | bytes) -> list[Item]:
+        with self._reader() as connection:
+            rows = connection.execute(sql, parameters).fetchall()
+        return [Item.model_validate_json(value) for (value,) in rows]
+
+    def has(self, key: int) -> bool:
+        with self._reader() as connection:
+            row = connection.execute(SELECT_EXISTS, (key,)).fetchone()
+        return row is not None
+
+    def _existing(self, connection: sqlite3.Connection, keys: list[int]) -> set[int]:
+        existing: set[int] = set()
+        for start in range(0, len(keys), EXISTING_BATCH_SIZE):
+            batch = keys[start : start + EXISTING_BATCH_SIZE]
+            sql = SELECT_EXISTING.format(", ".join("?" * len(batch)))
+            existing.update(id for (id,) in connection.execute(sql, batch))
+        return existing
+
+    def _upsert(
+        self,
+        connection: sqlite3.Connection,
+        changes: list[tuple[int | None, str | None]],
+    ) -> None:
+        """Set the (id, value) items in the transaction at new versions"""
+        first = self._advance(connection, changes)
+        connection.executemany(
+            UPSERT,
+            (
+                (key, data, version)
+                for version, (key, data) in enumerate(changes, first)
+            ),
+        )
+
+    def has_many(self, keys: Iterable[int]) -> set[int]:
+        with self._reader() as connection:
+            return self._existing(connection, list(keys))
+
+    def set(self, key: int, value: Item) -> None:
+        data = value.model_dump_json()
+        with self._transaction() as connection:
+            version = self._advance(connection, [(key, data)])
+            connection.execute(UPSERT, (key, data, version))
+
+    def set_many(self, values: Mapping[int, Item]) -> None:
+        changes: list[tuple[int | None, str | None]] = [
+            (key, value.model_dump_json()) for key, value in values.items()
+        ]
+        with self._transaction() as connection:
+            self._upsert(connection, changes)
+
+    def create_many(self, values: Mapping[int, Item]) -> Set[int]:
+        encoded = {key: value.model_dump_json() for key, value in values.items()}
+        # The keys are checked in the write transaction, which excludes the
+        # writers of the other connections and processes
+        with self._transaction() as connection:
+            existing = self._existing(connection, list(encoded))
+            changes: list[tuple[int | None, str | None]] = [
+                (key, data) for key, data in encoded.items() if key not in existing
+            ]
+            self._upsert(connection, changes)
+        return set(encoded) - existing
+
+    def upsert_many(self, values: Mapping[int, Item]) -> Set[int]:
+        changes: list[tuple[int | None, str | None]] = [
+            (key, value.model_dump_json()) for key, value in values.items()
+        ]
+        with self._transaction() as connection:
+            existing = self._existing(connection, list(values))
+            self._upsert(connection, changes)
+        return set(values) - existing
+
+    def compare_and_set(self, key: int, value: Item, version: int | None) -> int | None:
+        data = value.model_dump_json()
+        with self._transaction() as connection:
+            row = connection.execute(SELECT_VERSION, (key,)).fetchone()
+            if (row[0] if row is not None else None) != version:
+                return None
+            new_version = self._advance(connection, [(key, data)])
+            connection.execute(UPSERT, (key, data, new_version))
+        return new_version
+
+    def get(self, key: int) -> Item | None:
+        items = self._fetch(SELECT_ONE, key)
+        return items[0] if items else None
+
+    def get_many(self, keys: Iterable[int]) -> dict[int, Item]:
+        keys = list(keys)
+        items: dict[int, Item] = {}
+        with self._reader() as connection:
+            for start in range(0, len(keys), EXISTING_BATCH_SIZE):
+                batch = keys[start : start + EXISTING_BATCH_SIZE]
+                sql = SELECT_MANY.format(", ".join("?" * len(batch)))
+                for id, value in connection.execute(sql, batch):
+                    items[id] = Item.model_validate_json(value)
+        return items
+
+    def get_versioned(self, key: int) -> tuple[Item, int] | None:
+        with self._reader() as connection:
+            row = connection.execute(SELECT_VERSIONED, (key,)).fetchone()
+        if row is None:
+            return None
+        value, version = row
+        return Item.model_validate_json(value), version
+
+    def get_encoded(self, key: int) -> tuple[bytes, int] | None:
+        with self._reader() as connection:
+            row = connection.execute(SELECT_ENCODED, (key,)).fetchone()
+        if row is None:
+            return None
+        value, version = row
+        return value, version
+
+    def catalog_version(self) -> int:
+        with self._reader() as connection:
+            (version,) = connection.execute(SELECT_CATALOG_VERSION).fetchone()
+        return int(version)
+
+    def changes(self, since: int, limit: int | None = None) -> list[ItemChange] | None:
+        with self._reader() as connection:
+            # The version and the changes are read from the same snapshot
+            connection.execute("BEGIN")
+            try:
+                (version,) = connection.execute(SELECT_CATALOG_VERSION).fetchone()
+                rows = connection.execute(
+                    SELECT_CHANGES, (since, -1 if limit is None else limit)
+                ).fetchall()
+            finally:
+                connection.execute("COMMIT")
+        if since > version or (
+            since < version and (not rows or rows[0][0] != since + 1)
+        ):
+            return None
+        changes = []
+        for change_version, id, value in rows:
+            if id is None:
+                changes.append(ItemChange(version=change_version, op="clear"))
+            elif value is None:
+                changes.append(ItemChange(version=change_version, op="delete", id=id))
+            else:
+                changes.append(
+                    ItemChange(
+                        version=change_version,
+                        op="set",
+                        id=id,
+                        item=Item.model_validate_json(value),
+                    )
+                )
+        return changes
+
+    def all(self) -> list[Item]:
+        return self._fetch(SELECT_ALL)
+
+    def all_encoded(self) -> list[bytes]:
+        with self._reader() as connection:
+            return [value for (value,) in connection.execute(SELECT_ALL_ENCODED)]
+
+    def page(self, limit: int | None = None, after: int | None = None) -> list[Item]:
+        # A negative limit means no limit in SQLite
+        limit = -1 if limit is None else limit
+        if after is None:
+            return self._fetch(SELECT_FIRST_PAGE, limit)
+        return self._fetch(SELECT_PAGE, after, limit)
+
+    def find_by_name(
+        self, name: str, limit: int | None = None, after: int | None = None
+    ) -> list[Item]:
+        limit = -1 if limit is None else limit
+        if after is None:
+            return self._fetch(SELECT_FIRST_BY_NAME, name, limit)
+        return self._fetch(SELECT_BY_NAME, name, after, limit)
+
+    def find_by_name_prefix(
+        self,
+        prefix: str,
+        limit: int | None = None,
+        after: tuple[str, int] | None = None,
+    ) -> list[Item]:
+        limit = -1 if limit is None else limit
+        upper = prefix_upper_bound(prefix)
+        if after is None:
+            return self._fetch(SELECT_FIRST_BY_NAME_RANGE, prefix, upper, limit)
+        name, key = after
+        lower = max(prefix, name)
+        return self._fetch(SELECT_BY_NAME_RANGE, lower, upper, name, key, limit)
+
+    def delete(self, key: int) -> None:
+        with self._transaction() as connection:
+            if connection.execute(DELETE, (key,)).rowcount == 0:
+                raise KeyError(key)
+            self._advance(connection, [(key, None)])
+
+    def compare_and_delete(self, key: int, version: int) -> bool:
+        with self._transaction() as connection:
+            if connection.execute(DELETE_VERSION, (key, version)).rowcount == 0:
+                return False
+            self._advance(connection, [(key, None)])
+        return True
+
+    def delete_many(self, keys: Iterable[int]) -> None:
+        keys = list(keys)
+        with self._transaction() as connection:
+            for key in keys:
+                if connection.execute(DELETE, (key,)).rowcount == 0:
+                    raise KeyError(key)
+            self._advance(connection, [(key, None) for key in keys])
+
+    def discard_many(self, keys: Iterable[int]) -> Set[int]:
+        keys = list(dict.fromkeys(keys))
+        with self._transaction() as connection:
+            deleted = [
+                key for key in keys if connection.execute(DELETE, (key,)).rowcount
+            ]
+            self._advance(connection, [(key, None) for key in deleted])
+        return set(deleted)
+
+    def clear(self) -> None:
+        with self._transaction() as connection:
+            connection.execute(DELETE_ALL)
+            self._advance(connection, [(None, None)])
+
+    def close(self) -> None:
+        with self.lock:
+            for reader in self.readers:
+                reader.close()
+            self.connection.close()
@@ -0,0 +1,230 @@
+import httpx
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from .. import items
+from ..cluster import OWNER_HEADER, PARTITION_HEADER, Cluster, HashRing
+from ..models import Item
+from ..settings import Settings
+from ..storage import MemoryStorage
+
+NODES = ["http://node1", "http://node2", "http://node3"]
+
+
+class TestHashRing:
+    def test_owners_are_balanced(self) -> None:
+        ring = HashRing(NODES)
+        counts = {node: 0 for node in NODES}
+        for key in range(30000):
+            counts[ring.owner(key)] += 1
+        assert all(6000 < count < 14000 for count in counts.values())
+
+    def test_added_node_takes_keys_of_others(self) -> None:
+        ring = HashRing(NODES)
+        larger = HashRing([*NODES, "http://node4"])
+        moved = [key for key in range(30000) if ring.owner(key) != larger.owner(key)]
+        assert all(larger.owner(key) == "http://node4" for key in moved)
+        assert 3000 < len(moved) < 12000
+
+    def test_needs_nodes(self) -> None:
+        with pytest.raises(ValueError):
+            HashRing([])
+
+
+class TestCluster:
+    @pytest.fixture
+    def storages(self) -> dict[str, MemoryStorage]:
+        return {node: MemoryStorage() for node in NODES}
+
+    def make_clients(
+        self, storages: dict[str, MemoryStorage], forward: bool = True
+    ) -> dict[str, TestClient]:
+        apps = {}
+        clusters = []
+        for node in NODES:
+            cluster = Cluster(node, NODES, forward=forward, client=httpx.AsyncClient())
+            app = FastAPI()
+            app.include_router(items.ItemRoutes(storages[node], cluster).router)
+            apps[node] = app
+            clusters.append(cluster)
+        # The nodes send their requests to the applications of the others
+        transports = {
+            node: httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+            for node, app in apps.items()
+        }
+        client = httpx.AsyncClient(mounts=transports)
+        for cluster in clusters:
+            cluster.client = client
+        return {node: TestClient(app) for node, app in apps.items()}
+
+    @pytest.fixture
+    def clients(self, storages: dict[str, MemoryStorage]) -> dict[str, TestClient]:
+        return self.make_clients(storages)
+
+    def test_items_are_kept_by_owner(
+        self, clients: dict[str, TestClient], storages: dict[str, MemoryStorage]
+    ) -> None:
+        ring = HashRing(NODES)
+        client = clients[NODES[0]]
+        for id in range(30):
+            response = client.post("/item/", json={"id": id, "name": f"item{id}"})
+            assert response.status_code == status.HTTP_201_CREATED
+        for node, storage in storages.items():
+            ids = [item.id for item in storage.all()]
+            assert ids == [id for id in range(30) if ring.owner(id) == node]
+        response = client.post("/item/", json={"id": 1, "name": "again"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_item_routes_are_forwarded(
+        self, clients: dict[str, TestClient], storages: dict[str, MemoryStorage]
+    ) -> None:
+        owner = HashRing(NODES).owner(1)
+        storages[owner].set(1, Item(id=1, name="test1"))
+        for node, client in clients.items():
+            response = client.get("/item/1/")
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == {"id": 1, "name": "test1"}
+            assert response.headers.get(OWNER_HEADER) == (
+                None if node == owner else owner
+            )
+
+        client = next(client for node, client in clients.items() if node != owner)
+        etag = client.get("/item/1/").headers["ETag"]
+        response = client.get("/item/1/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        response = client.put(
+            "/item/1/", json={"id": 1, "name": "updated"}, headers={"If-Match": etag}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert storages[owner].get(1) == Item(id=1, name="updated")
+        response = client.delete("/item/1/", headers={"If-Match": etag})
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        response = client.delete("/item/1/")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not storages[owner].has(1)
+        assert client.get("/item/1/").status_code == status.HTTP_404_NOT_FOUND
+
+    def test_read_items_merges_partitions(
+        self, clients: dict[str, TestClient], storages: dict[str, MemoryStorage]
+    ) -> None:
+        ring = HashRing(NODES)
+        expected = [Item(id=id, name=f"item{id % 7}") for id in range(50)]
+        for item in expected:
+            storages[ring.owner(item.id)].set(item.id, item)
+        dumped = [item.model_dump() for item in expected]
+
+        for client in clients.values():
+            assert client.get("/item/").json() == dumped
+
+        client = clients[NODES[1]]
+        ids: list[int] = []
+        params: dict[str, str | int] = {"limit": 8}
+        while True:
+            response = client.get("/item/", params=params)
+            ids.extend(item["id"] for item in response.json())
+            if items.NEXT_CURSOR_HEADER not in response.headers:
+                break
+            params["cursor"] = response.headers[items.NEXT_CURSOR_HEADER]
+        assert ids == list(range(50))
+
+        response = client.get("/item/", params={"name": "item3", "limit": 3})
+        assert [item["id"] for item in response.json()] == [3, 10, 17]
+        response = client.get("/item/", params={"name_prefix": "item", "limit": 3})
+        assert [item["id"] for item in response.json()] == [0, 7, 14]
+        response = client.get(
+            "/item/",
+            params={
+                "name_prefix": "item",
+                "limit": 3,
+                "cursor": response.headers[items.NEXT_CURSOR_HEADER],
+            },
+        )
+        assert [item["id"] for item in response.json()] == [21, 28, 35]
+
+        response = client.get("/item/stream")
+        lines = response.text.splitlines()
+        assert len(lines) == 50
+
+    def test_read_items_not_modified(
+        self, clients: dict[str, TestClient], storages: dict[str, MemoryStorage]
+    ) -> None:
+        client = clients[NODES[0]]
+        etag = client.get("/item/").headers["ETag"]
+        response = client.get("/item/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        storages[NODES[2]].set(1, Item(id=1, name="test1"))
+        response = client.get("/item/", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+
+    def test_bulk_operations_are_spread(
+        self, clients: dict[str, TestClient], storages: dict[str, MemoryStorage]
+    ) -> None:
+        ring = HashRing(NODES)
+        storages[ring.owner(3)].set(3, Item(id=3, name="test3"))
+        client = clients[NODES[0]]
+
+        values = [{"id": id, "name": f"item{id}"} for id in [5, 3, 1, 5, 8, 2]]
+        response = client.post("/item/bulk", json=values)
+        assert response.status_code == status.HTTP_200_OK
+        assert [(result["id"], result["status"]) for result in response.json()] == [
+            (5, 201),
+            (3, 400),
+            (1, 201),
+            (5, 400),
+            (8, 201),
+            (2, 201),
+        ]
+        response = client.put("/item/bulk", json=[*values[:3], {"id": 4, "name": "4"}])
+        assert [result["status"] for result in response.json()] == [200, 200, 200, 201]
+        ids = [item["id"] for item in client.get("/item/").json()]
+        assert ids == [1, 2, 3, 4, 5, 8]
+
+        response = client.request("DELETE", "/item/bulk", json=[8, 6, 1])
+        assert [result["status"] for result in response.json()] == [204, 404, 204]
+        for node, storage in storages.items():
+            assert all(ring.owner(item.id) == node for item in storage.all())
+        assert [item["id"] for item in client.get("/item/").json()] == [2, 3, 4, 5]
+
+    def test_partition_reads_are_not_gathered(
+        self, clients: dict[str, TestClient], storages: dict[str, MemoryStorage]
+    ) -> None:
+        storages[NODES[1]].set(1, Item(id=1, name="test1"))
+        client = clients[NODES[1]]
+        for path, params in [
+            ("/item/search", {"q": "test1"}),
+            ("/item/changes", {"since": "0"}),
+        ]:
+            response = client.get(path, params=params)
+            assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
+            response = client.get(
+                path, params=params, headers={PARTITION_HEADER: NODES[0]}
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+    def test_redirect_to_owner(self, storages: dict[str, MemoryStorage]) -> None:
+        clients = self.make_clients(storages, forward=False)
+        owner = HashRing(NODES).owner(1)
+        node = next(node for node in NODES if node != owner)
+        response = clients[node].get(
+            "/item/1/", params={"a": "b"}, follow_redirects=False
+        )
+        assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
+        assert response.headers["Location"] == f"{owner}/item/1/?a=b"
+
+    def test_unavailable_node(self) -> None:
+        nodes = ["http://node1", "http://127.0.0.1:9"]
+        cluster = Cluster(nodes[0], nodes)
+        app = FastAPI()
+        app.include_router(items.ItemRoutes(MemoryStorage(), cluster).router)
+        response = TestClient(app).get("/item/")
+        assert response.status_code == status.HTTP_502_BAD_GATEWAY
+
+
+def test_cluster_node_is_checked() -> None:
+    Settings(cluster_nodes=NODES, cluster_node=NODES[1])
+    with pytest.raises(ValidationError, match="CLUSTER_NODE"):
+        Settings(cluster_nodes=NODES, cluster_node="http://other")
@@ -1,96 +1,250 @@
 from typing import cast
 
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import httpx
 import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
 
 from .. import items
+from ..models import Item
+from ..storage import (
+    AsyncStorageAdapter,
+    DurableMemoryStorage,
+    MemoryStorage,
+    SingleFlightStorage,
+    SQLiteStorage,
+    Storage,
+)
+
+
+class TestItemRoutes:
+    @pytest.fixture
+    def storage(self) -> Storage:
+        return MemoryStorage(
+            {
+                1: Item(id=1, name="test1"),
+                2: Item(id=2, name="test2"),
+            }
+        )
+
+    @pytest.fixture
+    def client(self, storage: Storage) -> TestClient:
+        routes = items.ItemRoutes(storage)
+        app = FastAPI()
+        app.include_router(routes.router)
+        return TestClient(app)
+
+    def test_read_items(self, client: TestClient, storage: Storage) -> None:
+        response = client.get("/item/")
+        assert response.status_code == status.HTTP_200_OK
+        expected_items = [item.model_dump() for item in storage.all()]
+        assert response.json() == expected_items
 
+    def test_read_items_not_modified(self, client: TestClient) -> None:
+        response = client.get("/item/")
+        etag = response.headers["ETag"]
 
-class TestStorage:
-    def test_has(self) -> None:
-        item = items.Item(id=1, name="test")
-        storage = items.Storage({item.id: item})
-        assert storage.has(item.id)
-        assert not storage.has(999)
+        response = client.get("/item/", headers={"If-None-Match": f'"x", {etag}'})
+        assert response.status_code == 304
+        response = client.get("/item/", headers={"If-None-Match": "*"})
+        assert response.status_code == 304
 
-    def test_set(self) -> None:
-        item = items.Item(id=1, name="test")
-        storage = items.Storage({item.id: item})
+        client.delete("/item/2/")
+        response = client.get("/item/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json() == [{"id": 1, "name": "test1"}]
 
-        item_updated = items.Item(id=item.id, name="item_updated")
-        new_item = items.Item(id=999, name="test3")
+    def test_read_items_after_change(self, client: TestClient) -> None:
+        assert client.get("/item/").json() == [
+            {"id": 1, "name": "test1"},
+            {"id": 2, "name": "test2"},
+        ]
+        client.put("/item/1/", json={"id": 1, "name": "updated"})
+        assert client.get("/item/").json() == [
+            {"id": 1, "name": "updated"},
+            {"id": 2, "name": "test2"},
+        ]
 
-        storage.set(item_updated.id, item_updated)
-        storage.set(new_item.id, new_item)
+    def test_read_items_paginated(self, client: TestClient, storage: Storage) -> None:
+        storage.set(3, Item(id=3, name="test3"))
 
-        assert storage.get(item.id) == item_updated
-        assert storage.get(new_item.id) == new_item
+        response = client.get("/item/", params={"limit": 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()] == [1, 2]
+        cursor = response.headers[items.NEXT_CURSOR_HEADER]
 
-    def test_get(self) -> None:
-        item = items.Item(id=1, name="test")
-        storage = items.Storage({item.id: item})
-        assert storage.get(item.id) == item
+        response = client.get("/item/", params={"limit": 2, "cursor": cursor})
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()] == [3]
+        assert items.NEXT_CURSOR_HEADER not in response.headers
 
-    def test_all(self) -> None:
-        item1 = items.Item(id=1, name="test1")
-        item2 = items.Item(id=1, name="test2")
+    def test_read_items_invalid_cursor(self, client: TestClient) -> None:
+        response = client.get("/item/", params={"limit": 2, "cursor": "!"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": "Invalid cursor"}
 
-        storage = items.Storage(
-            {
-                item1.id: item1,
-                item2.id: item2,
-            }
-        )
+    def test_read_items_invalid_limit(self, client: TestClient) -> None:
+        response = client.get("/item/", params={"limit": 0})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-        assert set([item.id for item in storage.all()]) == set([item1.id, item2.id])
+    def test_read_items_by_name(self, client: TestClient, storage: Storage) -> None:
+        storage.set_many({3: Item(id=3, name="test1"), 4: Item(id=4, name="test1")})
 
-    def test_delete(self) -> None:
-        item = items.Item(id=1, name="test")
-        storage = items.Storage({item.id: item})
-        storage.delete(item.id)
-        assert not storage.has(item.id)
+        response = client.get("/item/", params={"name": "test1", "limit": 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()] == [1, 3]
+        cursor = response.headers[items.NEXT_CURSOR_HEADER]
 
-    def test_clear(self) -> None:
-        item1 = items.Item(id=1, name="test1")
-        item2 = items.Item(id=1, name="test2")
+        response = client.get(
+            "/item/", params={"name": "test1", "limit": 2, "cursor": cursor}
+        )
+        assert [item["id"] for item in response.json()] == [4]
+        assert items.NEXT_CURSOR_HEADER not in response.headers
 
-        storage = items.Storage(
-            {
-                item1.id: item1,
-                item2.id: item2,
-            }
+    def test_read_items_by_name_prefix(
+        self, client: TestClient, storage: Storage
+    ) -> None:
+        storage.set_many({0: Item(id=0, name="test2"), 3: Item(id=3, name="other")})
+
+        response = client.get("/item/", params={"name_prefix": "test", "limit": 2})
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()] == [1, 0]
+        cursor = response.headers[items.NEXT_CURSOR_HEADER]
+
+        response = client.get(
+            "/item/", params={"name_prefix": "test", "limit": 2, "cursor": cursor}
         )
+        assert [item["id"] for item in response.json()] == [2]
+        assert items.NEXT_CURSOR_HEADER not in response.headers
 
-        storage.clear()
+    def test_read_items_by_name_and_prefix(self, client: TestClient) -> None:
+        response = client.get("/item/", params={"name": "test1", "name_prefix": "t"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-        assert len(storage.all()) == 0
+    def test_read_items_by_name_prefix_invalid_cursor(self, client: TestClient) -> None:
+        cursor = items.encode_cursor(1)
+        response = client.get("/item/", params={"name_prefix": "t", "cursor": cursor})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": "Invalid cursor"}
 
+    def test_search_items(self, client: TestClient, storage: Storage) -> None:
+        storage.set(3, Item(id=3, name="test other"))
 
-class TestItemRoutes:
-    @pytest.fixture
-    def storage(self) -> items.Storage:
-        return items.Storage(
-            {
-                1: items.Item(id=1, name="test1"),
-                2: items.Item(id=2, name="test2"),
-            }
+        response = client.get("/item/search", params={"q": "TEST"})
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()] == [3]
+
+        response = client.get("/item/search", params={"q": "test1 other"})
+        assert [item["id"] for item in response.json()] == [1, 3]
+
+    def test_search_items_paginated(self, client: TestClient) -> None:
+        client.put("/item/bulk", json=[{"id": id, "name": "same"} for id in range(3)])
+
+        response = client.get("/item/search", params={"q": "same", "limit": 2})
+        assert [item["id"] for item in response.json()] == [0, 1]
+        cursor = response.headers[items.NEXT_CURSOR_HEADER]
+
+        response = client.get(
+            "/item/search", params={"q": "same", "limit": 2, "cursor": cursor}
         )
+        assert [item["id"] for item in response.json()] == [2]
+        assert items.NEXT_CURSOR_HEADER not in response.headers
 
-    @pytest.fixture
-    def client(self, storage: items.Storage) -> TestClient:
-        routes = items.ItemRoutes(storage)
-        app = FastAPI()
-        app.include_router(routes.router)
-        return TestClient(app)
+        response = client.get(
+            "/item/search", params={"q": "same", "cursor": items.encode_cursor(1)}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_read_items(self, client: TestClient, storage: items.Storage) -> None:
-        response = client.get("/item/")
+    def test_search_index_follows_changes(self, client: TestClient) -> None:
+        client.post("/item/", json={"id": 3, "name": "created"})
+        client.put("/item/1/", json={"id": 1, "name": "updated"})
+        client.delete("/item/2/")
+        client.post("/item/bulk", json=[{"id": 4, "name": "bulk created"}])
+        client.request("DELETE", "/item/bulk", json=[3])
+
+        def search(q: str) -> list[int]:
+            response = client.get("/item/search", params={"q": q})
+            return [item["id"] for item in response.json()]
+
+        assert search("created") == [4]
+        assert search("updated") == [1]
+        assert search("test1 test2") == []
+
+    def test_read_changes(self, client: TestClient) -> None:
+        response = client.get("/item/changes")
         assert response.status_code == status.HTTP_200_OK
-        expected_items = [item.model_dump() for item in storage.all()]
-        assert response.json() == expected_items
+        assert response.json() == {"changes": [], "version": 2}
+
+        client.put("/item/1/", json={"id": 1, "name": "updated"})
+        client.delete("/item/2/")
+        response = client.get("/item/changes", params={"since": 2, "limit": 1})
+        assert response.json() == {
+            "changes": [
+                {
+                    "version": 3,
+                    "op": "set",
+                    "id": 1,
+                    "item": {"id": 1, "name": "updated"},
+                }
+            ],
+            "version": 3,
+        }
+        response = client.get("/item/changes", params={"since": 3})
+        assert response.json() == {
+            "changes": [{"version": 4, "op": "delete", "id": 2, "item": None}],
+            "version": 4,
+        }
+        response = client.get("/item/changes", params={"since": 4})
+        assert response.json() == {"changes": [], "version": 4}
 
-    def test_create_item(self, client: TestClient, storage: items.Storage) -> None:
+    def test_read_changes_no_longer_kept(self, client: TestClient) -> None:
+        response = client.get("/item/changes", params={"since": 1})
+        assert response.status_code == status.HTTP_410_GONE
+        response = client.get("/item/changes", params={"since": 99})
+        assert response.status_code == status.HTTP_410_GONE
+
+    def test_read_changes_waits_for_change(self, client: TestClient) -> None:
+        async def run() -> httpx.Response:
+            transport = httpx.ASGITransport(app=client.app)  # type: ignore[arg-type]
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as async_client:
+                waiting = asyncio.create_task(
+                    async_client.get("/item/changes", params={"since": 2, "wait": 10})
+                )
+                await asyncio.sleep(0.1)
+                assert not waiting.done()
+                await async_client.post("/item/", json={"id": 3, "name": "test3"})
+                return await asyncio.wait_for(waiting, 1)
+
+        response = asyncio.run(run())
+        assert [change["id"] for change in response.json()["changes"]] == [3]
+
+    def test_stream_items(
+        self,
+        client: TestClient,
+        storage: Storage,
+        mocker: MockerFixture,
+    ) -> None:
+        mocker.patch.object(items, "STREAM_BATCH_SIZE", 1)
+        storage.set(3, Item(id=3, name="test3"))
+
+        response = client.get("/item/stream")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == items.NDJSON_MEDIA_TYPE
+        lines = response.text.splitlines()
+        assert [json.loads(line) for line in lines] == [
+            item.model_dump() for item in storage.page()
+        ]
+
+    def test_create_item(self, client: TestClient, storage: Storage) -> None:
         item_data = {"id": 3, "name": "test3"}
         response = client.post("/item/", json=item_data)
         assert response.status_code == status.HTTP_201_CREATED
@@ -99,26 +253,144 @@ class TestItemRoutes:
         assert item_in_storage is not None
         assert item_in_storage.model_dump() == item_data
 
-    def test_create_item_if_exists(
-        self, client: TestClient, storage: items.Storage
-    ) -> None:
+    def test_create_item_if_exists(self, client: TestClient, storage: Storage) -> None:
         exists_item_data = storage.all()[0].model_dump()
         response = client.post("/item/", json=exists_item_data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.json() == {"detail": "Item already exists"}
 
-    def test_read_item(self, client: TestClient, storage: items.Storage) -> None:
+    def test_bulk_create_items(self, client: TestClient, storage: Storage) -> None:
+        response = client.post(
+            "/item/bulk",
+            json=[
+                {"id": 1, "name": "exists"},
+                {"id": 3, "name": "test3"},
+                {"id": 3, "name": "duplicate"},
+            ],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"id": 1, "status": 400, "detail": "Item already exists"},
+            {"id": 3, "status": 201, "detail": None},
+            {"id": 3, "status": 400, "detail": "Item already exists"},
+        ]
+        assert storage.get(1) == Item(id=1, name="test1")
+        assert storage.get(3) == Item(id=3, name="test3")
+
+    def test_bulk_create_items_ndjson(
+        self, client: TestClient, storage: Storage
+    ) -> None:
+        response = client.post(
+            "/item/bulk",
+            content=b'{"id": 3, "name": "test3"}\n\n{"id": 4, "name": "test4"}\n',
+            headers={"content-type": items.NDJSON_MEDIA_TYPE},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [result["status"] for result in response.json()] == [201, 201]
+        assert storage.has(3)
+        assert storage.has(4)
+
+    def test_bulk_create_items_invalid(
+        self, client: TestClient, storage: Storage
+    ) -> None:
+        response = client.post(
+            "/item/bulk", json=[{"id": 3, "name": "test3"}, {"id": "invalid"}]
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"][0]["loc"] == ["body", 1, "id"]
+        assert not storage.has(3)
+
+    def test_bulk_create_items_ndjson_invalid(
+        self, client: TestClient, storage: Storage
+    ) -> None:
+        response = client.post(
+            "/item/bulk",
+            content=b'{"id": 3, "name": "test3"}\n\n{"id": "invalid"}\n{"id": 4,\n',
+            headers={"content-type": items.NDJSON_MEDIA_TYPE},
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        # Located by the number of the line, blank lines are counted
+        assert [error["loc"] for error in response.json()["detail"]] == [
+            ["body", 3, "id"],
+            ["body", 3, "name"],
+            ["body", 4],
+        ]
+        assert not storage.has(3)
+
+    def test_bulk_upsert_items(self, client: TestClient, storage: Storage) -> None:
+        response = client.put(
+            "/item/bulk",
+            json=[{"id": 1, "name": "updated"}, {"id": 3, "name": "test3"}],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [result["status"] for result in response.json()] == [200, 201]
+        assert storage.get(1) == Item(id=1, name="updated")
+        assert storage.get(3) == Item(id=3, name="test3")
+
+    def test_bulk_delete_items(self, client: TestClient, storage: Storage) -> None:
+        response = client.request("DELETE", "/item/bulk", json=[1, 999])
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"id": 1, "status": 204, "detail": None},
+            {"id": 999, "status": 404, "detail": "Item not found"},
+        ]
+        assert not storage.has(1)
+        assert storage.has(2)
+
+    def test_bulk_writes_are_last_writer_wins(self, client: TestClient) -> None:
+        etag = client.get("/item/1/").headers["ETag"]
+        response = client.put("/item/bulk", json=[{"id": 1, "name": "bulk"}])
+        assert response.json()[0]["status"] == 200
+        # A conditional write based on the version before the bulk write fails
+        response = client.put(
+            "/item/1/", json={"id": 1, "name": "updated"}, headers={"If-Match": etag}
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+        for method, body in (
+            ("POST", [{"id": 3, "name": "test3"}]),
+            ("PUT", [{"id": 1, "name": "updated"}]),
+            ("DELETE", [1]),
+        ):
+            response = client.request(
+                method, "/item/bulk", json=body, headers={"If-Match": etag}
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.json() == {"detail": "Bulk writes do not support If-Match"}
+        assert client.get("/item/1/").json() == {"id": 1, "name": "bulk"}
+
+    def test_read_item(self, client: TestClient, storage: Storage) -> None:
         item = storage.all()[0]
         response = client.get(f"/item/{item.id}/")
         assert response.status_code == 200
         assert response.json() == item.model_dump()
 
+    def test_read_item_not_modified(self, client: TestClient) -> None:
+        response = client.get("/item/1/")
+        etag = response.headers["ETag"]
+
+        response = client.get("/item/1/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        # Changes of other items keep the tag of the item
+        client.put("/item/2/", json={"id": 2, "name": "new test2"})
+        response = client.get("/item/1/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        client.put("/item/1/", json={"id": 1, "name": "new test1"})
+        response = client.get("/item/1/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json() == {"id": 1, "name": "new test1"}
+
     def test_read_item_if_does_not_exist(self, client: TestClient) -> None:
         response = client.get("/item/999/")
         assert response.status_code == 404
         assert response.json() == {"detail": "Item not found"}
 
-    def test_update_item(self, client: TestClient, storage: items.Storage) -> None:
+    def test_update_item(self, client: TestClient, storage: Storage) -> None:
         item = storage.all()[0]
         updated_item = {"id": item.id, "name": "new test1"}
         response = client.put(f"/item/{item.id}/", json=updated_item)
@@ -128,20 +400,204 @@ class TestItemRoutes:
         assert item_in_storage is not None
         assert item_in_storage.model_dump() == updated_item
 
+    def test_update_item_if_match(self, client: TestClient) -> None:
+        etag = client.get("/item/1/").headers["ETag"]
+
+        response = client.put(
+            "/item/1/", json={"id": 1, "name": "new"}, headers={"If-Match": etag}
+        )
+        assert response.status_code == 200
+        new_etag = response.headers["ETag"]
+        assert new_etag != etag
+        assert client.get("/item/1/").headers["ETag"] == new_etag
+
+        # The tag read before the update is stale
+        response = client.put(
+            "/item/1/", json={"id": 1, "name": "lost"}, headers={"If-Match": etag}
+        )
+        assert response.status_code == 412
+        assert client.get("/item/1/").json() == {"id": 1, "name": "new"}
+
+        response = client.put(
+            "/item/999/", json={"id": 999, "name": "new"}, headers={"If-Match": "*"}
+        )
+        assert response.status_code == 412
+
+    def test_update_item_with_other_id(
+        self, client: TestClient, storage: Storage
+    ) -> None:
+        response = client.put("/item/1/", json={"id": 2, "name": "new"})
+        assert response.status_code == 200
+        assert storage.get(2) == Item(id=2, name="new")
+
     def test_update_item_if_does_not_exist(self, client: TestClient) -> None:
         item_data = {"id": 999, "name": "test999"}
         response = client.put("/item/999/", json=item_data)
         assert response.status_code == 404
         assert response.json() == {"detail": "Item not found"}
 
-    def test_delete_item(self, client: TestClient, storage: items.Storage) -> None:
+    def test_delete_item(self, client: TestClient, storage: Storage) -> None:
         item = storage.all()[0]
         id = item.id
         response = client.delete(f"/item/{id}/")
         assert response.status_code == 204
         assert not storage.has(id)
 
+    def test_delete_item_if_match(self, client: TestClient, storage: Storage) -> None:
+        etag = client.get("/item/1/").headers["ETag"]
+        client.put("/item/1/", json={"id": 1, "name": "new"})
+
+        response = client.delete("/item/1/", headers={"If-Match": etag})
+        assert response.status_code == 412
+        assert storage.has(1)
+
+        etag = client.get("/item/1/").headers["ETag"]
+        response = client.delete("/item/1/", headers={"If-Match": etag})
+        assert response.status_code == 204
+        assert not storage.has(1)
+
     def test_delete_item_if_does_not_exist(self, client: TestClient) -> None:
         response = client.delete("/item/999/")
         assert response.status_code == 404
         assert response.json() == {"detail": "Item not found"}
+
+
+def test_search_follows_other_workers(tmp_path: Path) -> None:
+    # Workers share the SQLite database, each with its own search index
+    path = str(tmp_path / "catalog.db")
+    storage = SQLiteStorage(path)
+    other = SQLiteStorage(path)
+    app = FastAPI()
+    app.include_router(items.ItemRoutes(storage).router)
+    client = TestClient(app)
+
+    def search(q: str) -> list[int]:
+        response = client.get("/item/search", params={"q": q})
+        return [item["id"] for item in response.json()]
+
+    other.set(1, Item(id=1, name="first"))
+    assert search("first") == [1]
+    other.set(1, Item(id=1, name="renamed"))
+    other.set(2, Item(id=2, name="second"))
+    assert search("first") == []
+    assert search("renamed second") == [1, 2]
+    other.delete(2)
+    assert search("second") == []
+    assert client.get("/item/").json() == [{"id": 1, "name": "renamed"}]
+    other.close()
+    storage.close()
+
+
+def test_concurrent_bulk_writes(tmp_path: Path) -> None:
+    # Bulk writes of a blocking storage run concurrently in the thread pool,
+    # every item is created and deleted by exactly one of them
+    storage = SQLiteStorage(str(tmp_path / "catalog.db"))
+    app = FastAPI()
+    app.include_router(items.ItemRoutes(storage).router)
+    ids = list(range(50))
+
+    async def run() -> tuple[list[httpx.Response], list[httpx.Response]]:
+        transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            created = await asyncio.gather(
+                *(
+                    client.post(
+                        "/item/bulk",
+                        json=[{"id": id, "name": str(writer)} for id in ids],
+                    )
+                    for writer in range(4)
+                )
+            )
+            deleted = await asyncio.gather(
+                *(client.request("DELETE", "/item/bulk", json=ids) for _ in range(4))
+            )
+        return created, deleted
+
+    created, deleted = asyncio.run(run())
+    for responses, success in ((created, 201), (deleted, 204)):
+        assert [response.status_code for response in responses] == [200] * 4
+        statuses = [
+            [result["status"] for result in response.json()] for response in responses
+        ]
+        assert [column.count(success) for column in zip(*statuses)] == [1] * len(ids)
+    assert storage.all() == []
+    storage.close()
+
+
+def test_single_flight_of_blocking_reads(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Only reads waiting in the thread pool can be shared
+    single_flight = mocker.patch.object(
+        items, "SingleFlightStorage", wraps=SingleFlightStorage
+    )
+    items.ItemRoutes(MemoryStorage())
+    single_flight.assert_not_called()
+    storage = SQLiteStorage(str(tmp_path / "catalog.db"))
+    items.ItemRoutes(storage)
+    single_flight.assert_called_once()
+    storage.close()
+
+
+def test_single_flight_of_adapted_storage(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # The application passes the storage in its adapter
+    single_flight = mocker.patch.object(
+        items, "SingleFlightStorage", wraps=SingleFlightStorage
+    )
+    durable = AsyncStorageAdapter(DurableMemoryStorage(tmp_path / "data"))
+    items.ItemRoutes(AsyncStorageAdapter(MemoryStorage()))
+    items.ItemRoutes(durable)
+    single_flight.assert_not_called()
+    sqlite = AsyncStorageAdapter(SQLiteStorage(str(tmp_path / "catalog.db")))
+    items.ItemRoutes(sqlite)
+    single_flight.assert_called_once_with(sqlite)
+    asyncio.run(durable.close())
+    asyncio.run(sqlite.close())
+
+
+def test_single_flight_after_write_of_other_storage(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # A listing tagged with the version written by another storage is not
+    # shared with a read of the storage started before the write
+    path = str(tmp_path / "catalog.db")
+    storage = SQLiteStorage(path)
+    other = SQLiteStorage(path)
+    other.set(1, Item(id=1, name="old"))
+    app = FastAPI()
+    app.include_router(items.ItemRoutes(AsyncStorageAdapter(storage)).router)
+    read = threading.Event()
+    release = threading.Event()
+    all_encoded = storage.all_encoded
+
+    def slow_all_encoded() -> list[bytes]:
+        encoded = all_encoded()
+        if not read.is_set():
+            read.set()
+            release.wait()
+        return encoded
+
+    monkeypatch.setattr(storage, "all_encoded", slow_all_encoded)
+
+    async def run() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            first = asyncio.ensure_future(client.get("/item/"))
+            try:
+                assert await asyncio.to_thread(read.wait, 5)
+                other.set(1, Item(id=1, name="new"))
+                second = await asyncio.wait_for(client.get("/item/"), 5)
+            finally:
+                release.set()
+            return [await first, second, await client.get("/item/")]
+
+    responses = asyncio.run(run())
+    assert [
+        (response.headers["ETag"], response.json()[0]["name"]) for response in responses
+    ] == [('"1"', "old"), ('"2"', "new"), ('"2"', "new")]
+    other.close()
+    storage.close()
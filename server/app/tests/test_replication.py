@@ -0,0 +1,113 @@
+import asyncio
+import math
+
+import httpx
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from .. import items, replication
+from ..models import Item
+from ..replication import Follower
+from ..storage import MemoryStorage, ReplicaStorage
+
+PRIMARY = "http://primary"
+
+
+class TestFollower:
+    @pytest.fixture(autouse=True)
+    def no_wait(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # The primary answers at once when the copy has all its changes
+        monkeypatch.setattr(replication, "CHANGES_WAIT", 0)
+
+    @pytest.fixture
+    def primary(self) -> MemoryStorage:
+        return MemoryStorage(
+            {
+                1: Item(id=1, name="test1"),
+                2: Item(id=2, name="test2"),
+            },
+            change_buffer_size=4,
+        )
+
+    @pytest.fixture
+    def follower(self, primary: MemoryStorage) -> Follower:
+        app = FastAPI()
+        app.include_router(items.ItemRoutes(primary).router)
+        transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+        return Follower(
+            PRIMARY, ReplicaStorage(), client=httpx.AsyncClient(transport=transport)
+        )
+
+    @pytest.fixture
+    def client(self, follower: Follower) -> TestClient:
+        app = FastAPI()
+        routes = items.ItemRoutes(follower.storage, follower=follower)
+        app.include_router(routes.router)
+        return TestClient(app)
+
+    def test_copy_has_primary_versions(
+        self, follower: Follower, primary: MemoryStorage, client: TestClient
+    ) -> None:
+        asyncio.run(follower.sync())
+        assert follower.version == primary.catalog_version()
+        primary.set(3, Item(id=3, name="test3"))
+        primary.delete(1)
+        asyncio.run(follower.sync())
+
+        assert follower.storage.page_versioned() == primary.page_versioned()
+        assert follower.lag() < 1
+        response = client.get("/item/3/")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] == '"3"'
+        assert client.get("/item/").json() == [
+            {"id": 2, "name": "test2"},
+            {"id": 3, "name": "test3"},
+        ]
+        assert client.get("/item/search", params={"q": "test3"}).json() == [
+            {"id": 3, "name": "test3"}
+        ]
+
+    def test_writes_go_to_primary(
+        self, follower: Follower, primary: MemoryStorage, client: TestClient
+    ) -> None:
+        response = client.post("/item/", json={"id": 3, "name": "test3"})
+        assert response.status_code == status.HTTP_201_CREATED
+        response = client.put(
+            "/item/1/", json={"id": 1, "name": "updated"}, headers={"If-Match": '"1"'}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        response = client.request("DELETE", "/item/bulk", json=[2])
+        assert response.json()[0]["status"] == status.HTTP_204_NO_CONTENT
+
+        assert primary.all() == [
+            Item(id=1, name="updated"),
+            Item(id=3, name="test3"),
+        ]
+        assert follower.storage.all() == []
+
+    def test_stale_reads_go_to_primary(
+        self, follower: Follower, primary: MemoryStorage, client: TestClient
+    ) -> None:
+        assert follower.lag() == math.inf
+        assert client.get("/item/1/").json() == {"id": 1, "name": "test1"}
+
+        asyncio.run(follower.sync())
+        asyncio.run(follower.sync())
+        primary.set(1, Item(id=1, name="updated"))
+        assert client.get("/item/1/").json() == {"id": 1, "name": "test1"}
+        follower.max_lag = 0
+        assert client.get("/item/1/").json() == {"id": 1, "name": "updated"}
+
+    def test_copy_is_loaded_again_without_changes(
+        self, follower: Follower, primary: MemoryStorage
+    ) -> None:
+        asyncio.run(follower.sync())
+        for id in range(3, 10):
+            primary.set(id, Item(id=id, name=f"test{id}"))
+        # The changes after the copy are no longer kept by the primary
+        asyncio.run(follower.sync())
+        assert follower.version is None
+        asyncio.run(follower.sync())
+        assert follower.storage.page_versioned() == primary.page_versioned()
+        assert follower.version == primary.catalog_version()
@@ -0,0 +1,54 @@
+from ..models import Item
+from ..search import SearchIndex
+
+
+def keys(results: list[tuple[float, int]]) -> list[int]:
+    return [key for _, key in results]
+
+
+class TestSearchIndex:
+    def test_search(self) -> None:
+        index = SearchIndex()
+        index.add_many(
+            {
+                1: Item(id=1, name="sentinel imagery of europe"),
+                2: Item(id=2, name="Sentinel"),
+                3: Item(id=3, name="weather stations"),
+                4: Item(id=4, name="weather of europe"),
+            }
+        )
+
+        # Shorter items rank higher for the same word
+        assert keys(index.search("sentinel")) == [2, 1]
+        # Rare words weigh more than frequent ones
+        assert keys(index.search("imagery europe")) == [1, 4]
+        assert index.search("ocean") == []
+        assert index.search("") == []
+
+    def test_search_paginated(self) -> None:
+        index = SearchIndex()
+        index.add_many({id: Item(id=id, name="same") for id in range(5)})
+
+        first = index.search("same", 2)
+        assert keys(first) == [0, 1]
+        assert keys(index.search("same", 2, first[-1])) == [2, 3]
+        assert keys(index.search("same", None, (first[-1][0], 3))) == [4]
+
+    def test_update_and_remove(self) -> None:
+        index = SearchIndex()
+        index.add(1, Item(id=1, name="old name"))
+        index.add(2, Item(id=2, name="other name"))
+
+        index.add(1, Item(id=1, name="new"))
+        assert index.search("old") == []
+        assert keys(index.search("new")) == [1]
+
+        index.remove(2)
+        index.remove(999)
+        assert index.search("other name") == []
+        assert len(index) == 1
+        assert set(index.postings) == {"new"}
+        assert index.total_length == 1
+
+        index.clear()
+        assert index.search("new") == []
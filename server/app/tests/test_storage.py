@@ -0,0 +1,1094 @@
+from typing import Callable, Iterator
+
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from ..models import Item, ItemChange
+from ..settings import Settings
+from ..storage import (
+    AsyncStorageAdapter,
+    ColumnarMemoryStorage,
+    DurableMemoryStorage,
+    LMDBStorage,
+    MemoryStorage,
+    ReplicaStorage,
+    SingleFlightStorage,
+    SQLiteStorage,
+    Storage,
+    columnar,
+    create_storage,
+)
+
+StorageFactory = Callable[[dict[int, Item]], Storage]
+
+
+def create_sqlite_storage(path: Path, initial: dict[int, Item]) -> Storage:
+    storage = SQLiteStorage(str(path))
+    storage.set_many(initial)
+    return storage
+
+
+def create_durable_storage(path: Path, initial: dict[int, Item]) -> Storage:
+    storage = DurableMemoryStorage(path, fsync=False)
+    storage.set_many(initial)
+    return storage
+
+
+def create_lmdb_storage(path: Path, initial: dict[int, Item]) -> Storage:
+    pytest.importorskip("lmdb")
+    storage = LMDBStorage(path, sync=False)
+    storage.set_many(initial)
+    return storage
+
+
+@pytest.fixture(params=["memory", "columnar", "durable", "sqlite", "lmdb"])
+def make_storage(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> Iterator[StorageFactory]:
+    created: list[Storage] = []
+
+    def make_storage(initial: dict[int, Item]) -> Storage:
+        if request.param == "sqlite":
+            storage = create_sqlite_storage(tmp_path / "catalog.db", initial)
+        elif request.param == "durable":
+            storage = create_durable_storage(tmp_path / "data", initial)
+        elif request.param == "columnar":
+            storage = ColumnarMemoryStorage(initial)
+        elif request.param == "lmdb":
+            storage = create_lmdb_storage(tmp_path / "lmdb", initial)
+        else:
+            storage = MemoryStorage(initial)
+        created.append(storage)
+        return storage
+
+    yield make_storage
+
+    for storage in created:
+        storage.close()
+
+
+class TestStorage:
+    def test_has(self, make_storage: StorageFactory) -> None:
+        item = Item(id=1, name="test")
+        storage = make_storage({item.id: item})
+        assert storage.has(item.id)
+        assert not storage.has(999)
+
+    def test_has_many(self, make_storage: StorageFactory) -> None:
+        item1 = Item(id=1, name="test1")
+        item2 = Item(id=2, name="test2")
+        storage = make_storage({item1.id: item1, item2.id: item2})
+        assert storage.has_many([1, 999, 2, 1]) == {1, 2}
+        assert storage.has_many([]) == set()
+
+    def test_set(self, make_storage: StorageFactory) -> None:
+        item = Item(id=1, name="test")
+        storage = make_storage({item.id: item})
+
+        item_updated = Item(id=item.id, name="item_updated")
+        new_item = Item(id=999, name="test3")
+
+        storage.set(item_updated.id, item_updated)
+        storage.set(new_item.id, new_item)
+
+        assert storage.get(item.id) == item_updated
+        assert storage.get(new_item.id) == new_item
+
+    def test_get(self, make_storage: StorageFactory) -> None:
+        item = Item(id=1, name="test")
+        storage = make_storage({item.id: item})
+        assert storage.get(item.id) == item
+
+    def test_get_many(self, make_storage: StorageFactory) -> None:
+        item1 = Item(id=1, name="test1")
+        item2 = Item(id=2, name="test2")
+        storage = make_storage({item1.id: item1, item2.id: item2})
+        assert storage.get_many([2, 999, 1]) == {1: item1, 2: item2}
+        assert storage.get_many([]) == {}
+
+    def test_get_encoded(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({1: Item(id=1, name="test1")})
+        assert storage.get_encoded(1) == (
+            b'{"id":1,"name":"test1"}',
+            storage.catalog_version(),
+        )
+        # A changed item is encoded again
+        storage.set(1, Item(id=1, name="updated"))
+        assert storage.get_encoded(1) == (
+            b'{"id":1,"name":"updated"}',
+            storage.catalog_version(),
+        )
+        storage.delete(1)
+        assert storage.get_encoded(1) is None
+
+    def test_all_encoded(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({2: Item(id=2, name="test2")})
+        storage.set(1, Item(id=1, name="test1"))
+        assert storage.all_encoded() == [
+            b'{"id":1,"name":"test1"}',
+            b'{"id":2,"name":"test2"}',
+        ]
+        storage.clear()
+        assert storage.all_encoded() == []
+
+    def test_all(self, make_storage: StorageFactory) -> None:
+        item1 = Item(id=1, name="test1")
+        item2 = Item(id=1, name="test2")
+
+        storage = make_storage(
+            {
+                item1.id: item1,
+                item2.id: item2,
+            }
+        )
+
+        assert set([item.id for item in storage.all()]) == set([item1.id, item2.id])
+
+    def test_page(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({id: Item(id=id, name=f"test{id}") for id in (3, 1, 2)})
+        storage.set(5, Item(id=5, name="test5"))
+
+        assert [item.id for item in storage.page(2)] == [1, 2]
+        assert [item.id for item in storage.page(2, after=2)] == [3, 5]
+        assert [item.id for item in storage.page(after=3)] == [5]
+        assert storage.page(2, after=5) == []
+
+    def test_page_versioned(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({id: Item(id=id, name=f"test{id}") for id in (1, 2, 3)})
+        storage.set(2, Item(id=2, name="updated"))
+
+        assert storage.page_versioned(2) == [
+            (Item(id=1, name="test1"), 1),
+            (Item(id=2, name="updated"), 4),
+        ]
+        assert storage.page_versioned(after=2) == [(Item(id=3, name="test3"), 3)]
+
+    def test_page_after_delete(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({id: Item(id=id, name=f"test{id}") for id in (1, 2, 3)})
+        storage.delete(2)
+        assert [item.id for item in storage.page(10)] == [1, 3]
+        storage.clear()
+        assert storage.page(10) == []
+
+    def test_find_by_name(self, make_storage: StorageFactory) -> None:
+        items = [
+            Item(id=3, name="test"),
+            Item(id=1, name="test"),
+            Item(id=2, name="other"),
+            Item(id=4, name="test"),
+        ]
+        storage = make_storage({item.id: item for item in items})
+        storage.set(4, Item(id=4, name="renamed"))
+        storage.delete(3)
+        storage.set(5, Item(id=5, name="test"))
+
+        assert [item.id for item in storage.find_by_name("test")] == [1, 5]
+        assert [item.id for item in storage.find_by_name("test", 1, 1)] == [5]
+        assert storage.find_by_name("renamed") == [Item(id=4, name="renamed")]
+        assert storage.find_by_name("missing") == []
+
+    def test_find_by_name_prefix(self, make_storage: StorageFactory) -> None:
+        items = [
+            Item(id=1, name="ab"),
+            Item(id=2, name="a"),
+            Item(id=3, name="abc"),
+            Item(id=4, name="b"),
+            Item(id=5, name="ab"),
+            Item(id=6, name="a\U0010ffff"),
+        ]
+        storage = make_storage({item.id: item for item in items})
+
+        def find(
+            prefix: str,
+            limit: int | None = None,
+            after: tuple[str, int] | None = None,
+        ) -> list[int]:
+            items = storage.find_by_name_prefix(prefix, limit, after)
+            return [item.id for item in items]
+
+        assert find("ab") == [1, 5, 3]
+        assert find("ab", 2) == [1, 5]
+        assert find("ab", 2, ("ab", 1)) == [5, 3]
+        assert find("ab", None, ("ab", 5)) == [3]
+        assert find("a", None, ("a", 2)) == [1, 5, 3, 6]
+        assert find("a\U0010ffff") == [6]
+        assert find("") == [2, 1, 5, 3, 6, 4]
+        assert find("c") == []
+
+    def test_set_many(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({})
+        storage.set_many({id: Item(id=id, name=f"test{id}") for id in (2, 1)})
+        assert [item.id for item in storage.page()] == [1, 2]
+
+    def test_delete_many(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({id: Item(id=id, name=f"test{id}") for id in (1, 2, 3)})
+        storage.delete_many([1, 3])
+        assert [item.id for item in storage.page()] == [2]
+
+    def test_create_many(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({1: Item(id=1, name="test1")})
+        since = storage.catalog_version()
+        created = storage.create_many(
+            {1: Item(id=1, name="updated"), 2: Item(id=2, name="test2")}
+        )
+        assert created == {2}
+        assert storage.get_many([1, 2]) == {
+            1: Item(id=1, name="test1"),
+            2: Item(id=2, name="test2"),
+        }
+        assert storage.changes(since) == [
+            ItemChange(version=since + 1, op="set", id=2, item=Item(id=2, name="test2"))
+        ]
+        assert storage.create_many({}) == set()
+
+    def test_upsert_many(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({1: Item(id=1, name="test1")})
+        created = storage.upsert_many(
+            {1: Item(id=1, name="updated"), 2: Item(id=2, name="test2")}
+        )
+        assert created == {2}
+        assert storage.get_many([1, 2]) == {
+            1: Item(id=1, name="updated"),
+            2: Item(id=2, name="test2"),
+        }
+
+    def test_discard_many(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({id: Item(id=id, name=f"test{id}") for id in (1, 2, 3)})
+        since = storage.catalog_version()
+        assert storage.discard_many([3, 999, 1, 3]) == {1, 3}
+        assert [item.id for item in storage.page()] == [2]
+        assert storage.changes(since) == [
+            ItemChange(version=since + 1, op="delete", id=3),
+            ItemChange(version=since + 2, op="delete", id=1),
+        ]
+        assert storage.discard_many([1]) == set()
+
+    def test_delete(self, make_storage: StorageFactory) -> None:
+        item = Item(id=1, name="test")
+        storage = make_storage({item.id: item})
+        storage.delete(item.id)
+        assert not storage.has(item.id)
+
+    def test_clear(self, make_storage: StorageFactory) -> None:
+        item1 = Item(id=1, name="test1")
+        item2 = Item(id=1, name="test2")
+
+        storage = make_storage(
+            {
+                item1.id: item1,
+                item2.id: item2,
+            }
+        )
+
+        storage.clear()
+
+        assert len(storage.all()) == 0
+
+    def test_versions(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({1: Item(id=1, name="test1")})
+        versioned = storage.get_versioned(1)
+        assert versioned is not None
+        item, version = versioned
+        assert item == Item(id=1, name="test1")
+        assert storage.catalog_version() >= version
+
+        storage.set(2, Item(id=2, name="test2"))
+        versioned = storage.get_versioned(1)
+        assert versioned is not None and versioned[1] == version
+        versions = [storage.catalog_version()]
+
+        storage.set(1, Item(id=1, name="updated"))
+        versioned = storage.get_versioned(1)
+        assert versioned is not None and versioned[1] > version
+        versions.append(storage.catalog_version())
+        storage.delete(2)
+        versions.append(storage.catalog_version())
+        storage.clear()
+        versions.append(storage.catalog_version())
+        assert versions == sorted(set(versions))
+        assert storage.get_versioned(1) is None
+
+    def test_changes(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({1: Item(id=1, name="test1")})
+        since = storage.catalog_version()
+        assert storage.changes(since) == []
+
+        storage.set_many({2: Item(id=2, name="test2"), 3: Item(id=3, name="test3")})
+        storage.delete(1)
+        storage.clear()
+
+        changes = storage.changes(since)
+        assert changes == [
+            ItemChange(
+                version=since + 1, op="set", id=2, item=Item(id=2, name="test2")
+            ),
+            ItemChange(
+                version=since + 2, op="set", id=3, item=Item(id=3, name="test3")
+            ),
+            ItemChange(version=since + 3, op="delete", id=1),
+            ItemChange(version=since + 4, op="clear"),
+        ]
+        assert storage.changes(since + 1, 2) == changes[1:3]
+        assert storage.changes(storage.catalog_version()) == []
+        assert storage.changes(storage.catalog_version() + 1) is None
+
+    def test_compare_and_set(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({})
+        created = storage.compare_and_set(1, Item(id=1, name="test1"), None)
+        assert created is not None
+        assert storage.compare_and_set(1, Item(id=1, name="test2"), None) is None
+
+        updated = storage.compare_and_set(1, Item(id=1, name="test3"), created)
+        assert updated is not None and updated > created
+        assert storage.compare_and_set(1, Item(id=1, name="test4"), created) is None
+        assert storage.get_versioned(1) == (Item(id=1, name="test3"), updated)
+
+    def test_compare_and_delete(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({1: Item(id=1, name="test1")})
+        versioned = storage.get_versioned(1)
+        assert versioned is not None
+        _, version = versioned
+
+        assert not storage.compare_and_delete(1, version + 1)
+        assert storage.has(1)
+        assert storage.compare_and_delete(1, version)
+        assert not storage.has(1)
+        assert not storage.compare_and_delete(1, version)
+
+    def test_delete_if_does_not_exist(self, make_storage: StorageFactory) -> None:
+        storage = make_storage({})
+        with pytest.raises(KeyError):
+            storage.delete(999)
+
+    def test_delete_many_if_does_not_exist(self, make_storage: StorageFactory) -> None:
+        item = Item(id=1, name="test")
+        storage = make_storage({item.id: item})
+        with pytest.raises(KeyError):
+            storage.delete_many([item.id, 999])
+
+
+class TestSQLiteStorage:
+    def test_persistence(self, tmp_path: Path) -> None:
+        item = Item(id=1, name="test")
+        path = str(tmp_path / "catalog.db")
+
+        storage = SQLiteStorage(path)
+        storage.set(item.id, item)
+        storage.close()
+
+        storage = SQLiteStorage(path)
+        assert storage.get(item.id) == item
+        storage.close()
+
+    def test_versions_persist(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "catalog.db")
+        storage = SQLiteStorage(path)
+        storage.set(1, Item(id=1, name="test"))
+        versioned = storage.get_versioned(1)
+        catalog_version = storage.catalog_version()
+        storage.close()
+
+        storage = SQLiteStorage(path)
+        assert storage.get_versioned(1) == versioned
+        assert storage.catalog_version() == catalog_version
+        storage.close()
+
+    def test_changes_are_trimmed(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "catalog.db")
+        storage = SQLiteStorage(path, change_buffer_size=2)
+        for id in range(5):
+            storage.set(id, Item(id=id, name=f"test{id}"))
+        assert storage.changes(2) is None
+        changes = storage.changes(3)
+        storage.close()
+
+        storage = SQLiteStorage(path, change_buffer_size=2)
+        assert storage.changes(3) == changes
+        assert [change.id for change in changes or []] == [3, 4]
+        storage.close()
+
+    def test_delete_many_is_atomic(self, tmp_path: Path) -> None:
+        item = Item(id=1, name="test")
+        storage = create_sqlite_storage(tmp_path / "catalog.db", {item.id: item})
+        with pytest.raises(KeyError):
+            storage.delete_many([item.id, 999])
+        assert storage.has(item.id)
+        storage.close()
+
+
+class TestColumnarMemoryStorage:
+    def test_matches_memory_storage(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Random changes grow the key index, share and compact the names
+        monkeypatch.setattr(columnar, "ARENA_SLACK", 64)
+        generator = random.Random(0)
+        storage = ColumnarMemoryStorage()
+        expected = MemoryStorage()
+        for _ in range(3000):
+            key = generator.randrange(-500, 500)
+            if expected.has(key) and generator.random() < 0.4:
+                storage.delete(key)
+                expected.delete(key)
+            else:
+                item = Item(id=key, name=f"name{generator.randrange(50)}")
+                storage.set(key, item)
+                expected.set(key, item)
+        storage.set_many({key: Item(id=key, name="bulk") for key in range(490, 600)})
+        expected.set_many({key: Item(id=key, name="bulk") for key in range(490, 600)})
+
+        assert storage.all() == expected.page()
+        assert storage.all_encoded() == expected.all_encoded()
+        assert [storage.get_versioned(key) for key in range(-500, 600)] == [
+            expected.get_versioned(key) for key in range(-500, 600)
+        ]
+        assert storage.find_by_name_prefix("name1") == expected.find_by_name_prefix(
+            "name1"
+        )
+        assert len(storage.arena) <= 2 * storage.name_bytes + columnar.ARENA_SLACK
+
+    def test_bulk_writes_match_memory_storage(self) -> None:
+        # Batches larger than MERGE_SIZE add and rename rows in one merge
+        generator = random.Random(1)
+        storage = ColumnarMemoryStorage()
+        expected = MemoryStorage()
+        for _ in range(5):
+            batch = {
+                key: Item(id=key, name=f"name{generator.randrange(50)}")
+                for key in generator.sample(range(-3000, 3000), 2000)
+            }
+            storage.set_many(batch)
+            expected.set_many(batch)
+            assert list(storage.name_rows) == sorted(
+                storage.name_rows, key=storage._name_key
+            )
+
+        assert storage.all() == expected.page()
+        assert storage.find_by_name_prefix("name1") == expected.find_by_name_prefix(
+            "name1"
+        )
+        assert storage.changes(0) == expected.changes(0)
+        assert len(storage.arena) < 500
+
+    def test_names_are_shared(self) -> None:
+        storage = ColumnarMemoryStorage({1: Item(id=1, name="same")})
+        storage.set(2, Item(id=2, name="same"))
+        storage.set(3, Item(id=3, name="other"))
+        assert bytes(storage.arena) == b"sameother"
+
+
+class TestReplicaStorage:
+    def test_follows_primary_versions(self) -> None:
+        primary = MemoryStorage({id: Item(id=id, name=f"test{id}") for id in (1, 2)})
+        version = primary.catalog_version()
+        primary.set(3, Item(id=3, name="test3"))
+        primary.delete(1)
+        primary.set(2, Item(id=2, name="updated"))
+
+        # Items read after the version already have some of the changes
+        replica = ReplicaStorage()
+        replica.load(primary.page_versioned(), version)
+        assert replica.catalog_version() == version
+        changes = primary.changes(version)
+        assert changes is not None
+        replica.apply(changes)
+
+        assert replica.page_versioned() == primary.page_versioned()
+        assert replica.catalog_version() == primary.catalog_version()
+        assert replica.changes(version) == changes
+        assert replica.find_by_name("updated") == [Item(id=2, name="updated")]
+
+        primary.clear()
+        replica.apply(primary.changes(replica.catalog_version()) or [])
+        assert replica.all() == []
+        assert replica.catalog_version() == primary.catalog_version()
+
+    def test_load_resets_changes(self) -> None:
+        replica = ReplicaStorage()
+        replica.apply(
+            [ItemChange(version=1, op="set", id=1, item=Item(id=1, name="a"))]
+        )
+        replica.load([(Item(id=2, name="b"), 7)], 9)
+        assert replica.changes(1) is None
+        assert replica.changes(9) == []
+        assert replica.get_versioned(2) == (Item(id=2, name="b"), 7)
+
+
+class TestLMDBStorage:
+    @pytest.fixture(autouse=True)
+    def require_lmdb(self) -> None:
+        pytest.importorskip("lmdb")
+
+    def test_persistence(self, tmp_path: Path) -> None:
+        storage = LMDBStorage(tmp_path)
+        storage.set(1, Item(id=1, name="test"))
+        versioned = storage.get_versioned(1)
+        changes = storage.changes(0)
+        storage.close()
+
+        storage = LMDBStorage(tmp_path)
+        assert storage.get_versioned(1) == versioned
+        assert storage.changes(0) == changes
+        assert storage.find_by_name("test") == [Item(id=1, name="test")]
+        storage.close()
+
+    def test_changes_are_trimmed(self, tmp_path: Path) -> None:
+        storage = LMDBStorage(tmp_path, change_buffer_size=2)
+        for id in range(5):
+            storage.set(id, Item(id=id, name=f"test{id}"))
+        assert storage.changes(2) is None
+        assert [change.id for change in storage.changes(3) or []] == [3, 4]
+        storage.close()
+
+    def test_long_names(self, tmp_path: Path) -> None:
+        # Names longer than an index key share a cut key, their items are
+        # compared by their full names
+        long = "x" * 1000
+        items = [
+            Item(id=1, name=long + "b"),
+            Item(id=2, name=long + "a"),
+            Item(id=3, name=long),
+            Item(id=4, name=long + "a"),
+            Item(id=5, name="x\x00"),
+            Item(id=6, name="x"),
+        ]
+        storage = LMDBStorage(tmp_path)
+        storage.set_many({item.id: item for item in items})
+
+        def find(
+            prefix: str,
+            limit: int | None = None,
+            after: tuple[str, int] | None = None,
+        ) -> list[int]:
+            items = storage.find_by_name_prefix(prefix, limit, after)
+            return [item.id for item in items]
+
+        assert [item.id for item in storage.find_by_name(long + "a")] == [2, 4]
+        assert [item.id for item in storage.find_by_name(long + "a", 1, 2)] == [4]
+        assert find("x") == [6, 5, 3, 2, 4, 1]
+        assert find(long + "a") == [2, 4]
+        assert find("x", 2, (long, 3)) == [2, 4]
+        assert find("x", None, (long + "a", 4)) == [1]
+        storage.set(2, Item(id=2, name="renamed"))
+        assert find(long) == [3, 4, 1]
+        storage.close()
+
+    def test_delete_many_is_atomic(self, tmp_path: Path) -> None:
+        item = Item(id=1, name="test")
+        storage = create_lmdb_storage(tmp_path, {item.id: item})
+        with pytest.raises(KeyError):
+            storage.delete_many([item.id, 999])
+        assert storage.has(item.id)
+        assert storage.find_by_name("test") == [item]
+        storage.close()
+
+
+class TestDurableMemoryStorage:
+    def test_recovery_from_log(self, tmp_path: Path) -> None:
+        item1 = Item(id=1, name="test1")
+        item2 = Item(id=2, name="test2")
+        storage = DurableMemoryStorage(tmp_path)
+        storage.set_many({item1.id: item1, item2.id: item2})
+        storage.set(item1.id, Item(id=1, name="updated"))
+        storage.delete(item2.id)
+        storage.close()
+
+        storage = DurableMemoryStorage(tmp_path)
+        assert storage.all() == [Item(id=1, name="updated")]
+        assert storage.find_by_name("updated") == [Item(id=1, name="updated")]
+        storage.close()
+
+    def test_recovery_from_snapshot(self, tmp_path: Path) -> None:
+        storage = DurableMemoryStorage(tmp_path, snapshot_log_size=256)
+        for id in range(20):
+            storage.set(id, Item(id=id, name=f"test{id}"))
+        storage.delete(0)
+        storage.close()
+
+        assert len(list(tmp_path.glob("snapshot-*.bin"))) == 1
+        storage = DurableMemoryStorage(tmp_path)
+        assert storage.page() == [Item(id=id, name=f"test{id}") for id in range(1, 20)]
+        storage.clear()
+        storage.snapshot()
+        storage.close()
+
+        storage = DurableMemoryStorage(tmp_path)
+        assert storage.all() == []
+        assert len(list(tmp_path.glob("snapshot-*.bin"))) == 1
+        storage.close()
+
+    def test_snapshot_in_background(self, tmp_path: Path) -> None:
+        storage = DurableMemoryStorage(tmp_path, snapshot_log_size=256)
+        written = threading.Event()
+        write_snapshot = storage._write_snapshot
+
+        def wait_and_write(
+            generation: int, sequence: int, items: list[tuple[int, int, Item]]
+        ) -> None:
+            written.wait()
+            write_snapshot(generation, sequence, items)
+
+        storage._write_snapshot = wait_and_write  # type: ignore[method-assign]
+        # Writes are committed while the snapshot waits
+        for id in range(20):
+            storage.set(id, Item(id=id, name=f"test{id}"))
+        assert storage.get(19) == Item(id=19, name="test19")
+        assert not list(tmp_path.glob("snapshot-*.bin"))
+        written.set()
+        storage.close()
+        assert len(list(tmp_path.glob("snapshot-*.bin"))) == 1
+
+    def test_changes_are_read_once_synced(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        storage = DurableMemoryStorage(tmp_path)
+        storage.set(1, Item(id=1, name="test1"))
+        catalog_version = storage.catalog_version()
+        syncing = threading.Event()
+        synced = threading.Event()
+        fsync = os.fsync
+
+        def wait_and_fsync(descriptor: int) -> None:
+            syncing.set()
+            synced.wait()
+            fsync(descriptor)
+
+        monkeypatch.setattr(os, "fsync", wait_and_fsync)
+        writer = threading.Thread(
+            target=storage.set, args=(1, Item(id=1, name="updated"))
+        )
+        writer.start()
+        try:
+            assert syncing.wait(5)
+            assert storage.get(1) == Item(id=1, name="test1")
+            assert storage.catalog_version() == catalog_version
+            assert storage.changes(catalog_version) == []
+        finally:
+            synced.set()
+            writer.join()
+        assert storage.get_versioned(1) == (
+            Item(id=1, name="updated"),
+            catalog_version + 1,
+        )
+        storage.close()
+
+    def test_failed_sync(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        storage = DurableMemoryStorage(tmp_path)
+        storage.set(1, Item(id=1, name="test1"))
+        catalog_version = storage.catalog_version()
+
+        def fail(descriptor: int) -> None:
+            raise OSError("fsync failed")
+
+        monkeypatch.setattr(os, "fsync", fail)
+        with pytest.raises(OSError, match="fsync failed"):
+            storage.set(1, Item(id=1, name="updated"))
+        monkeypatch.undo()
+        # The change is never read, and no change is accepted after it
+        with pytest.raises(OSError, match="reopen"):
+            storage.set(2, Item(id=2, name="test2"))
+        with pytest.raises(OSError, match="reopen"):
+            storage.snapshot()
+        assert storage.get(1) == Item(id=1, name="test1")
+        assert storage.get(2) is None
+        assert storage.catalog_version() == catalog_version
+        assert storage.changes(catalog_version) == []
+        storage.close()
+
+    def test_versions_survive_recovery(self, tmp_path: Path) -> None:
+        storage = DurableMemoryStorage(tmp_path, snapshot_log_size=256)
+        for id in range(20):
+            storage.set(id, Item(id=id, name=f"test{id}"))
+        storage.delete(0)
+        versions = {id: storage.get_versioned(id) for id in range(20)}
+        catalog_version = storage.catalog_version()
+        storage.close()
+
+        # Restored from the snapshot and the log written after it
+        assert list(tmp_path.glob("snapshot-*.bin"))
+        storage = DurableMemoryStorage(tmp_path)
+        assert {id: storage.get_versioned(id) for id in range(20)} == versions
+        assert storage.catalog_version() == catalog_version
+        storage.close()
+
+    def test_changes_survive_recovery(self, tmp_path: Path) -> None:
+        storage = DurableMemoryStorage(tmp_path)
+        storage.set(1, Item(id=1, name="test1"))
+        storage.snapshot()
+        storage.set(2, Item(id=2, name="test2"))
+        storage.delete(1)
+        storage.close()
+
+        # Changes in the log after the snapshot are replayed, older changes
+        # are not kept
+        storage = DurableMemoryStorage(tmp_path)
+        assert storage.changes(1) == [
+            ItemChange(version=2, op="set", id=2, item=Item(id=2, name="test2")),
+            ItemChange(version=3, op="delete", id=1),
+        ]
+        assert storage.changes(0) is None
+        storage.close()
+
+    def test_directory_is_locked(self, tmp_path: Path) -> None:
+        storage = DurableMemoryStorage(tmp_path)
+        with pytest.raises(RuntimeError, match="used by another process"):
+            DurableMemoryStorage(tmp_path)
+        storage.close()
+
+        storage = DurableMemoryStorage(tmp_path)
+        storage.close()
+
+    def test_torn_record_is_ignored(self, tmp_path: Path) -> None:
+        item = Item(id=1, name="test")
+        storage = DurableMemoryStorage(tmp_path)
+        storage.set(item.id, item)
+        storage.set(2, Item(id=2, name="torn"))
+        storage.close()
+
+        (log,) = tmp_path.glob("log-*.bin")
+        log.write_bytes(log.read_bytes()[:-1])
+
+        storage = DurableMemoryStorage(tmp_path)
+        assert storage.all() == [item]
+        storage.set(3, Item(id=3, name="test3"))
+        storage.close()
+
+        storage = DurableMemoryStorage(tmp_path)
+        assert storage.has_many([1, 2, 3]) == {1, 3}
+        storage.close()
+
+    def test_reads_during_writes(self, tmp_path: Path) -> None:
+        storage = DurableMemoryStorage(tmp_path, fsync=False)
+        keys = list(range(1000))
+        done = threading.Event()
+        errors: list[Exception] = []
+
+        def write() -> None:
+            for _ in range(20):
+                storage.set_many({key: Item(id=key, name=str(key)) for key in keys})
+                storage.discard_many(keys)
+            done.set()
+
+        def read() -> None:
+            try:
+                while not done.is_set():
+                    storage.page_versioned()
+                    storage.get_many(keys)
+                    storage.has_many(keys)
+                    storage.find_by_name_prefix("1")
+            except Exception as error:
+                errors.append(error)
+
+        # Threads switch often, so reads interleave with the writes
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=write), threading.Thread(target=read)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert errors == []
+        storage.close()
+
+    def test_concurrent_writes(self, tmp_path: Path) -> None:
+        storage = DurableMemoryStorage(tmp_path, snapshot_log_size=4096)
+
+        def write(start: int) -> None:
+            for id in range(start, start + 100):
+                storage.set(id, Item(id=id, name=f"test{id}"))
+
+        threads = [
+            threading.Thread(target=write, args=(start,))
+            for start in range(0, 400, 100)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        storage.close()
+
+        storage = DurableMemoryStorage(tmp_path)
+        assert [item.id for item in storage.page()] == list(range(400))
+        storage.close()
+
+
+@pytest.mark.parametrize(
+    "create_storage",
+    [create_durable_storage, create_sqlite_storage, create_lmdb_storage],
+)
+def test_concurrent_compare_and_set(
+    tmp_path: Path, create_storage: Callable[[Path, dict[int, Item]], Storage]
+) -> None:
+    storage = create_storage(tmp_path / "data", {1: Item(id=1, name="0")})
+
+    def increment() -> None:
+        # Read-modify-write retried until no other writer changed the item
+        for _ in range(50):
+            while True:
+                versioned = storage.get_versioned(1)
+                assert versioned is not None
+                item, version = versioned
+                value = Item(id=1, name=str(int(item.name) + 1))
+                if storage.compare_and_set(1, value, version) is not None:
+                    break
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert storage.get(1) == Item(id=1, name="200")
+    storage.close()
+
+
+@pytest.mark.parametrize(
+    "create_storage",
+    [create_durable_storage, create_sqlite_storage, create_lmdb_storage],
+)
+def test_concurrent_create_and_discard(
+    tmp_path: Path, create_storage: Callable[[Path, dict[int, Item]], Storage]
+) -> None:
+    storage = create_storage(tmp_path / "data", {})
+    keys = list(range(100))
+    created: dict[str, set[int]] = {}
+    deleted: list[set[int]] = []
+
+    def create(name: str) -> None:
+        created[name] = storage.create_many(
+            {key: Item(id=key, name=name) for key in keys}
+        )
+
+    def discard() -> None:
+        deleted.append(storage.discard_many(keys))
+
+    threads = [threading.Thread(target=create, args=(str(i),)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Every key is created by one writer, whose item is kept
+    assert sorted(key for keys in created.values() for key in keys) == keys
+    for item in storage.page():
+        assert item.id in created[item.name]
+
+    threads = [threading.Thread(target=discard) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Every key is deleted by one writer, the others do not fail
+    assert sorted(key for keys in deleted for key in keys) == keys
+    assert storage.page() == []
+    storage.close()
+
+
+class TestAsyncStorageAdapter:
+    def test_operations(self, make_storage: StorageFactory) -> None:
+        item1 = Item(id=1, name="test1")
+        item2 = Item(id=2, name="test2")
+        item3 = Item(id=3, name="test3")
+        adapter = AsyncStorageAdapter(
+            make_storage({item1.id: item1, item2.id: item2}), batch_size=1
+        )
+
+        async def run() -> None:
+            assert await adapter.has(item1.id)
+            assert await adapter.has_many([item2.id, item3.id]) == {item2.id}
+            await adapter.set(item3.id, item3)
+            assert await adapter.get(item3.id) == item3
+            assert await adapter.page(1, item1.id) == [item2]
+            assert [item async for item in adapter.all()] == [item1, item2, item3]
+            await adapter.delete_many([item1.id, item2.id])
+            assert [item async for item in adapter.all()] == [item3]
+            with pytest.raises(KeyError):
+                await adapter.delete(item1.id)
+
+        asyncio.run(run())
+
+    def test_blocking_storage_runs_in_thread_pool(self, tmp_path: Path) -> None:
+        storage = SQLiteStorage(str(tmp_path / "catalog.db"))
+        adapter = AsyncStorageAdapter(storage, max_workers=2)
+        threads: set[str] = set()
+        has = storage.has
+
+        def record_thread(key: int) -> bool:
+            threads.add(threading.current_thread().name)
+            return has(key)
+
+        storage.has = record_thread  # type: ignore[method-assign]
+
+        async def run() -> None:
+            await asyncio.gather(*(adapter.has(key) for key in range(10)))
+            await adapter.close()
+
+        asyncio.run(run())
+        assert threads
+        assert all(name.startswith("storage") for name in threads)
+        assert len(threads) <= 2
+
+    def test_non_blocking_storage_runs_inline(self) -> None:
+        adapter = AsyncStorageAdapter(MemoryStorage())
+        assert adapter.executor is None
+
+    def test_non_blocking_reads_run_inline(self, tmp_path: Path) -> None:
+        storage = DurableMemoryStorage(tmp_path, fsync=False)
+        adapter = AsyncStorageAdapter(storage, max_workers=2)
+        threads: dict[str, str] = {}
+        get, set = storage.get, storage.set
+
+        def record_get(key: int) -> Item | None:
+            threads["get"] = threading.current_thread().name
+            return get(key)
+
+        def record_set(key: int, value: Item) -> None:
+            threads["set"] = threading.current_thread().name
+            set(key, value)
+
+        storage.get = record_get  # type: ignore[method-assign]
+        storage.set = record_set  # type: ignore[method-assign]
+
+        async def run() -> None:
+            await adapter.set(1, Item(id=1, name="test1"))
+            assert await adapter.get(1) == Item(id=1, name="test1")
+            await adapter.close()
+
+        asyncio.run(run())
+        assert threads["get"] == threading.current_thread().name
+        assert threads["set"].startswith("storage")
+
+
+class SlowMemoryStorage(MemoryStorage):
+    """Memory storage whose reads of items wait, in the thread pool"""
+
+    blocking = True
+
+    def __init__(self, initial: dict[int, Item]) -> None:
+        super().__init__(initial)
+        self.reads = 0
+
+    def get_encoded(self, key: int) -> tuple[bytes, int] | None:
+        self.reads += 1
+        time.sleep(0.05)
+        return super().get_encoded(key)
+
+
+class TestSingleFlightStorage:
+    def test_concurrent_reads_are_shared(self) -> None:
+        storage = SlowMemoryStorage({1: Item(id=1, name="test1")})
+        single_flight = SingleFlightStorage(AsyncStorageAdapter(storage))
+
+        async def run() -> list[tuple[bytes, int] | None]:
+            return await asyncio.gather(
+                *(single_flight.get_encoded(key) for key in [1, 1, 1, 2, 2])
+            )
+
+        results = asyncio.run(run())
+        assert results == [(b'{"id":1,"name":"test1"}', 1)] * 3 + [None] * 2
+        assert storage.reads == 2
+
+    def test_reads_after_write_are_not_shared(self) -> None:
+        storage = SlowMemoryStorage({1: Item(id=1, name="test1")})
+        single_flight = SingleFlightStorage(AsyncStorageAdapter(storage))
+
+        async def run() -> None:
+            before = asyncio.ensure_future(single_flight.get_encoded(1))
+            await asyncio.sleep(0.01)
+            await single_flight.set(1, Item(id=1, name="updated"))
+            after = await single_flight.get_encoded(1)
+            assert after == (b'{"id":1,"name":"updated"}', 2)
+            await before
+
+        asyncio.run(run())
+        assert storage.reads == 2
+
+    def test_cancelled_reader_does_not_cancel_others(self) -> None:
+        storage = SlowMemoryStorage({1: Item(id=1, name="test1")})
+        single_flight = SingleFlightStorage(AsyncStorageAdapter(storage))
+
+        async def run() -> None:
+            first = asyncio.ensure_future(single_flight.get_encoded(1))
+            second = asyncio.ensure_future(single_flight.get_encoded(1))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            assert await second == (b'{"id":1,"name":"test1"}', 1)
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+        asyncio.run(run())
+        assert storage.reads == 1
+
+    def test_errors_are_shared(self) -> None:
+        storage = SlowMemoryStorage({})
+        single_flight = SingleFlightStorage(AsyncStorageAdapter(storage))
+
+        def fail(key: int) -> tuple[bytes, int] | None:
+            storage.reads += 1
+            time.sleep(0.05)
+            raise RuntimeError("closed")
+
+        storage.get_encoded = fail  # type: ignore[method-assign]
+
+        async def run() -> tuple[object, ...]:
+            return await asyncio.gather(
+                single_flight.get_encoded(1),
+                single_flight.get_encoded(1),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert storage.reads == 1
+
+
+def test_create_storage(tmp_path: Path) -> None:
+    assert type(create_storage(Settings())) is MemoryStorage
+
+    storage = create_storage(Settings(memory_data_dir=str(tmp_path / "data")))
+    assert isinstance(storage, DurableMemoryStorage)
+    storage.close()
+
+    settings = Settings(
+        storage_backend="sqlite", sqlite_path=str(tmp_path / "catalog.db")
+    )
+    storage = create_storage(settings)
+    assert isinstance(storage, SQLiteStorage)
+    storage.close()
+
+    storage = create_storage(Settings(storage_backend="columnar"))
+    assert isinstance(storage, ColumnarMemoryStorage)
+
+    storage = create_storage(Settings(replication_primary="http://primary"))
+    assert isinstance(storage, ReplicaStorage)
+
+
+def test_workers_require_shared_storage(tmp_path: Path) -> None:
+    with pytest.raises(ValidationError, match="sqlite"):
+        Settings(web_concurrency=2)
+    with pytest.raises(ValidationError, match="sqlite"):
+        Settings(web_concurrency=2, memory_data_dir=str(tmp_path))
+    with pytest.raises(ValidationError, match="sqlite"):
+        Settings(web_concurrency=2, storage_backend="columnar")
+    Settings(web_concurrency=2, storage_backend="sqlite")
+    Settings(web_concurrency=2, storage_backend="lmdb")
+
+
+def test_follower_keeps_copy_in_memory(tmp_path: Path) -> None:
+    with pytest.raises(ValidationError, match="in memory"):
+        Settings(replication_primary="http://primary", storage_backend="sqlite")
+    with pytest.raises(ValidationError, match="in memory"):
+        Settings(replication_primary="http://primary", memory_data_dir=str(tmp_path))
+    with pytest.raises(ValidationError, match="cluster"):
+        Settings(
+            replication_primary="http://primary",
+            cluster_nodes=["http://node"],
+            cluster_node="http://node",
+        )
@@ -0,0 +1,94 @@
+"""Write throughput and startup time of the durable memory storage.
+
+Run from the server directory:
+
+    poetry run python -m benchmarks.bench_durable_memory --items 1000000
+"""
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from app.models import Item
+from app.storage import DurableMemoryStorage
+
+
+def write(storage: DurableMemoryStorage, ids: range) -> None:
+    for id in ids:
+        storage.set(id, Item(id=id, name=f"item{id}"))
+
+
+def bench_writes(path: Path, writes: int, threads: int, fsync: bool) -> float:
+    """Return the committed writes per second"""
+    storage = DurableMemoryStorage(path, fsync=fsync)
+    per_thread = writes // threads
+    workers = [
+        threading.Thread(
+            target=write,
+            args=(storage, range(i * per_thread, (i + 1) * per_thread)),
+        )
+        for i in range(threads)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    storage.close()
+    return per_thread * threads / elapsed
+
+
+def bench_startup(path: Path, items: int, tail: int) -> tuple[float, float]:
+    """Return the seconds to write a snapshot of `items` items and to start
+    from it with `tail` writes in the log
+    """
+    storage = DurableMemoryStorage(path)
+    storage.set_many({id: Item(id=id, name=f"item{id}") for id in range(items)})
+    start = time.perf_counter()
+    storage.snapshot()
+    snapshot = time.perf_counter() - start
+    write(storage, range(items, items + tail))
+    storage.close()
+
+    start = time.perf_counter()
+    storage = DurableMemoryStorage(path)
+    startup = time.perf_counter() - start
+    assert len(storage.kvs) == items + tail
+    storage.close()
+    return snapshot, startup
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="bench_durable_memory.py")
+    parser.add_argument(
+        "--items", help="Items in the snapshot", type=int, default=100000
+    )
+    parser.add_argument(
+        "--tail", help="Writes in the log after the snapshot", type=int, default=10000
+    )
+    parser.add_argument(
+        "--writes", help="Writes per throughput run", type=int, default=2000
+    )
+    parser.add_argument(
+        "--threads", help="Concurrent writers", type=int, nargs="+", default=[1, 8, 32]
+    )
+    parser.add_argument("--dir", help="Directory on the disk to measure", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        root = Path(directory)
+        for fsync in (True, False):
+            for threads in args.threads:
+                path = root / f"writes-{fsync}-{threads}"
+                rate = bench_writes(path, args.writes, threads, fsync)
+                print(f"writes fsync={fsync} threads={threads}: {rate:,.0f}/s")
+
+        snapshot, startup = bench_startup(root / "startup", args.items, args.tail)
+        print(f"snapshot of {args.items:,} items: {snapshot:.2f}s")
+        print(f"startup with {args.tail:,} log records: {startup:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
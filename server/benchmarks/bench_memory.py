@@ -0,0 +1,82 @@
+"""Resident memory of the in-memory storages.
+
+The dictionary of item objects of the memory storage is compared with the
+columns of the columnar storage. Every storage is filled in a new process,
+in batches of items created on the fly, and the growth of the resident set
+size of the process is reported per million items. The change buffer is
+disabled, it holds a fixed number of items. The resident set size is read
+from /proc, on Linux.
+
+Run from the server directory:
+
+    poetry run python -m benchmarks.bench_memory --items 1000000
+"""
+import argparse
+import gc
+import multiprocessing
+import os
+import time
+
+from app.models import Item
+from app.storage import ColumnarMemoryStorage, MemoryStorage, Storage
+
+
+def resident() -> int:
+    """Return the resident set size of the process in bytes"""
+    with open("/proc/self/statm") as statm:
+        pages = int(statm.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def fill(backend: str, items: int, batch: int, names: int) -> tuple[int, float]:
+    """Return the growth of the resident memory after adding `items` items
+    with `names` distinct names, or unique names if 0, and the seconds spent
+    """
+    gc.collect()
+    before = resident()
+    start = time.perf_counter()
+    storage: Storage
+    if backend == "columnar":
+        storage = ColumnarMemoryStorage(change_buffer_size=0)
+    else:
+        storage = MemoryStorage(change_buffer_size=0)
+    for first in range(0, items, batch):
+        storage.set_many(
+            {
+                id: Item(id=id, name=f"item {id % names if names else id}")
+                for id in range(first, min(first + batch, items))
+            }
+        )
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    return resident() - before, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="bench_memory.py")
+    parser.add_argument(
+        "--items", help="Items in the catalog", type=int, nargs="+", default=[1000000]
+    )
+    parser.add_argument(
+        "--names", help="Distinct names, 0 for unique names", type=int, default=0
+    )
+    parser.add_argument("--batch", help="Items per set_many", type=int, default=100000)
+    args = parser.parse_args()
+
+    # Every storage is measured in a new interpreter
+    context = multiprocessing.get_context("spawn")
+    for count in args.items:
+        for backend in ["memory", "columnar"]:
+            with context.Pool(1) as pool:
+                growth, elapsed = pool.apply(
+                    fill, (backend, count, args.batch, args.names)
+                )
+            print(
+                f"{count:>10,} items, {backend:<8}: {growth / 2**20:8.1f} MiB, "
+                f"{growth / count * 1e6 / 2**20:8.1f} MiB per million items, "
+                f"{growth / count:6.1f} bytes per item, filled in {elapsed:.1f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
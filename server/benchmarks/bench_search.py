@@ -0,0 +1,94 @@
+"""Query latency of the full-text search index.
+
+Items are named with words drawn from a Zipf-like distribution, so queries
+cover rare, common and very frequent words. The index is compared with a
+linear scan of all items, which is what a search without an index costs.
+
+Run from the server directory:
+
+    poetry run python -m benchmarks.bench_search --items 1000000
+"""
+import argparse
+import itertools
+import random
+import statistics
+import time
+
+from app.models import Item
+from app.search import SearchIndex, item_tokens, tokenize
+
+
+def make_items(count: int, vocabulary: int, seed: int) -> dict[int, Item]:
+    generator = random.Random(seed)
+    words = [f"w{rank}" for rank in range(vocabulary)]
+    weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(vocabulary)))
+    return {
+        id: Item(
+            id=id,
+            name=" ".join(
+                generator.choices(words, cum_weights=weights, k=generator.randint(3, 8))
+            ),
+        )
+        for id in range(count)
+    }
+
+
+def linear_scan(items: dict[int, Item], query: str, limit: int) -> list[int]:
+    """Match items by scanning all of them, without ranking"""
+    terms = set(tokenize(query))
+    matches = [key for key, item in items.items() if terms & set(item_tokens(item))]
+    return matches[:limit]
+
+
+def measure(index: SearchIndex, query: str, limit: int, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        index.search(query, limit)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="bench_search.py")
+    parser.add_argument("--items", help="Indexed items", type=int, default=1000000)
+    parser.add_argument("--vocabulary", help="Distinct words", type=int, default=50000)
+    parser.add_argument("--limit", help="Results per query", type=int, default=10)
+    parser.add_argument("--repeat", help="Runs per query", type=int, default=20)
+    parser.add_argument("--seed", help="Random seed", type=int, default=0)
+    args = parser.parse_args()
+
+    items = make_items(args.items, args.vocabulary, args.seed)
+
+    index = SearchIndex()
+    start = time.perf_counter()
+    index.add_many(items)
+    print(f"index of {args.items:,} items built in {time.perf_counter() - start:.1f}s")
+
+    queries = [
+        f"w{args.vocabulary - 1}",
+        "w5000",
+        "w500",
+        "w50",
+        "w5",
+        "w0",
+        "w500 w5000",
+        "w5 w50 w500",
+    ]
+    for query in queries:
+        matches = sum(len(index.postings.get(term, {})) for term in tokenize(query))
+        timings = measure(index, query, args.limit, args.repeat)
+        median = statistics.median(timings) * 1000
+        worst = max(timings) * 1000
+        print(
+            f"query {query!r:>16} postings {matches:>9,}: "
+            f"median {median:8.2f}ms, max {worst:8.2f}ms"
+        )
+
+    start = time.perf_counter()
+    linear_scan(items, queries[0], args.limit)
+    print(f"linear scan: {(time.perf_counter() - start) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Read throughput of the storage backends.
+
+Random items are read by key, as the JSON sent in responses and as items,
+and pages of items are read in key order. The dictionary of the memory
+storage is compared with the backends kept in a file, SQLite and LMDB.
+With `--processes`, the file backends are read by several processes at
+once, as uvicorn workers do, each with its own connection to the shared
+file; the memory storage would need a copy of the catalog per process.
+
+The lmdb backend requires the lmdb package.
+
+Run from the server directory:
+
+    poetry run python -m benchmarks.bench_storage_reads --items 1000000
+"""
+from typing import Callable
+
+import argparse
+import multiprocessing
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from app.models import Item
+from app.storage import LMDBStorage, MemoryStorage, SQLiteStorage, Storage
+
+PAGE_SIZE = 100
+
+
+def open_storage(backend: str, path: Path) -> Storage:
+    if backend == "sqlite":
+        return SQLiteStorage(str(path / "catalog.db"))
+    if backend == "lmdb":
+        return LMDBStorage(path / "lmdb", sync=False)
+    return MemoryStorage()
+
+
+def measure(
+    storage: Storage, operation: str, items: int, duration: float, seed: int
+) -> float:
+    """Return the operations per second of `operation` on random keys"""
+    generator = random.Random(seed)
+    read: Callable[[int], object] = {
+        "get_encoded": storage.get_encoded,
+        "get": storage.get,
+        "page": lambda key: storage.page(PAGE_SIZE, key),
+    }[operation]
+    operations = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < duration:
+        for _ in range(1000):
+            read(generator.randrange(items))
+        operations += 1000
+    return operations / elapsed
+
+
+def read_process(
+    backend: str, path: Path, operation: str, items: int, duration: float, seed: int
+) -> float:
+    storage = open_storage(backend, path)
+    rate = measure(storage, operation, items, duration, seed)
+    storage.close()
+    return rate
+
+
+def measure_processes(
+    backend: str,
+    path: Path,
+    operation: str,
+    items: int,
+    duration: float,
+    processes: int,
+) -> float:
+    """Return the operations per second of `processes` reading processes"""
+    # Processes are spawned, an LMDB environment is not used across a fork
+    context = multiprocessing.get_context("spawn")
+    arguments = [
+        (backend, path, operation, items, duration, seed) for seed in range(processes)
+    ]
+    with context.Pool(processes) as pool:
+        return sum(pool.starmap(read_process, arguments))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="bench_storage_reads.py")
+    parser.add_argument(
+        "--items", help="Items in the catalog", type=int, default=100000
+    )
+    parser.add_argument(
+        "--backends",
+        help="Storage backends",
+        nargs="+",
+        choices=["memory", "sqlite", "lmdb"],
+        default=["memory", "sqlite", "lmdb"],
+    )
+    parser.add_argument(
+        "--processes", help="Reading processes", type=int, nargs="+", default=[1]
+    )
+    parser.add_argument("--duration", help="Seconds per run", type=float, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in args.backends:
+            path = Path(directory) / backend
+            path.mkdir()
+            storage = open_storage(backend, path)
+            start = time.perf_counter()
+            storage.set_many(
+                {id: Item(id=id, name=f"item{id}") for id in range(args.items)}
+            )
+            print(
+                f"{backend}: {args.items:,} items written in "
+                f"{time.perf_counter() - start:.1f}s"
+            )
+            for operation in ["get_encoded", "get", "page"]:
+                for processes in args.processes:
+                    if processes == 1:
+                        rate = measure(storage, operation, args.items, args.duration, 0)
+                    elif backend == "memory":
+                        continue
+                    else:
+                        rate = measure_processes(
+                            backend,
+                            path,
+                            operation,
+                            args.items,
+                            args.duration,
+                            processes,
+                        )
+                    print(
+                        f"{backend:>6} {operation:<11} {processes:>2} processes: "
+                        f"{rate:12,.0f} reads/s"
+                    )
+            storage.close()
+
+
+if __name__ == "__main__":
+    main()